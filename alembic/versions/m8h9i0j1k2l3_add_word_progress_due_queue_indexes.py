@@ -0,0 +1,59 @@
+"""add_word_progress_due_queue_indexes
+
+Revision ID: m8h9i0j1k2l3
+Revises: l7g8h9i0j1k2
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'm8h9i0j1k2l3'
+down_revision: Union[str, None] = 'l7g8h9i0j1k2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Practice due queues: user_id = ? AND pool IN (...) AND next_available_time <= now
+    op.create_index(
+        'ix_word_progress_user_pool_next',
+        'word_progress',
+        ['user_id', 'pool', 'next_available_time'],
+        unique=False,
+        postgresql_include=['is_in_review_phase'],
+    )
+    # Review due queue: only rows in review phase, ordered by next_available_time
+    op.create_index(
+        'ix_word_progress_review_due',
+        'word_progress',
+        ['user_id', 'next_available_time'],
+        unique=False,
+        postgresql_include=['pool'],
+        postgresql_where=sa.text('is_in_review_phase'),
+    )
+    # Upcoming window / earliest next time: user_id = ? AND next_available_time range
+    op.create_index(
+        'ix_word_progress_user_next',
+        'word_progress',
+        ['user_id', 'next_available_time'],
+        unique=False,
+    )
+
+    # Superseded by the composites above (user_id is also the prefix of uq_user_word)
+    op.drop_index('ix_word_progress_user_id', table_name='word_progress')
+    op.drop_index('ix_word_progress_pool', table_name='word_progress')
+    op.drop_index('ix_word_progress_next_available_time', table_name='word_progress')
+
+
+def downgrade() -> None:
+    op.create_index('ix_word_progress_next_available_time', 'word_progress', ['next_available_time'], unique=False)
+    op.create_index('ix_word_progress_pool', 'word_progress', ['pool'], unique=False)
+    op.create_index('ix_word_progress_user_id', 'word_progress', ['user_id'], unique=False)
+
+    op.drop_index('ix_word_progress_user_next', table_name='word_progress')
+    op.drop_index('ix_word_progress_review_due', table_name='word_progress')
+    op.drop_index('ix_word_progress_user_pool_next', table_name='word_progress')
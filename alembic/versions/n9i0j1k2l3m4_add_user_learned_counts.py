@@ -0,0 +1,44 @@
+"""add_user_learned_counts
+
+Revision ID: n9i0j1k2l3m4
+Revises: m8h9i0j1k2l3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'n9i0j1k2l3m4'
+down_revision: Union[str, None] = 'm8h9i0j1k2l3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_learned_counts',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('level_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('learned', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'level_id', 'category_id'),
+    )
+
+    # Backfill from existing progress; NULL level/category are stored as 0
+    op.execute(
+        sa.text(
+            "INSERT INTO user_learned_counts (user_id, level_id, category_id, learned) "
+            "SELECT wp.user_id, COALESCE(w.level_id, 0), COALESCE(w.category_id, 0), COUNT(*) "
+            "FROM word_progress wp JOIN words w ON w.id = wp.word_id "
+            "GROUP BY wp.user_id, COALESCE(w.level_id, 0), COALESCE(w.category_id, 0)"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_learned_counts')
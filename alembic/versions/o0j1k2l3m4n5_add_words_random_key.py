@@ -0,0 +1,38 @@
+"""add_words_random_key
+
+Revision ID: o0j1k2l3m4n5
+Revises: n9i0j1k2l3m4
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'o0j1k2l3m4n5'
+down_revision: Union[str, None] = 'n9i0j1k2l3m4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # random() is volatile, so every existing row gets its own key
+    op.add_column(
+        'words',
+        sa.Column('random_key', sa.Float(), server_default=sa.text('random()'), nullable=False),
+    )
+    op.create_index('ix_words_level_random_key', 'words', ['level_id', 'random_key'], unique=False)
+    op.create_index(
+        'ix_words_level_category_random_key',
+        'words',
+        ['level_id', 'category_id', 'random_key'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_words_level_category_random_key', table_name='words')
+    op.drop_index('ix_words_level_random_key', table_name='words')
+    op.drop_column('words', 'random_key')
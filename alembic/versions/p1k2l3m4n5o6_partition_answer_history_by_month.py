@@ -0,0 +1,127 @@
+"""partition_answer_history_by_month
+
+Revision ID: p1k2l3m4n5o6
+Revises: o0j1k2l3m4n5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'p1k2l3m4n5o6'
+down_revision: Union[str, None] = 'o0j1k2l3m4n5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Month boundaries follow APP_TIMEZONE (UTC+8)
+APP_TIMEZONE = timezone(timedelta(hours=8))
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, word_id, word, is_correct, exercise_type, source, pool, "
+    "user_answer, response_time_ms, created_at"
+)
+OLD_INDEXES = ['user_id', 'word_id', 'source', 'pool', 'created_at']
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=APP_TIMEZONE).isoformat()
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE answer_history RENAME TO answer_history_unpartitioned")
+    op.execute(
+        "ALTER TABLE answer_history_unpartitioned "
+        "RENAME CONSTRAINT answer_history_pkey TO answer_history_unpartitioned_pkey"
+    )
+    for column in OLD_INDEXES:
+        op.drop_index(f'ix_answer_history_{column}', table_name='answer_history_unpartitioned')
+
+    # The partition key must be part of the primary key
+    op.execute(
+        "CREATE TABLE answer_history ("
+        "id UUID NOT NULL, "
+        "user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE, "
+        "word_id UUID NOT NULL REFERENCES words (id) ON DELETE CASCADE, "
+        "word VARCHAR(100) NOT NULL, "
+        "is_correct BOOLEAN NOT NULL, "
+        "exercise_type VARCHAR(50) NOT NULL, "
+        "source VARCHAR(20) NOT NULL, "
+        "pool VARCHAR(10) NOT NULL, "
+        "user_answer VARCHAR(200), "
+        "response_time_ms INTEGER, "
+        "created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(), "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+
+    # One partition per month from the oldest row to MONTHS_AHEAD months ahead
+    this_month = datetime.now(APP_TIMEZONE).date().replace(day=1)
+    oldest = op.get_bind().execute(
+        sa.text("SELECT min(created_at) FROM answer_history_unpartitioned")
+    ).scalar()
+    month = oldest.astimezone(APP_TIMEZONE).date().replace(day=1) if oldest else this_month
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE answer_history_{month:%Y_%m} PARTITION OF answer_history "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(_add_months(month, 1))}')"
+        )
+        month = _add_months(month, 1)
+    # Catch-all so inserts never fail if partition creation falls behind
+    op.execute("CREATE TABLE answer_history_default PARTITION OF answer_history DEFAULT")
+
+    op.create_index('ix_answer_history_user_created', 'answer_history', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_answer_history_word_id', 'answer_history', ['word_id'], unique=False)
+
+    op.execute(
+        f"INSERT INTO answer_history ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM answer_history_unpartitioned"
+    )
+    op.drop_table('answer_history_unpartitioned')
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE answer_history RENAME TO answer_history_partitioned")
+    op.drop_index('ix_answer_history_word_id', table_name='answer_history_partitioned')
+    op.execute(
+        "ALTER TABLE answer_history_partitioned "
+        "RENAME CONSTRAINT answer_history_pkey TO answer_history_partitioned_pkey"
+    )
+
+    op.create_table(
+        'answer_history',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('word_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('word', sa.String(length=100), nullable=False),
+        sa.Column('is_correct', sa.Boolean(), nullable=False),
+        sa.Column('exercise_type', sa.String(length=50), nullable=False),
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('pool', sa.String(length=10), nullable=False),
+        sa.Column('user_answer', sa.String(length=200), nullable=True),
+        sa.Column('response_time_ms', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['word_id'], ['words.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        f"INSERT INTO answer_history ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM answer_history_partitioned"
+    )
+    for column in OLD_INDEXES:
+        op.create_index(f'ix_answer_history_{column}', 'answer_history', [column], unique=False)
+
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE answer_history_partitioned")
@@ -0,0 +1,57 @@
+"""add_user_daily_activity
+
+Revision ID: q2l3m4n5o6p7
+Revises: p1k2l3m4n5o6
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'q2l3m4n5o6p7'
+down_revision: Union[str, None] = 'p1k2l3m4n5o6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Local date in APP_TIMEZONE (UTC+8) of a timestamptz column
+LOCAL_DATE = "((timezone('UTC', {0}) + interval '8 hours')::date)"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_daily_activity',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('activity_date', sa.Date(), nullable=False),
+        sa.Column('learned', sa.Integer(), nullable=False),
+        sa.Column('completed', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'activity_date'),
+    )
+
+    # Backfill from learned_at and completed answers
+    # (scripts/backfill_daily_activity.py rebuilds the same data)
+    learned_day = LOCAL_DATE.format('learned_at')
+    completed_day = LOCAL_DATE.format('created_at')
+    op.execute(
+        sa.text(
+            "INSERT INTO user_daily_activity (user_id, activity_date, learned, completed) "
+            "SELECT user_id, day, SUM(learned), SUM(completed) FROM ("
+            f"  SELECT user_id, {learned_day} AS day, COUNT(*) AS learned, 0 AS completed "
+            "  FROM word_progress WHERE learned_at IS NOT NULL "
+            f"  GROUP BY user_id, {learned_day} "
+            "  UNION ALL "
+            f"  SELECT user_id, {completed_day} AS day, 0 AS learned, COUNT(*) AS completed "
+            "  FROM answer_history "
+            "  WHERE source IN ('practice', 'review_learn', 'review_practice') "
+            f"  GROUP BY user_id, {completed_day}"
+            ") activity GROUP BY user_id, day"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_daily_activity')
@@ -0,0 +1,34 @@
+"""add_event_id_to_events
+
+Revision ID: r3m4n5o6p7q8
+Revises: q2l3m4n5o6p7
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'r3m4n5o6p7q8'
+down_revision: Union[str, None] = 'q2l3m4n5o6p7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('event_id', sa.String(length=100), nullable=True))
+    # Existing rows have no event_id, so the partial index starts empty
+    op.create_index(
+        'uq_events_device_event_id',
+        'events',
+        ['device_id', 'event_id'],
+        unique=True,
+        postgresql_where=sa.text('event_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_events_device_event_id', table_name='events')
+    op.drop_column('events', 'event_id')
@@ -0,0 +1,36 @@
+"""add_speech_transcription_cache
+
+Revision ID: s4n5o6p7q8r9
+Revises: r3m4n5o6p7q8
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 's4n5o6p7q8r9'
+down_revision: Union[str, None] = 'r3m4n5o6p7q8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'speech_transcriptions',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('transcript', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+    # Existing logs keep their per-upload recording_path and no hash
+    op.add_column('speech_logs', sa.Column('recording_sha256', sa.String(length=64), nullable=True))
+    op.create_index('ix_speech_logs_recording_sha256', 'speech_logs', ['recording_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_speech_logs_recording_sha256', table_name='speech_logs')
+    op.drop_column('speech_logs', 'recording_sha256')
+    op.drop_table('speech_transcriptions')
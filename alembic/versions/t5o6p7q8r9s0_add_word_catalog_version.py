@@ -0,0 +1,60 @@
+"""add_word_catalog_version
+
+Revision ID: t5o6p7q8r9s0
+Revises: s4n5o6p7q8r9
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 't5o6p7q8r9s0'
+down_revision: Union[str, None] = 's4n5o6p7q8r9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'word_catalog_version',
+        sa.Column('id', sa.SmallInteger(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_word_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO word_catalog_version (id, version)
+            VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)
+            ON CONFLICT (id) DO UPDATE
+            SET version = greatest(word_catalog_version.version + 1, EXCLUDED.version);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Only the columns the export returns; rotating random_key keeps the version
+    op.execute("""
+        CREATE TRIGGER words_catalog_version
+        AFTER INSERT OR DELETE OR TRUNCATE ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER words_catalog_version_update
+        AFTER UPDATE OF id, word, translation, sentence, sentence_zh, image_url,
+            audio_url, level_id, category_id, created_at ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    op.execute("""
+        INSERT INTO word_catalog_version (id, version)
+        VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER words_catalog_version_update ON words")
+    op.execute("DROP TRIGGER words_catalog_version ON words")
+    op.execute("DROP FUNCTION bump_word_catalog_version()")
+    op.drop_table('word_catalog_version')
@@ -0,0 +1,91 @@
+"""add_word_count_to_catalog_version
+
+Revision ID: u6p7q8r9s0t1
+Revises: t5o6p7q8r9s0
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'u6p7q8r9s0t1'
+down_revision: Union[str, None] = 't5o6p7q8r9s0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'word_catalog_version',
+        sa.Column('word_count', sa.BigInteger(), server_default='0', nullable=False),
+    )
+    # Transition tables need one trigger per event
+    op.execute("DROP TRIGGER words_catalog_version ON words")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_word_catalog_version() RETURNS trigger AS $$
+        DECLARE
+            delta bigint := 0;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT count(*) INTO delta FROM new_words;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT -count(*) INTO delta FROM old_words;
+            END IF;
+            INSERT INTO word_catalog_version (id, version, word_count)
+            VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint, greatest(delta, 0))
+            ON CONFLICT (id) DO UPDATE
+            SET version = greatest(word_catalog_version.version + 1, EXCLUDED.version),
+                word_count = CASE WHEN TG_OP = 'TRUNCATE' THEN 0
+                                  ELSE word_catalog_version.word_count + delta END;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER words_catalog_insert
+        AFTER INSERT ON words REFERENCING NEW TABLE AS new_words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER words_catalog_delete
+        AFTER DELETE ON words REFERENCING OLD TABLE AS old_words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER words_catalog_truncate
+        AFTER TRUNCATE ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    # Lock words so the starting count cannot miss a concurrent insert
+    op.execute("LOCK TABLE words IN SHARE MODE")
+    op.execute("""
+        INSERT INTO word_catalog_version (id, version, word_count)
+        VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint, (SELECT count(*) FROM words))
+        ON CONFLICT (id) DO UPDATE SET word_count = EXCLUDED.word_count
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER words_catalog_truncate ON words")
+    op.execute("DROP TRIGGER words_catalog_delete ON words")
+    op.execute("DROP TRIGGER words_catalog_insert ON words")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_word_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO word_catalog_version (id, version)
+            VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)
+            ON CONFLICT (id) DO UPDATE
+            SET version = greatest(word_catalog_version.version + 1, EXCLUDED.version);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER words_catalog_version
+        AFTER INSERT OR DELETE OR TRUNCATE ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version()
+    """)
+    op.drop_column('word_catalog_version', 'word_count')
@@ -25,6 +25,58 @@ class Settings(BaseSettings):
     # Static files (Cloud Storage)
     static_base_url: str = ""  # Empty = local /static, set for GCS URL
 
+    # Word catalog cache: seconds before a worker reloads the in-memory catalog.
+    # Seeding invalidates the local worker immediately; other workers pick up
+    # the change after this TTL.
+    word_catalog_ttl_seconds: int = 300
+
+    # Write-behind buffers (app/services/batch_writer.py). When enabled, rows
+    # are queued in process and flushed in batches by a background task;
+    # a full queue falls back to synchronous writes.
+    answer_history_write_behind: bool = False
+    write_behind_max_queue: int = 10000
+    write_behind_batch_size: int = 500
+    write_behind_flush_interval_seconds: float = 1.0
+    # Failed flushes of a batch before it is written row by row and the
+    # rows that still fail are dead-lettered (logged, plus
+    # <dir>/<writer>.jsonl when a directory is set)
+    write_behind_max_retries: int = 3
+    write_behind_dead_letter_dir: str = ""
+
+    # /api/track events go through their own buffer, on by default:
+    # analytics is the highest-QPS endpoint and never read back in a request
+    track_write_behind: bool = True
+    track_write_behind_max_queue: int = 50000
+    track_write_behind_batch_size: int = 1000
+
+    # Drop retried /api/track events by client event_id in memory
+    # (app/services/event_dedup.py); the unique index catches the rest
+    event_dedup_enabled: bool = True
+    event_dedup_capacity: int = 1_000_000  # Keys per window
+    event_dedup_error_rate: float = 0.001
+    event_dedup_window_seconds: float = 3600
+
+    # Speech pipeline: thread pool for the blocking storage / Speech-to-Text
+    # clients, and per-stage timeouts in seconds
+    speech_executor_workers: int = 8
+    speech_upload_timeout_seconds: float = 15.0
+    speech_recognize_timeout_seconds: float = 30.0
+
+    # Transcription cache (app/services/transcription_cache.py): in-memory
+    # LRU entries per worker, plus the speech_transcriptions table if enabled
+    transcription_cache_size: int = 1024
+    transcription_cache_persistent: bool = False
+
+    # Speech-to-text backend (app/services/stt_backends.py): google, fake or vosk
+    stt_backend: str = "google"
+    # fake: latency drawn from a normal distribution, failures at error_rate
+    stt_fake_latency_ms: float = 300.0
+    stt_fake_latency_jitter_ms: float = 100.0
+    stt_fake_error_rate: float = 0.0
+    stt_fake_transcript: str = "hello"
+    # vosk: directory of a downloaded Vosk model
+    stt_vosk_model_path: str = ""
+
     # Google Cloud credentials (for local development)
     google_application_credentials: str = ""
 
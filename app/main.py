@@ -1,5 +1,6 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI
@@ -15,12 +16,34 @@ from sqlalchemy import text
 
 from app.config import settings
 from app.database import SessionLocal
+from app.middleware import BodySizeLimitMiddleware
 from app.routers import auth, home, learn, practice, review, admin, level_analysis, speech, track, tutorial
+from app.services.batch_writer import get_batch_writer_stats, start_batch_writers, stop_batch_writers
+from app.services.event_dedup import event_dedup
+from app.services.speech_service import MAX_UPLOAD_BODY_BYTES, speech_service
+from app.services.transcription_cache import transcription_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_batch_writers()
+    yield
+    # Flush write-behind buffers before the process exits
+    await stop_batch_writers()
+    speech_service.shutdown()
+
 
 app = FastAPI(
     title="Coach Vocabulary API",
     description="API for vocabulary learning with spaced repetition",
     version="1.0.0",
+    lifespan=lifespan,
+)
+
+# Abort oversized uploads while they stream in (CORS, added after, wraps it)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={"/api/speech/transcribe": MAX_UPLOAD_BODY_BYTES},
 )
 
 # CORS middleware
@@ -73,5 +96,8 @@ def health_check():
     return {
         "timestamp": current_time,
         "db_migration_version": migration_version,
-        "word_count": word_count
+        "word_count": word_count,
+        "write_behind": get_batch_writer_stats(),
+        "event_dedup": event_dedup.stats(),
+        "transcription_cache": transcription_cache.stats(),
     }
@@ -6,5 +6,9 @@ from app.models.word_level import WordLevel
 from app.models.word_category import WordCategory
 from app.models.answer_history import AnswerHistory
 from app.models.speech_log import SpeechLog
+from app.models.speech_transcription import SpeechTranscription
+from app.models.user_learned_count import UserLearnedCount
+from app.models.user_daily_activity import UserDailyActivity
+from app.models.word_catalog_version import WordCatalogVersion
 
-__all__ = ["Base", "User", "Word", "WordProgress", "WordLevel", "WordCategory", "AnswerHistory", "SpeechLog"]
+__all__ = ["Base", "User", "Word", "WordProgress", "WordLevel", "WordCategory", "AnswerHistory", "SpeechLog", "SpeechTranscription", "UserLearnedCount", "UserDailyActivity", "WordCatalogVersion"]
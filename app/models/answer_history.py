@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, func
+from sqlalchemy import DDL, String, Boolean, DateTime, Integer, ForeignKey, Index, event, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -13,13 +13,18 @@ if TYPE_CHECKING:
 
 
 class AnswerHistory(Base, UUIDMixin):
+    """
+    Range-partitioned by month on created_at (see
+    app/services/answer_history_partitions.py). The partition key has to be
+    part of the primary key.
+    """
+
     __tablename__ = "answer_history"
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     word_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -41,13 +46,11 @@ class AnswerHistory(Base, UUIDMixin):
     )
     source: Mapped[str] = mapped_column(
         String(20),
-        nullable=False,
-        index=True
+        nullable=False
     )
     pool: Mapped[str] = mapped_column(
         String(10),
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_answer: Mapped[Optional[str]] = mapped_column(
         String(200),
@@ -59,11 +62,25 @@ class AnswerHistory(Base, UUIDMixin):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="answer_history")
     word_rel: Mapped["Word"] = relationship("Word", back_populates="answer_history")
+
+    __table_args__ = (
+        Index("ix_answer_history_user_created", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+# Tables created from metadata (tests, benchmarks) get a catch-all partition
+# so inserts work before any monthly partition exists
+event.listen(
+    AnswerHistory.__table__,
+    "after_create",
+    DDL("CREATE TABLE answer_history_default PARTITION OF answer_history DEFAULT"),
+)
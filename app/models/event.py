@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, Any
 
-from sqlalchemy import String, DateTime, Index, func
+from sqlalchemy import String, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,8 @@ class Event(Base, UUIDMixin):
     __tablename__ = "events"
 
     device_id: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # Client-generated id, unique per device when present; lets retries be dropped
+    event_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     user_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
     session_id: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     exercise_session_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
@@ -31,4 +33,11 @@ class Event(Base, UUIDMixin):
 
     __table_args__ = (
         Index("ix_events_device_session", "device_id", "session_id"),
+        Index(
+            "uq_events_device_event_id",
+            "device_id",
+            "event_id",
+            unique=True,
+            postgresql_where=text("event_id IS NOT NULL"),
+        ),
     )
@@ -35,6 +35,12 @@ class SpeechLog(Base, UUIDMixin):
         String(500),
         nullable=False
     )
+    # SHA-256 of the uploaded bytes; recordings are stored once per hash
+    recording_sha256: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True
+    )
     native_transcript: Mapped[Optional[str]] = mapped_column(
         String(500),
         nullable=True
@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SpeechTranscription(Base):
+    """
+    Persistent tier of the transcription cache.
+
+    cache_key is the SHA-256 of the recognition config plus the normalized
+    audio sent to Speech-to-Text, so identical requests are recognized once.
+    """
+
+    __tablename__ = "speech_transcriptions"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    transcript: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
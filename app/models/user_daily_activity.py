@@ -0,0 +1,28 @@
+import uuid
+from datetime import date
+from sqlalchemy import Date, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class UserDailyActivity(Base):
+    """
+    Per-user daily rollup of words learned and exercises completed.
+
+    activity_date is the local date in APP_TIMEZONE. Rows are incremented in
+    the same transaction as the progress inserts and answers they count, so
+    today's numbers are a primary-key lookup instead of a scan.
+    """
+
+    __tablename__ = "user_daily_activity"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    learned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,29 @@
+import uuid
+from sqlalchemy import Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+# Stored in place of a NULL level_id / category_id so both can be part of the key
+NO_BUCKET = 0
+
+
+class UserLearnedCount(Base):
+    """
+    Number of words a user has learned (moved out of P0) per (level, category).
+
+    Maintained in the same transaction as word_progress inserts and resets,
+    so P0 per bucket is the catalog bucket size minus learned.
+    """
+
+    __tablename__ = "user_learned_counts"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    level_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    learned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text, DateTime, func, ForeignKey
+from sqlalchemy import String, Text, DateTime, Float, Index, func, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
@@ -50,6 +50,13 @@ class Word(Base, UUIDMixin):
         ForeignKey("word_categories.id"),
         nullable=True
     )
+    # Uniform [0, 1) sort key for sampling without ORDER BY random();
+    # assigned on insert and rotated by scripts/rotate_word_random_keys.py
+    random_key: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        server_default=func.random()
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -74,3 +81,8 @@ class Word(Base, UUIDMixin):
         back_populates="word_rel",
         cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index("ix_words_level_random_key", "level_id", "random_key"),
+        Index("ix_words_level_category_random_key", "level_id", "category_id", "random_key"),
+    )
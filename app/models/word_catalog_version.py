@@ -0,0 +1,71 @@
+from sqlalchemy import BigInteger, DDL, SmallInteger, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.word import Word
+
+WORD_CATALOG_VERSION_ID = 1
+
+
+class WordCatalogVersion(Base):
+    """
+    Single-row version and size of the word catalog.
+
+    Maintained by statement-level triggers on words: every insert, delete,
+    truncate or update of an exported column bumps the version, and inserts
+    and deletes adjust word_count. Every writer (the API, seed scripts,
+    manual SQL) moves them, and reading either is one primary-key lookup.
+    Versions are microsecond timestamps kept strictly increasing, so they
+    do not repeat after the table is recreated.
+    """
+
+    __tablename__ = "word_catalog_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    word_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
+# Same function and triggers as migration u6p7q8r9s0t1, for tables created
+# from metadata (tests, benchmarks)
+event.listen(
+    Word.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION bump_word_catalog_version() RETURNS trigger AS $$
+        DECLARE
+            delta bigint := 0;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT count(*) INTO delta FROM new_words;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT -count(*) INTO delta FROM old_words;
+            END IF;
+            INSERT INTO word_catalog_version (id, version, word_count)
+            VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint, greatest(delta, 0))
+            ON CONFLICT (id) DO UPDATE
+            SET version = greatest(word_catalog_version.version + 1, EXCLUDED.version),
+                word_count = CASE WHEN TG_OP = 'TRUNCATE' THEN 0
+                                  ELSE word_catalog_version.word_count + delta END;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER words_catalog_insert
+        AFTER INSERT ON words REFERENCING NEW TABLE AS new_words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version();
+
+        CREATE TRIGGER words_catalog_delete
+        AFTER DELETE ON words REFERENCING OLD TABLE AS old_words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version();
+
+        CREATE TRIGGER words_catalog_truncate
+        AFTER TRUNCATE ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version();
+
+        CREATE TRIGGER words_catalog_version_update
+        AFTER UPDATE OF id, word, translation, sentence, sentence_zh, image_url,
+            audio_url, level_id, category_id, created_at ON words
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_word_catalog_version();
+    """),
+)
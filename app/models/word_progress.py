@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -18,8 +18,7 @@ class WordProgress(Base, UUIDMixin, TimestampMixin):
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     word_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -30,8 +29,7 @@ class WordProgress(Base, UUIDMixin, TimestampMixin):
     pool: Mapped[str] = mapped_column(
         String(10),
         nullable=False,
-        default="P0",
-        index=True
+        default="P0"
     )
     learned_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
@@ -43,8 +41,7 @@ class WordProgress(Base, UUIDMixin, TimestampMixin):
     )
     next_available_time: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     is_in_review_phase: Mapped[bool] = mapped_column(
         Boolean,
@@ -62,4 +59,17 @@ class WordProgress(Base, UUIDMixin, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("user_id", "word_id", name="uq_user_word"),
+        # Due-queue indexes (see get_available_*_words / count_upcoming_24h)
+        Index(
+            "ix_word_progress_user_pool_next",
+            "user_id", "pool", "next_available_time",
+            postgresql_include=["is_in_review_phase"],
+        ),
+        Index(
+            "ix_word_progress_review_due",
+            "user_id", "next_available_time",
+            postgresql_include=["pool"],
+            postgresql_where=text("is_in_review_phase"),
+        ),
+        Index("ix_word_progress_user_next", "user_id", "next_available_time"),
     )
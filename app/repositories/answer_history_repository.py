@@ -1,10 +1,21 @@
-from datetime import datetime, timezone
+import logging
+from collections import Counter
 from typing import List, Optional
 from uuid import UUID
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import SessionLocal
 from app.models.answer_history import AnswerHistory
-from app.utils.constants import APP_TIMEZONE
+from app.repositories.daily_activity_repository import DailyActivityRepository
+from app.services.batch_writer import BatchWriter
+from app.utils.constants import COMPLETED_SOURCES
+
+logger = logging.getLogger(__name__)
+
+# Session.info key for answers waiting on the session's commit
+_PENDING_ANSWERS = "answer_history_pending"
 
 
 class AnswerHistoryRepository:
@@ -12,19 +23,9 @@ class AnswerHistoryRepository:
         self.db = db
 
     def count_today_completed(self, user_id: UUID) -> int:
-        """Count exercises completed today (practice + review)."""
-        today_start = datetime.now(APP_TIMEZONE).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        return (
-            self.db.query(AnswerHistory)
-            .filter(
-                AnswerHistory.user_id == user_id,
-                AnswerHistory.source.in_(["practice", "review_learn", "review_practice"]),
-                AnswerHistory.created_at >= today_start,
-            )
-            .count()
-        )
+        """Count exercises completed today (practice + review), from the daily rollup."""
+        _, completed = DailyActivityRepository(self.db).get_day(user_id)
+        return completed
 
     def create_answer(
         self,
@@ -58,9 +59,9 @@ class AnswerHistoryRepository:
     def create_answers_batch(
         self,
         answers: List[dict],
-    ) -> List[AnswerHistory]:
+    ) -> int:
         """
-        Create multiple answer history records in batch.
+        Create multiple answer history records with one bulk INSERT.
 
         Each dict in answers should contain:
         - user_id: UUID
@@ -72,25 +73,99 @@ class AnswerHistoryRepository:
         - pool: str
         - user_answer: Optional[str]
         - response_time_ms: Optional[int]
+
+        Does not commit; the caller owns the transaction.
+
+        Returns:
+            Number of records inserted
         """
-        records = []
-        for data in answers:
-            answer = AnswerHistory(
-                user_id=data["user_id"],
-                word_id=data["word_id"],
-                word=data["word"],
-                is_correct=data["is_correct"],
-                exercise_type=data["exercise_type"],
-                source=data["source"],
-                pool=data["pool"],
-                user_answer=data.get("user_answer"),
-                response_time_ms=data.get("response_time_ms"),
-            )
-            self.db.add(answer)
-            records.append(answer)
+        if not answers:
+            return 0
+
+        self.db.execute(
+            insert(AnswerHistory),
+            [
+                {
+                    "user_id": data["user_id"],
+                    "word_id": data["word_id"],
+                    "word": data["word"],
+                    "is_correct": data["is_correct"],
+                    "exercise_type": data["exercise_type"],
+                    "source": data["source"],
+                    "pool": data["pool"],
+                    "user_answer": data.get("user_answer"),
+                    "response_time_ms": data.get("response_time_ms"),
+                }
+                for data in answers
+            ],
+        )
+        return len(answers)
+
+    def add_answers(self, answers: List[dict]) -> int:
+        """
+        Record answer history as part of the caller's transaction.
+
+        With write-behind enabled, the records are handed to the background
+        writer when the transaction commits (and dropped if it rolls back)
+        instead of being inserted by it. The daily completed counters are
+        always bumped in the caller's transaction.
+
+        Returns:
+            Number of records recorded
+        """
+        if not answers:
+            return 0
+
+        completed = Counter(
+            data["user_id"] for data in answers if data["source"] in COMPLETED_SOURCES
+        )
+        daily_activity_repo = DailyActivityRepository(self.db)
+        for user_id, count in completed.items():
+            daily_activity_repo.increment(user_id, completed=count)
+
+        if not answer_history_writer.running:
+            return self.create_answers_batch(answers)
+
+        self.db.info.setdefault(_PENDING_ANSWERS, []).extend(answers)
+        return len(answers)
+
+
+def _write_answers(answers: List[dict]) -> None:
+    db = SessionLocal()
+    try:
+        AnswerHistoryRepository(db).create_answers_batch(answers)
+        db.commit()
+    finally:
+        db.close()
+
+
+answer_history_writer = BatchWriter(
+    "answer_history",
+    _write_answers,
+    enabled=settings.answer_history_write_behind,
+    max_queue=settings.write_behind_max_queue,
+    batch_size=settings.write_behind_batch_size,
+    flush_interval=settings.write_behind_flush_interval_seconds,
+    max_retries=settings.write_behind_max_retries,
+    dead_letter_dir=settings.write_behind_dead_letter_dir,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_pending_answers(session: Session) -> None:
+    pending = session.info.pop(_PENDING_ANSWERS, None)
+    if not pending:
+        return
+    # The caller's transaction has already committed: a failed synchronous
+    # fallback write (writer stopped or queue full) must not surface as an
+    # error from its commit()
+    try:
+        answer_history_writer.submit(pending)
+    except Exception as e:
+        logger.exception("Failed to write %d answer history records after commit", len(pending))
+        answer_history_writer.dead_letter(pending, e)
 
-        self.db.commit()
-        for record in records:
-            self.db.refresh(record)
 
-        return records
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_answers(session: Session) -> None:
+    session.info.pop(_PENDING_ANSWERS, None)
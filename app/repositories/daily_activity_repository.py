@@ -0,0 +1,127 @@
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import Date, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.answer_history import AnswerHistory
+from app.models.user_daily_activity import UserDailyActivity
+from app.models.word_progress import WordProgress
+from app.utils.constants import APP_TIMEZONE, COMPLETED_SOURCES
+
+
+def local_date(moment: Optional[datetime] = None) -> date:
+    """The APP_TIMEZONE calendar date of moment (default: now)."""
+    return (moment or datetime.now(APP_TIMEZONE)).astimezone(APP_TIMEZONE).date()
+
+
+def _local_date_column(column):
+    """SQL expression for the APP_TIMEZONE date of a timestamptz column."""
+    return cast(func.timezone("UTC", column) + APP_TIMEZONE.utcoffset(None), Date)
+
+
+class DailyActivityRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_day(self, user_id: UUID, activity_date: Optional[date] = None) -> tuple[int, int]:
+        """
+        Get (learned, completed) for one day, today by default.
+        """
+        row = (
+            self.db.query(UserDailyActivity.learned, UserDailyActivity.completed)
+            .filter(
+                UserDailyActivity.user_id == user_id,
+                UserDailyActivity.activity_date == (activity_date or local_date()),
+            )
+            .first()
+        )
+        return (row.learned, row.completed) if row else (0, 0)
+
+    def increment(
+        self,
+        user_id: UUID,
+        learned: int = 0,
+        completed: int = 0,
+        activity_date: Optional[date] = None,
+    ) -> None:
+        """
+        Add to a user's counters for one day (today by default) with one upsert.
+
+        Does not commit; the caller owns the transaction.
+        """
+        if not learned and not completed:
+            return
+
+        stmt = pg_insert(UserDailyActivity).values(
+            user_id=user_id,
+            activity_date=activity_date or local_date(),
+            learned=learned,
+            completed=completed,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "activity_date"],
+            set_={
+                "learned": UserDailyActivity.learned + stmt.excluded.learned,
+                "completed": UserDailyActivity.completed + stmt.excluded.completed,
+            },
+        )
+        self.db.execute(stmt)
+
+    def clear_learned(self, user_id: Optional[UUID] = None) -> None:
+        """
+        Zero the learned counters after progress rows were deleted, for one
+        user or everyone. Completed counts follow answer_history, which stays.
+
+        Does not commit; the caller owns the transaction.
+        """
+        query = self.db.query(UserDailyActivity)
+        if user_id is not None:
+            query = query.filter(UserDailyActivity.user_id == user_id)
+        query.update({UserDailyActivity.learned: 0}, synchronize_session=False)
+
+    def rebuild(self, user_id: Optional[UUID] = None) -> int:
+        """
+        Recompute the rollup from word_progress.learned_at and answer_history,
+        for one user or everyone.
+
+        Does not commit; the caller owns the transaction.
+
+        Returns:
+            Number of (user, day) rows written
+        """
+        query = self.db.query(UserDailyActivity)
+        if user_id is not None:
+            query = query.filter(UserDailyActivity.user_id == user_id)
+        query.delete(synchronize_session=False)
+
+        learned_day = _local_date_column(WordProgress.learned_at)
+        learned = (
+            select(WordProgress.user_id, learned_day, func.count(), literal(0))
+            .where(WordProgress.learned_at.isnot(None))
+            .group_by(WordProgress.user_id, learned_day)
+        )
+        completed_day = _local_date_column(AnswerHistory.created_at)
+        completed = (
+            select(AnswerHistory.user_id, completed_day, literal(0), func.count())
+            .where(AnswerHistory.source.in_(COMPLETED_SOURCES))
+            .group_by(AnswerHistory.user_id, completed_day)
+        )
+        if user_id is not None:
+            learned = learned.where(WordProgress.user_id == user_id)
+            completed = completed.where(AnswerHistory.user_id == user_id)
+
+        columns = ["user_id", "activity_date", "learned", "completed"]
+        self.db.execute(pg_insert(UserDailyActivity).from_select(columns, learned))
+        stmt = pg_insert(UserDailyActivity).from_select(columns, completed)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "activity_date"],
+            set_={"completed": stmt.excluded.completed},
+        )
+        self.db.execute(stmt)
+
+        count = self.db.query(UserDailyActivity)
+        if user_id is not None:
+            count = count.filter(UserDailyActivity.user_id == user_id)
+        return count.count()
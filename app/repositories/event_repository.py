@@ -1,8 +1,13 @@
 from typing import Any
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import SessionLocal
 from app.models.event import Event
+from app.services.batch_writer import BatchWriter
+from app.services.event_dedup import event_dedup
 
 
 class EventRepository:
@@ -13,7 +18,10 @@ class EventRepository:
 
     def create_events_batch(self, events: list[dict[str, Any]]) -> int:
         """
-        Bulk insert events into the database.
+        Bulk insert events into the database with one multi-row INSERT.
+
+        Events whose (device_id, event_id) is already stored are skipped
+        (ON CONFLICT DO NOTHING on the unique partial index).
 
         Args:
             events: List of event dictionaries with fields matching the Event model.
@@ -24,8 +32,56 @@ class EventRepository:
         if not events:
             return 0
 
-        event_objects = [Event(**event_data) for event_data in events]
-        self.db.add_all(event_objects)
+        stmt = (
+            pg_insert(Event)
+            .on_conflict_do_nothing(
+                index_elements=["device_id", "event_id"],
+                index_where=Event.event_id.isnot(None),
+            )
+            .returning(Event.id)
+        )
+        inserted = len(self.db.execute(stmt, events).all())
         self.db.commit()
 
-        return len(event_objects)
+        return inserted
+
+    def add_events(self, events: list[dict[str, Any]]) -> int:
+        """
+        Hand events to the ingestion buffer, which writes them in batches
+        shared across requests. Written synchronously when the buffer is not
+        running or full. Events that cannot be stored (e.g. text the
+        database rejects) are dead-lettered by the buffer instead of
+        blocking the events queued behind them.
+
+        Events should carry server_received_at, since they may be written
+        after the request returns.
+
+        Returns:
+            Number of events accepted.
+        """
+        if not events:
+            return 0
+
+        event_writer.submit(events)
+        return len(events)
+
+
+def _write_events(events: list[dict[str, Any]]) -> None:
+    db = SessionLocal()
+    try:
+        inserted = EventRepository(db).create_events_batch(events)
+        event_dedup.record_conflicts(len(events) - inserted)
+    finally:
+        db.close()
+
+
+event_writer = BatchWriter(
+    "events",
+    _write_events,
+    enabled=settings.track_write_behind,
+    max_queue=settings.track_write_behind_max_queue,
+    batch_size=settings.track_write_behind_batch_size,
+    flush_interval=settings.write_behind_flush_interval_seconds,
+    max_retries=settings.write_behind_max_retries,
+    dead_letter_dir=settings.write_behind_dead_letter_dir,
+)
@@ -1,13 +1,22 @@
+import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from sqlalchemy import func
+from sqlalchemy import Boolean, DateTime, String, and_, cast, column, func, literal, or_, select, tuple_, union_all, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.word import Word
+from app.models.word_catalog_version import WORD_CATALOG_VERSION_ID, WordCatalogVersion
+from app.models.word_category import WordCategory
+from app.models.word_level import WordLevel
 from app.models.word_progress import WordProgress
+from app.models.user_learned_count import UserLearnedCount, NO_BUCKET
+from app.models.user_daily_activity import UserDailyActivity
+from app.repositories.daily_activity_repository import DailyActivityRepository, local_date
+from app.repositories.word_repository import sample_by_random_key
 from app.utils.constants import (
-    APP_TIMEZONE,
     DAILY_LEARN_LIMIT,
     P1_UPCOMING_LIMIT,
     PRACTICE_MIN_WORDS,
@@ -15,6 +24,59 @@ from app.utils.constants import (
 )
 
 
+P_PRACTICE_POOLS = ["P1", "P2", "P3", "P4", "P5"]
+R_POOLS = ["R1", "R2", "R3", "R4", "R5"]
+
+
+def pool_page_sort_time(next_available_time: Optional[datetime]) -> str:
+    """Cursor form of a row's position in get_pool_page's order."""
+    return next_available_time.isoformat() if next_available_time else "infinity"
+
+
+@dataclass(frozen=True)
+class AvailabilitySnapshot:
+    """All availability counters for a user, read in a single query."""
+
+    today_learned: int
+    p1_upcoming: int
+    p0_count: int
+    available_practice: int
+    r_pool_practice: int
+    available_review: int
+    upcoming_24h: int
+    next_available_time: Optional[datetime]
+
+    @property
+    def total_practice(self) -> int:
+        """P pool practice plus R pool practice phase words."""
+        return self.available_practice + self.r_pool_practice
+
+    def can_learn(self) -> tuple[bool, Optional[str]]:
+        if self.today_learned >= DAILY_LEARN_LIMIT:
+            return False, "daily_limit_reached"
+        if self.p1_upcoming >= P1_UPCOMING_LIMIT:
+            return False, "p1_pool_full"
+        if self.p0_count == 0:
+            return False, "no_words_in_p0"
+        return True, None
+
+    def can_practice(self) -> tuple[bool, Optional[str]]:
+        if self.total_practice < PRACTICE_MIN_WORDS:
+            return False, "not_enough_words"
+        return True, None
+
+    def can_review(self) -> tuple[bool, Optional[str]]:
+        if self.available_review < REVIEW_MIN_WORDS:
+            return False, "not_enough_words"
+        return True, None
+
+    def idle_next_available_time(self) -> Optional[datetime]:
+        """Earliest upcoming word time, only when no action is available."""
+        if self.can_learn()[0] or self.can_practice()[0] or self.can_review()[0]:
+            return None
+        return self.next_available_time
+
+
 class ProgressRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -31,6 +93,88 @@ class ProgressRepository:
             .first()
         )
 
+    def get_by_user_and_words_for_update(
+        self, user_id: UUID, word_ids: List[UUID]
+    ) -> Dict[UUID, Any]:
+        """
+        Lock the user's progress rows for the given words in one IN query.
+
+        Returns a mapping of word_id -> row (id, word_id, pool, word).
+        Missing words are simply absent from the mapping.
+        """
+        rows = (
+            self.db.query(
+                WordProgress.id,
+                WordProgress.word_id,
+                WordProgress.pool,
+                Word.word,
+            )
+            .join(Word, Word.id == WordProgress.word_id)
+            .filter(
+                WordProgress.user_id == user_id,
+                WordProgress.word_id.in_(word_ids),
+            )
+            .with_for_update(of=WordProgress)
+            .all()
+        )
+        return {row.word_id: row for row in rows}
+
+    def bulk_update_progress(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Write practice and review transitions back with a single
+        UPDATE ... FROM (VALUES ...).
+
+        Each dict in updates should contain:
+        - id: UUID (progress id)
+        - pool: str
+        - last_practice_time: datetime
+        - next_available_time: datetime
+        - is_in_review_phase: bool
+        - review_completed_time: datetime (optional; left unchanged if absent)
+
+        Does not commit; the caller owns the transaction.
+        """
+        if not updates:
+            return 0
+
+        changes = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("pool", String),
+            column("last_practice_time", DateTime(timezone=True)),
+            column("next_available_time", DateTime(timezone=True)),
+            column("is_in_review_phase", Boolean),
+            column("review_completed_time", DateTime(timezone=True)),
+            name="changes",
+        ).data([
+            (
+                u["id"],
+                u["pool"],
+                u["last_practice_time"],
+                u["next_available_time"],
+                u["is_in_review_phase"],
+                u.get("review_completed_time"),
+            )
+            for u in updates
+        ])
+
+        result = self.db.execute(
+            update(WordProgress)
+            .where(WordProgress.id == changes.c.id)
+            .values(
+                pool=changes.c.pool,
+                last_practice_time=changes.c.last_practice_time,
+                next_available_time=changes.c.next_available_time,
+                is_in_review_phase=changes.c.is_in_review_phase,
+                # VALUES types an all-NULL column as text, hence the cast
+                review_completed_time=func.coalesce(
+                    cast(changes.c.review_completed_time, DateTime(timezone=True)),
+                    WordProgress.review_completed_time,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     def get_user_progress(self, user_id: UUID) -> List[WordProgress]:
         """Get all progress records for a user (excludes P0)."""
         return (
@@ -71,29 +215,165 @@ class ProgressRepository:
             query = query.filter(Word.category_id == category_id)
 
         if randomize:
-            query = query.order_by(func.random())
-        else:
-            query = query.order_by(Word.id)
+            return sample_by_random_key(query, limit)
+
+        query = query.order_by(Word.id)
 
         if limit:
             query = query.limit(limit)
 
         return query.all()
 
-    def count_p0_words(self, user_id: UUID) -> int:
-        """Count P0 words (words without any progress record for this user)."""
+    def get_p0_words_from(
+        self,
+        user_id: UUID,
+        level_id: int,
+        category_id: int,
+        limit: int,
+    ) -> List[Word]:
+        """
+        Get P0 words at or after (level, category) in curriculum order, read
+        from the database rather than the cached curriculum, ordered as in
+        get_p0_words_in_buckets.
+        """
         learned_word_ids = (
             self.db.query(WordProgress.word_id)
             .filter(WordProgress.user_id == user_id)
             .subquery()
         )
+        level_order = select(WordLevel.order).where(WordLevel.id == level_id).scalar_subquery()
+        category_order = (
+            select(WordCategory.order).where(WordCategory.id == category_id).scalar_subquery()
+        )
 
         return (
             self.db.query(Word)
-            .filter(Word.id.notin_(learned_word_ids))
-            .count()
+            .join(WordLevel, WordLevel.id == Word.level_id)
+            .join(WordCategory, WordCategory.id == Word.category_id)
+            .filter(
+                tuple_(WordLevel.order, WordCategory.order) >= tuple_(level_order, category_order),
+                Word.id.notin_(learned_word_ids),
+            )
+            .order_by(
+                WordLevel.order,
+                WordCategory.order,
+                Word.random_key < random.random(),
+                Word.random_key,
+            )
+            .limit(limit)
+            .all()
+        )
+
+    def get_p0_words_in_buckets(
+        self,
+        user_id: UUID,
+        buckets: List[Tuple[int, int]],
+        limit: int,
+    ) -> List[Word]:
+        """
+        Get P0 words from the given (level_id, category_id) buckets in one query,
+        in curriculum order (level order, category order) and random order
+        within each bucket.
+
+        Within a bucket, words are taken in random_key order from a random
+        offset with wrap-around, as in sample_by_random_key.
+        """
+        if not buckets:
+            return []
+
+        learned_word_ids = (
+            self.db.query(WordProgress.word_id)
+            .filter(WordProgress.user_id == user_id)
+            .subquery()
         )
 
+        return (
+            self.db.query(Word)
+            .join(WordLevel, WordLevel.id == Word.level_id)
+            .join(WordCategory, WordCategory.id == Word.category_id)
+            .filter(
+                tuple_(Word.level_id, Word.category_id).in_(buckets),
+                Word.id.notin_(learned_word_ids),
+            )
+            .order_by(
+                WordLevel.order,
+                WordCategory.order,
+                Word.random_key < random.random(),
+                Word.random_key,
+            )
+            .limit(limit)
+            .all()
+        )
+
+    def count_p0_words(self, user_id: UUID) -> int:
+        """Count P0 words (words without any progress record for this user)."""
+        return self.db.query(self._p0_count(user_id)).scalar()
+
+    @staticmethod
+    def _p0_count(user_id: UUID):
+        """
+        P0 as the trigger-maintained catalog size minus the user's
+        per-bucket learned counters: two index lookups, no words scan.
+        """
+        catalog_size = (
+            select(WordCatalogVersion.word_count)
+            .where(WordCatalogVersion.id == WORD_CATALOG_VERSION_ID)
+            .scalar_subquery()
+        )
+        learned = (
+            select(func.coalesce(func.sum(UserLearnedCount.learned), 0))
+            .where(UserLearnedCount.user_id == user_id)
+            .scalar_subquery()
+        )
+        return func.greatest(func.coalesce(catalog_size, 0) - learned, 0)
+
+    def get_learned_counts(
+        self, user_id: UUID
+    ) -> Dict[Tuple[Optional[int], Optional[int]], int]:
+        """
+        Get learned word counts keyed by (level_id, category_id).
+
+        Uncategorised words are keyed with None, matching Word.level_id and
+        Word.category_id.
+        """
+        rows = (
+            self.db.query(
+                UserLearnedCount.level_id,
+                UserLearnedCount.category_id,
+                UserLearnedCount.learned,
+            )
+            .filter(UserLearnedCount.user_id == user_id)
+            .all()
+        )
+        return {
+            (level_id or None, category_id or None): learned
+            for level_id, category_id, learned in rows
+        }
+
+    def _add_learned_counts(self, user_id: UUID, word_ids) -> None:
+        """Bump the per-(level, category) learned counters for newly learned words."""
+        if not word_ids:
+            return
+
+        learned = (
+            select(
+                literal(user_id, PG_UUID(as_uuid=True)),
+                func.coalesce(Word.level_id, NO_BUCKET),
+                func.coalesce(Word.category_id, NO_BUCKET),
+                func.count(),
+            )
+            .where(Word.id.in_(list(word_ids)))
+            .group_by(Word.level_id, Word.category_id)
+        )
+        stmt = pg_insert(UserLearnedCount).from_select(
+            ["user_id", "level_id", "category_id", "learned"], learned
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "level_id", "category_id"],
+            set_={"learned": UserLearnedCount.learned + stmt.excluded.learned},
+        )
+        self.db.execute(stmt)
+
     def get_words_in_pool(
         self, user_id: UUID, pool: str
     ) -> List[WordProgress]:
@@ -146,18 +426,9 @@ class ProgressRepository:
         )
 
     def count_today_learned(self, user_id: UUID) -> int:
-        """Count words learned today."""
-        today_start = datetime.now(APP_TIMEZONE).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        return (
-            self.db.query(WordProgress)
-            .filter(
-                WordProgress.user_id == user_id,
-                WordProgress.learned_at >= today_start,
-            )
-            .count()
-        )
+        """Count words learned today, from the daily rollup."""
+        learned, _ = DailyActivityRepository(self.db).get_day(user_id)
+        return learned
 
     def get_available_practice_words(
         self, user_id: UUID, limit: Optional[int] = None
@@ -171,7 +442,7 @@ class ProgressRepository:
             .options(joinedload(WordProgress.word))
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["P1", "P2", "P3", "P4", "P5"]),
+                WordProgress.pool.in_(P_PRACTICE_POOLS),
                 WordProgress.next_available_time <= now,
             )
             .order_by(WordProgress.next_available_time)
@@ -189,7 +460,7 @@ class ProgressRepository:
             self.db.query(WordProgress)
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["P1", "P2", "P3", "P4", "P5"]),
+                WordProgress.pool.in_(P_PRACTICE_POOLS),
                 WordProgress.next_available_time <= now,
             )
             .count()
@@ -207,7 +478,7 @@ class ProgressRepository:
             .options(joinedload(WordProgress.word))
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["R1", "R2", "R3", "R4", "R5"]),
+                WordProgress.pool.in_(R_POOLS),
                 WordProgress.is_in_review_phase == True,
                 WordProgress.next_available_time <= now,
             )
@@ -226,7 +497,7 @@ class ProgressRepository:
             self.db.query(WordProgress)
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["R1", "R2", "R3", "R4", "R5"]),
+                WordProgress.pool.in_(R_POOLS),
                 WordProgress.is_in_review_phase == True,
                 WordProgress.next_available_time <= now,
             )
@@ -245,7 +516,7 @@ class ProgressRepository:
             .options(joinedload(WordProgress.word))
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["R1", "R2", "R3", "R4", "R5"]),
+                WordProgress.pool.in_(R_POOLS),
                 WordProgress.is_in_review_phase == False,
                 WordProgress.next_available_time <= now,
             )
@@ -257,6 +528,64 @@ class ProgressRepository:
 
         return query.all()
 
+    def get_practice_due_queue(
+        self, user_id: UUID, limit: int
+    ) -> List[WordProgress]:
+        """
+        Get up to limit words due for practice: P1-P5 words first, then R pool
+        words in their practice phase, each by next_available_time.
+
+        Both candidate sets are limited inside a UNION ALL, and words are
+        joined only for the rows that are returned.
+        """
+        now = datetime.now(timezone.utc)
+        due = WordProgress.next_available_time <= now
+
+        p_branch = (
+            select(
+                WordProgress.id,
+                WordProgress.next_available_time,
+                literal(0).label("priority"),
+            )
+            .where(
+                WordProgress.user_id == user_id,
+                WordProgress.pool.in_(P_PRACTICE_POOLS),
+                due,
+            )
+            .order_by(WordProgress.next_available_time)
+            .limit(limit)
+        )
+        r_branch = (
+            select(
+                WordProgress.id,
+                WordProgress.next_available_time,
+                literal(1).label("priority"),
+            )
+            .where(
+                WordProgress.user_id == user_id,
+                WordProgress.pool.in_(R_POOLS),
+                WordProgress.is_in_review_phase == False,
+                due,
+            )
+            .order_by(WordProgress.next_available_time)
+            .limit(limit)
+        )
+        candidates = union_all(p_branch, r_branch).subquery("candidates")
+        queue = (
+            select(candidates)
+            .order_by(candidates.c.priority, candidates.c.next_available_time)
+            .limit(limit)
+            .subquery("queue")
+        )
+
+        return (
+            self.db.query(WordProgress)
+            .join(queue, queue.c.id == WordProgress.id)
+            .options(joinedload(WordProgress.word))
+            .order_by(queue.c.priority, queue.c.next_available_time)
+            .all()
+        )
+
     def count_r_pool_practice(self, user_id: UUID) -> int:
         """Count R pool words available for practice test."""
         now = datetime.now(timezone.utc)
@@ -264,7 +593,7 @@ class ProgressRepository:
             self.db.query(WordProgress)
             .filter(
                 WordProgress.user_id == user_id,
-                WordProgress.pool.in_(["R1", "R2", "R3", "R4", "R5"]),
+                WordProgress.pool.in_(R_POOLS),
                 WordProgress.is_in_review_phase == False,
                 WordProgress.next_available_time <= now,
             )
@@ -335,10 +664,60 @@ class ProgressRepository:
             is_in_review_phase=is_in_review_phase,
         )
         self.db.add(progress)
+        self.db.flush()
+        self._add_learned_counts(user_id, [word_id])
+        if learned_at is not None:
+            DailyActivityRepository(self.db).increment(
+                user_id, learned=1, activity_date=local_date(learned_at)
+            )
         self.db.commit()
         self.db.refresh(progress)
         return progress
 
+    def bulk_create_learned(
+        self,
+        user_id: UUID,
+        word_ids: List[UUID],
+        learned_at: datetime,
+        next_available_time: datetime,
+    ) -> set[UUID]:
+        """
+        Insert P1 progress rows with one multi-row
+        INSERT ... ON CONFLICT DO NOTHING RETURNING, and bump the learned
+        counters and the daily rollup for the inserted words.
+
+        Does not commit; the caller owns the transaction.
+
+        Returns:
+            Word ids that were actually inserted (already-learned words are skipped)
+        """
+        if not word_ids:
+            return set()
+
+        stmt = (
+            pg_insert(WordProgress)
+            .values([
+                {
+                    "user_id": user_id,
+                    "word_id": word_id,
+                    "pool": "P1",
+                    "learned_at": learned_at,
+                    "last_practice_time": learned_at,
+                    "next_available_time": next_available_time,
+                    "is_in_review_phase": False,
+                }
+                for word_id in word_ids
+            ])
+            .on_conflict_do_nothing(constraint="uq_user_word")
+            .returning(WordProgress.word_id)
+        )
+        inserted = set(self.db.execute(stmt).scalars().all())
+        self._add_learned_counts(user_id, inserted)
+        DailyActivityRepository(self.db).increment(
+            user_id, learned=len(inserted), activity_date=local_date(learned_at)
+        )
+        return inserted
+
     def update_progress(
         self,
         progress: WordProgress,
@@ -379,6 +758,10 @@ class ProgressRepository:
             .filter(WordProgress.user_id == user_id)
             .delete()
         )
+        self.db.query(UserLearnedCount).filter(
+            UserLearnedCount.user_id == user_id
+        ).delete()
+        DailyActivityRepository(self.db).clear_learned(user_id)
         self.db.commit()
         return count
 
@@ -402,39 +785,171 @@ class ProgressRepository:
         self.db.commit()
         return count
 
-    def get_pool_summary(self, user_id: UUID) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all words grouped by pool."""
-        # Get all progress records (P1-P6, R1-R5)
-        all_progress = self.get_user_progress(user_id)
+    def count_by_pool(self, user_id: UUID) -> Dict[str, int]:
+        """Count the user's progress rows per pool (P0 is not stored)."""
+        rows = (
+            self.db.query(WordProgress.pool, func.count(WordProgress.id))
+            .filter(WordProgress.user_id == user_id)
+            .group_by(WordProgress.pool)
+            .all()
+        )
+        return dict(rows)
 
-        pools: Dict[str, List[Dict[str, Any]]] = {
-            "P0": [], "P1": [], "P2": [], "P3": [], "P4": [], "P5": [], "P6": [],
-            "R1": [], "R2": [], "R3": [], "R4": [], "R5": [],
-        }
+    def get_pool_page(
+        self,
+        user_id: UUID,
+        pool: Optional[str],
+        limit: Optional[int],
+        after: Optional[Tuple[str, UUID]] = None,
+    ) -> List[tuple]:
+        """
+        Get one page of a stored pool (every stored pool if pool is None, and
+        every row if limit is None), keyset-paginated on
+        (next_available_time ASC NULLS LAST, word_id).
 
-        for progress in all_progress:
-            pools[progress.pool].append({
-                "word_id": str(progress.word_id),
-                "word": progress.word.word,
-                "translation": progress.word.translation,
-                "next_available_time": (
-                    progress.next_available_time.isoformat()
-                    if progress.next_available_time
-                    else None
-                ),
-            })
+        after is the (sort time, word_id) of the previous page's last row,
+        the sort time being an ISO timestamp or "infinity" for a NULL time
+        (see pool_page_sort_time).
+
+        Rows with a time are read as a range of the (user_id, pool,
+        next_available_time) index starting at the cursor, so a page costs
+        the same wherever it is in the pool. NULL-time rows (not written by
+        the app) come last, in word_id order.
+
+        Rows: (word_id, word, translation, pool, next_available_time).
+        """
+        next_time = WordProgress.next_available_time
+        query = (
+            self.db.query(
+                WordProgress.word_id,
+                Word.word,
+                Word.translation,
+                WordProgress.pool,
+                next_time,
+            )
+            .join(Word, Word.id == WordProgress.word_id)
+            .filter(WordProgress.user_id == user_id)
+        )
+        if pool is not None:
+            query = query.filter(WordProgress.pool == pool)
+
+        after_time = None
+        if after is not None and after[0] != "infinity":
+            after_time = datetime.fromisoformat(after[0])
+
+        rows = []
+        if after is None or after_time is not None:
+            timed = query.filter(next_time.isnot(None))
+            if after_time is not None:
+                # (t > :t) OR (t = :t AND id > :id); the redundant t >= :t
+                # bound is what turns it into an index range instead of a
+                # filter over every row before the cursor
+                timed = timed.filter(
+                    next_time >= after_time,
+                    or_(next_time > after_time, WordProgress.word_id > after[1]),
+                )
+            timed = timed.order_by(next_time, WordProgress.word_id)
+            if limit is not None:
+                timed = timed.limit(limit)
+            rows = timed.all()
+            if limit is not None and len(rows) >= limit:
+                return rows
+
+        untimed = query.filter(next_time.is_(None))
+        if after is not None and after_time is None:
+            untimed = untimed.filter(WordProgress.word_id > after[1])
+        untimed = untimed.order_by(WordProgress.word_id)
+        if limit is not None:
+            untimed = untimed.limit(limit - len(rows))
+        return rows + untimed.all()
+
+    def get_p0_page(
+        self,
+        user_id: UUID,
+        limit: Optional[int],
+        after_word_id: Optional[UUID] = None,
+    ) -> List[tuple]:
+        """
+        Get one page of P0 words (every one if limit is None),
+        keyset-paginated on word id.
+
+        Words are walked in primary key order and anti-joined against the
+        user's (user_id, word_id) unique index from the same cursor, so a
+        page reads the page plus the learned words inside it, not every
+        learned id.
+
+        Rows: (id, word, translation).
+        """
+        learned = (
+            select(WordProgress.word_id)
+            .where(WordProgress.user_id == user_id, WordProgress.word_id == Word.id)
+        )
+        query = self.db.query(Word.id, Word.word, Word.translation)
+        if after_word_id is not None:
+            query = query.filter(Word.id > after_word_id)
+            # Repeated on the inner side so its index scan starts at the cursor
+            learned = learned.where(WordProgress.word_id > after_word_id)
+        query = query.filter(~learned.exists()).order_by(Word.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_availability_snapshot(self, user_id: UUID) -> AvailabilitySnapshot:
+        """
+        Compute every availability counter in one statement using
+        conditional aggregates over the user's progress rows.
+        """
+        now = datetime.now(timezone.utc)
+        due = WordProgress.next_available_time <= now
+        in_r_pool = WordProgress.pool.in_(R_POOLS)
+        today_learned = (
+            select(UserDailyActivity.learned)
+            .where(
+                UserDailyActivity.user_id == user_id,
+                UserDailyActivity.activity_date == local_date(),
+            )
+            .scalar_subquery()
+        )
 
-        # Get P0 words (no progress record)
-        p0_words = self.get_p0_words(user_id)
-        for word in p0_words:
-            pools["P0"].append({
-                "word_id": str(word.id),
-                "word": word.word,
-                "translation": word.translation,
-                "next_available_time": None,
-            })
+        row = (
+            self.db.query(
+                self._p0_count(user_id).label("p0_count"),
+                func.coalesce(today_learned, 0).label("today_learned"),
+                func.count(WordProgress.id).filter(and_(
+                    WordProgress.pool == "P1",
+                    WordProgress.next_available_time <= now + timedelta(minutes=10),
+                )).label("p1_upcoming"),
+                func.count(WordProgress.id).filter(and_(
+                    WordProgress.pool.in_(P_PRACTICE_POOLS), due,
+                )).label("available_practice"),
+                func.count(WordProgress.id).filter(and_(
+                    in_r_pool, WordProgress.is_in_review_phase == False, due,
+                )).label("r_pool_practice"),
+                func.count(WordProgress.id).filter(and_(
+                    in_r_pool, WordProgress.is_in_review_phase == True, due,
+                )).label("available_review"),
+                func.count(WordProgress.id).filter(and_(
+                    WordProgress.next_available_time > now,
+                    WordProgress.next_available_time <= now + timedelta(hours=24),
+                )).label("upcoming_24h"),
+                func.min(WordProgress.next_available_time).filter(
+                    WordProgress.next_available_time > now
+                ).label("next_available_time"),
+            )
+            .filter(WordProgress.user_id == user_id)
+            .one()
+        )
 
-        return pools
+        return AvailabilitySnapshot(
+            today_learned=row.today_learned,
+            p1_upcoming=row.p1_upcoming,
+            p0_count=row.p0_count,
+            available_practice=row.available_practice,
+            r_pool_practice=row.r_pool_practice,
+            available_review=row.available_review,
+            upcoming_24h=row.upcoming_24h,
+            next_available_time=row.next_available_time,
+        )
 
     def can_learn(self, user_id: UUID) -> tuple[bool, Optional[str]]:
         """
@@ -443,22 +958,7 @@ class ProgressRepository:
         Returns:
             tuple: (can_learn, reason if cannot)
         """
-        # Check daily limit
-        today_learned = self.count_today_learned(user_id)
-        if today_learned >= DAILY_LEARN_LIMIT:
-            return False, "daily_limit_reached"
-
-        # Check P1 upcoming limit
-        p1_upcoming = self.count_p1_upcoming(user_id)
-        if p1_upcoming >= P1_UPCOMING_LIMIT:
-            return False, "p1_pool_full"
-
-        # Check if P0 has words
-        p0_count = self.count_p0_words(user_id)
-        if p0_count == 0:
-            return False, "no_words_in_p0"
-
-        return True, None
+        return self.get_availability_snapshot(user_id).can_learn()
 
     def can_practice(self, user_id: UUID) -> tuple[bool, Optional[str]]:
         """
@@ -468,13 +968,7 @@ class ProgressRepository:
         Returns:
             tuple: (can_practice, reason if cannot)
         """
-        p_pool_available = self.count_available_practice(user_id)
-        r_pool_available = self.count_r_pool_practice(user_id)
-        total_available = p_pool_available + r_pool_available
-
-        if total_available < PRACTICE_MIN_WORDS:
-            return False, "not_enough_words"
-        return True, None
+        return self.get_availability_snapshot(user_id).can_practice()
 
     def can_review(self, user_id: UUID) -> tuple[bool, Optional[str]]:
         """
@@ -483,7 +977,4 @@ class ProgressRepository:
         Returns:
             tuple: (can_review, reason if cannot)
         """
-        available = self.count_available_review(user_id)
-        if available < REVIEW_MIN_WORDS:
-            return False, "not_enough_words"
-        return True, None
+        return self.get_availability_snapshot(user_id).can_review()
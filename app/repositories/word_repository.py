@@ -1,9 +1,43 @@
-from typing import List, Optional
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session
 
 from app.models.word import Word
+from app.models.word_catalog_version import WORD_CATALOG_VERSION_ID, WordCatalogVersion
+from app.models.word_category import WordCategory
+from app.models.word_level import WordLevel
+from app.models.user_learned_count import UserLearnedCount
+from app.repositories.daily_activity_repository import DailyActivityRepository
+
+
+def sample_by_random_key(query: Query, limit: Optional[int]) -> List[Word]:
+    """
+    Take up to limit words from a Word query in random_key order, starting at
+    a random offset and wrapping around to the start of the range.
+
+    With an index ending in random_key this is an index range scan instead of
+    sorting the whole filtered set by random().
+    """
+    start = random.random()
+    if not limit:
+        return query.order_by(Word.random_key < start, Word.random_key).all()
+
+    words = (
+        query.filter(Word.random_key >= start)
+        .order_by(Word.random_key)
+        .limit(limit)
+        .all()
+    )
+    if len(words) < limit:
+        words += (
+            query.filter(Word.random_key < start)
+            .order_by(Word.random_key)
+            .limit(limit - len(words))
+            .all()
+        )
+    return words
 
 
 class WordRepository:
@@ -16,22 +50,136 @@ class WordRepository:
     def get_by_ids(self, word_ids: List[UUID]) -> List[Word]:
         return self.db.query(Word).filter(Word.id.in_(word_ids)).all()
 
+    def get_with_curriculum(self, word_ids: List[UUID]) -> List[tuple]:
+        """
+        Get words with their level/category ids and orders in one query.
+
+        Rows: (id, word, level_id, level_order, category_id, category_order).
+        Level and category columns are None when the word has none.
+        """
+        return (
+            self.db.query(
+                Word.id,
+                Word.word,
+                WordLevel.id.label("level_id"),
+                WordLevel.order.label("level_order"),
+                WordCategory.id.label("category_id"),
+                WordCategory.order.label("category_order"),
+            )
+            .outerjoin(WordLevel, WordLevel.id == Word.level_id)
+            .outerjoin(WordCategory, WordCategory.id == Word.category_id)
+            .filter(Word.id.in_(word_ids))
+            .all()
+        )
+
+    def get_curriculum_position(
+        self, level_id: Optional[int], category_id: Optional[int]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the (level order, category order) of a level and category in one
+        query. Either is None when its id is None.
+        """
+        level_order = select(WordLevel.order).where(WordLevel.id == level_id).scalar_subquery()
+        category_order = (
+            select(WordCategory.order).where(WordCategory.id == category_id).scalar_subquery()
+        )
+        row = self.db.query(level_order, category_order).one()
+        return row[0], row[1]
+
     def get_by_word(self, word: str) -> Optional[Word]:
         return self.db.query(Word).filter(Word.word == word).first()
 
     def get_all(self) -> List[Word]:
         return self.db.query(Word).all()
 
+    def iter_export_rows(self, batch_size: int) -> Iterator[tuple]:
+        """
+        Stream every word as a plain row, in id order, through a server-side
+        cursor that fetches batch_size rows at a time.
+
+        Rows: (id, word, translation, sentence, sentence_zh, image_url,
+        audio_url, level_id, category_id, created_at).
+        """
+        return iter(
+            self.db.query(
+                Word.id,
+                Word.word,
+                Word.translation,
+                Word.sentence,
+                Word.sentence_zh,
+                Word.image_url,
+                Word.audio_url,
+                Word.level_id,
+                Word.category_id,
+                Word.created_at,
+            )
+            .order_by(Word.id)
+            .yield_per(batch_size)
+        )
+
+    def get_catalog_version(self) -> int:
+        """
+        Version of the exported catalog, bumped by a trigger on every change
+        to words (see WordCatalogVersion); 0 if words were never written.
+        """
+        version = (
+            self.db.query(WordCatalogVersion.version)
+            .filter(WordCatalogVersion.id == WORD_CATALOG_VERSION_ID)
+            .scalar()
+        )
+        return version or 0
+
+    def get_catalog_rows(self) -> List[tuple]:
+        """
+        Get the columns needed to build option lists, as plain row tuples.
+
+        Skips ORM hydration so the full table can be loaded cheaply.
+        """
+        return (
+            self.db.query(
+                Word.id,
+                Word.word,
+                Word.translation,
+                Word.image_url,
+                Word.audio_url,
+                Word.level_id,
+                Word.category_id,
+            )
+            .order_by(Word.id)
+            .all()
+        )
+
+    def rotate_random_keys(self, after_id: Optional[UUID], batch_size: int) -> Optional[UUID]:
+        """
+        Reassign random_key for the next batch of words in id order.
+
+        Returns the last id updated, or None when there are no more words.
+        """
+        batch = self.db.query(Word.id).order_by(Word.id)
+        if after_id is not None:
+            batch = batch.filter(Word.id > after_id)
+        ids = [row.id for row in batch.limit(batch_size).all()]
+        if not ids:
+            return None
+
+        self.db.query(Word).filter(Word.id.in_(ids)).update(
+            {Word.random_key: func.random()}, synchronize_session=False
+        )
+        self.db.commit()
+        return ids[-1]
+
+    def get_curriculum_orders(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Get the level id -> order and category id -> order maps."""
+        level_orders = dict(self.db.query(WordLevel.id, WordLevel.order).all())
+        category_orders = dict(self.db.query(WordCategory.id, WordCategory.order).all())
+        return level_orders, category_orders
+
     def count(self) -> int:
         return self.db.query(Word).count()
 
     def get_random_words_by_level(self, level_id: int, limit: int) -> List[Word]:
-        return (
-            self.db.query(Word)
-            .filter(Word.level_id == level_id)
-            .order_by(func.random())
-            .limit(limit)
-            .all()
+        return sample_by_random_key(
+            self.db.query(Word).filter(Word.level_id == level_id), limit
         )
 
     def create(
@@ -96,5 +244,8 @@ class WordRepository:
         """Delete all words and return count."""
         count = self.db.query(Word).count()
         self.db.query(Word).delete()
+        # Progress cascades with the words; the learned counters must follow
+        self.db.query(UserLearnedCount).delete()
+        DailyActivityRepository(self.db).clear_learned()
         self.db.commit()
         return count
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Iterator, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.admin import (
@@ -15,6 +17,8 @@ from app.schemas.admin import (
 from app.repositories.progress_repository import ProgressRepository
 from app.repositories.word_repository import WordRepository
 from app.repositories.user_repository import UserRepository
+from app.services.word_catalog import invalidate_word_catalog
+from app.utils.constants import WORD_EXPORT_BATCH_SIZE
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -73,6 +77,10 @@ def seed_words(
     words_data = [w.model_dump() for w in request.words]
     imported, skipped = word_repo.bulk_create(words_data)
 
+    # Session endpoints read distractors from the cached catalog
+    if request.clear_existing or imported:
+        invalidate_word_catalog()
+
     # Note: New words will be picked up when users call /api/auth/login
     # or we could add logic here to initialize progress for existing users
 
@@ -83,27 +91,87 @@ def seed_words(
     )
 
 
-@router.get("/words", response_model=WordsListResponse)
-def get_all_words(db: Session = Depends(get_db)):
-    """Get all words in the database."""
-    word_repo = WordRepository(db)
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
 
-    words = word_repo.get_all()
-    total_count = len(words)
-
-    return WordsListResponse(
-        words=[
-            WordOutput(
-                id=str(w.id),
-                word=w.word,
-                translation=w.translation,
-                sentence=w.sentence,
-                sentence_zh=w.sentence_zh,
-                image_url=w.image_url,
-                audio_url=w.audio_url,
-                created_at=w.created_at,
-            )
-            for w in words
-        ],
-        total_count=total_count,
+def _stream_words(export_format: str) -> Iterator[bytes]:
+    """
+    Serialize every word, one batch per chunk.
+
+    Uses its own session: request dependencies are closed before a
+    streaming body is sent.
+    """
+    db = SessionLocal()
+    try:
+        rows = WordRepository(db).iter_export_rows(WORD_EXPORT_BATCH_SIZE)
+        ndjson = export_format == "ndjson"
+        if not ndjson:
+            yield b'{"words":['
+
+        total_count = 0
+        batch = []
+        for row in rows:
+            line = WordOutput(
+                id=str(row.id),
+                word=row.word,
+                translation=row.translation,
+                sentence=row.sentence,
+                sentence_zh=row.sentence_zh,
+                image_url=row.image_url,
+                audio_url=row.audio_url,
+                level_id=row.level_id,
+                category_id=row.category_id,
+                created_at=row.created_at,
+            ).model_dump_json()
+            if ndjson:
+                batch.append(line + "\n")
+            else:
+                batch.append(("," if total_count else "") + line)
+            total_count += 1
+            if len(batch) == WORD_EXPORT_BATCH_SIZE:
+                yield "".join(batch).encode("utf-8")
+                batch = []
+
+        if batch:
+            yield "".join(batch).encode("utf-8")
+        if not ndjson:
+            yield f'],"total_count":{total_count}}}'.encode("utf-8")
+    finally:
+        db.close()
+
+
+@router.get(
+    "/words",
+    response_model=WordsListResponse,
+    responses={304: {"description": "Catalog unchanged since the given ETag"}},
+)
+def get_all_words(
+    export_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Get all words in the database.
+
+    The body is streamed from a server-side cursor, either as the usual JSON
+    object or as NDJSON (one word per line) with format=ndjson. The ETag is
+    the catalog version, which a database trigger bumps on any change to
+    the words, so it is the same on every worker and a poll with a matching
+    If-None-Match costs one primary-key lookup.
+    """
+    etag = f'"{WordRepository(db).get_catalog_version()}-{export_format}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    media_type = "application/x-ndjson" if export_format == "ndjson" else "application/json"
+    return StreamingResponse(
+        _stream_words(export_format),
+        media_type=media_type,
+        headers={"ETag": etag},
     )
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends
+import base64
+from datetime import datetime
+from typing import List, Optional, Union
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
-from app.schemas.home import StatsResponse, WordPoolResponse, WordPoolItem
+from app.schemas.home import StatsResponse, WordPoolResponse, WordPoolPageResponse, WordPoolItem
 from app.repositories.answer_history_repository import AnswerHistoryRepository
-from app.repositories.progress_repository import ProgressRepository
+from app.repositories.progress_repository import ProgressRepository, pool_page_sort_time
 from app.repositories.word_repository import WordRepository
+from app.utils.constants import PoolType, WORD_POOL_PAGE_SIZE, WORD_POOL_MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/api/home", tags=["home"])
 
@@ -22,34 +27,25 @@ def get_stats(
     answer_history_repo = AnswerHistoryRepository(db)
     user_id = current_user.id
 
-    today_learned = progress_repo.count_today_learned(user_id)
+    snapshot = progress_repo.get_availability_snapshot(user_id)
     today_completed = answer_history_repo.count_today_completed(user_id)
-    # Include both P pool practice and R pool practice phase
-    available_practice = (
-        progress_repo.count_available_practice(user_id) +
-        progress_repo.count_r_pool_practice(user_id)
-    )
-    available_review = progress_repo.count_available_review(user_id)
-    upcoming_24h = progress_repo.count_upcoming_24h(user_id)
-
-    can_learn, _ = progress_repo.can_learn(user_id)
-    can_practice, _ = progress_repo.can_practice(user_id)
-    can_review, _ = progress_repo.can_review(user_id)
 
-    next_available_time = None
-    if not can_learn and not can_practice and not can_review:
-        next_available_time = progress_repo.get_next_available_time(user_id)
+    can_learn, _ = snapshot.can_learn()
+    can_practice, _ = snapshot.can_practice()
+    can_review, _ = snapshot.can_review()
 
     return StatsResponse(
-        today_learned=today_learned,
+        today_learned=snapshot.today_learned,
         today_completed=today_completed,
-        available_practice=available_practice,
-        available_review=available_review,
-        upcoming_24h=upcoming_24h,
+        # Include both P pool practice and R pool practice phase
+        available_practice=snapshot.total_practice,
+        available_review=snapshot.available_review,
+        upcoming_24h=snapshot.upcoming_24h,
         can_learn=can_learn,
         can_practice=can_practice,
         can_review=can_review,
-        next_available_time=next_available_time,
+        # Only return next_available_time when all actions are unavailable
+        next_available_time=snapshot.idle_next_available_time(),
         current_level={
             "id": current_user.current_level.id,
             "order": current_user.current_level.order,
@@ -63,26 +59,110 @@ def get_stats(
     )
 
 
-@router.get("/word-pool", response_model=WordPoolResponse)
+def _encode_cursor(*parts) -> str:
+    raw = "|".join(str(p) for p in parts)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> List[str]:
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _pool_item(word_id, word, translation, next_available_time) -> WordPoolItem:
+    return WordPoolItem(
+        word_id=str(word_id),
+        word=word,
+        translation=translation,
+        next_available_time=(
+            next_available_time.isoformat()
+            if next_available_time
+            else None
+        ),
+    )
+
+
+@router.get("/word-pool", response_model=Union[WordPoolPageResponse, WordPoolResponse])
 def get_word_pool(
+    pool: Optional[PoolType] = None,
+    limit: Optional[int] = Query(None, ge=1, le=WORD_POOL_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all words grouped by pool (for debugging)."""
+    """
+    Get words by pool (for debugging).
+
+    Without parameters, returns every word grouped by pool, as before
+    pagination was added. With pool, limit or cursor, returns the counts per
+    pool and, when a pool is given, one page of its words: pass next_cursor
+    back as cursor to continue.
+    """
     progress_repo = ProgressRepository(db)
     word_repo = WordRepository(db)
+    user_id = current_user.id
 
-    pools = progress_repo.get_pool_summary(current_user.id)
     total_count = word_repo.count()
 
-    # Convert to response format
-    formatted_pools = {}
-    for pool_name, items in pools.items():
-        formatted_pools[pool_name] = [
-            WordPoolItem(**item) for item in items
+    if pool is None and limit is None and cursor is None:
+        pools = {p.value: [] for p in PoolType}
+        for row in progress_repo.get_pool_page(user_id, None, None):
+            pools[row.pool].append(
+                _pool_item(row.word_id, row.word, row.translation, row.next_available_time)
+            )
+        for row in progress_repo.get_p0_page(user_id, None):
+            pools[PoolType.P0.value].append(_pool_item(row.id, row.word, row.translation, None))
+        return WordPoolResponse(pools=pools, total_count=total_count)
+
+    stored = progress_repo.count_by_pool(user_id)
+    counts = {p.value: stored.get(p.value, 0) for p in PoolType}
+    counts[PoolType.P0.value] = total_count - sum(stored.values())
+
+    if pool is None:
+        return WordPoolPageResponse(counts=counts, total_count=total_count)
+
+    # Fetch one extra row to know whether there is a next page
+    limit = limit or WORD_POOL_PAGE_SIZE
+    items = []
+    next_cursor = None
+    if pool == PoolType.P0:
+        after_word_id = None
+        if cursor:
+            try:
+                after_word_id = UUID(_decode_cursor(cursor)[0])
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        rows = progress_repo.get_p0_page(user_id, limit + 1, after_word_id)
+        items = [_pool_item(row.id, row.word, row.translation, None) for row in rows[:limit]]
+        if len(rows) > limit:
+            next_cursor = _encode_cursor(rows[limit - 1].id)
+    else:
+        after = None
+        if cursor:
+            parts = _decode_cursor(cursor)
+            try:
+                if parts[0] != "infinity":
+                    datetime.fromisoformat(parts[0])
+                after = (parts[0], UUID(parts[1]))
+            except (ValueError, IndexError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        rows = progress_repo.get_pool_page(user_id, pool.value, limit + 1, after)
+        items = [
+            _pool_item(row.word_id, row.word, row.translation, row.next_available_time)
+            for row in rows[:limit]
         ]
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = _encode_cursor(pool_page_sort_time(last.next_available_time), last.word_id)
 
-    return WordPoolResponse(
-        pools=formatted_pools,
+    return WordPoolPageResponse(
+        counts=counts,
         total_count=total_count,
+        pool=pool.value,
+        items=items,
+        next_cursor=next_cursor,
     )
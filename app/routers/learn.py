@@ -16,8 +16,7 @@ from app.repositories.progress_repository import ProgressRepository
 from app.repositories.word_repository import WordRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.answer_history_repository import AnswerHistoryRepository
-from app.models.word_level import WordLevel
-from app.models.word_category import WordCategory
+from app.services.word_catalog import get_word_catalog
 from app.services.session_service import build_learn_exercise, build_word_detail, build_next_review
 from app.services.spaced_repetition import get_next_available_time
 from app.utils.constants import LEARN_SESSION_SIZE
@@ -32,11 +31,10 @@ def get_learn_session(
 ):
     """Get a learning session with 5 new words."""
     progress_repo = ProgressRepository(db)
-    word_repo = WordRepository(db)
     user_id = current_user.id
 
     # Check if can learn
-    can_learn, reason = progress_repo.can_learn(user_id)
+    can_learn, reason = progress_repo.get_availability_snapshot(user_id).can_learn()
     if not can_learn:
         # Check if actually completed everything or just daily limit
         # can_learn returns "no_words_in_p0" if totally empty
@@ -57,72 +55,41 @@ def get_learn_session(
         )
 
     # Strategy:
-    # 1. Fetch from current (level, category)
-    # 2. If valid but < SIZE, fetch from next category/level in loop until full
-    
-    session_words = []
-    
-    # Get all levels and categories ordered for traversal
-    levels = db.query(WordLevel).order_by(WordLevel.order).all()
-    categories = db.query(WordCategory).order_by(WordCategory.order).all()
-    
-    # Build lookup maps for fast access
-    level_map = {l.id: l for l in levels}
-    category_map = {c.id: c for c in categories}
-    
-    # Find current indices in the ordered lists
-    curr_level_idx = -1
-    for i, l in enumerate(levels):
-        if l.id == current_level_id:
-            curr_level_idx = i
-            break
-            
-    curr_cat_idx = -1
-    for i, c in enumerate(categories):
-        if c.id == current_category_id:
-            curr_cat_idx = i
-            break
-
-    # Start loop
-    temp_level_idx = curr_level_idx
-    temp_cat_idx = curr_cat_idx
-    
-    # Safety break: if we still have -1 (e.g. invalid IDs)
-    if temp_level_idx == -1 or temp_cat_idx == -1:
-         # Fallback if pointers invalid
-         p0_words = progress_repo.get_p0_words(user_id, limit=LEARN_SESSION_SIZE)
-         session_words = p0_words
-    else: 
-        while len(session_words) < LEARN_SESSION_SIZE:
-             # Check bounds
-             if temp_level_idx >= len(levels):
-                 break # End of content
-             
-             target_level = levels[temp_level_idx]
-             
-             if temp_cat_idx >= len(categories):
-                 # Move to next level, first category
-                 temp_level_idx += 1
-                 temp_cat_idx = 0
-                 continue
-                 
-             target_cat = categories[temp_cat_idx]
-             
-             needed = LEARN_SESSION_SIZE - len(session_words)
-             fetched = progress_repo.get_p0_words(
-                 user_id, 
-                 limit=needed, 
-                 level_id=target_level.id, 
-                 category_id=target_cat.id,
-                 randomize=True
-             )
-             
-             # Filter out duplicates if any (though get_p0_words excludes learned, and we move linearly)
-             # But we might double fetch if logic is wrong. Here we are fetching IDs we haven't seen.
-             session_words.extend(fetched)
-             
-             # Move to next category for next iteration if needed
-             temp_cat_idx += 1
+    # 1. Walk the cached curriculum from the current (level, category)
+    # 2. Skip buckets the learned counters say are exhausted, and stop once
+    #    the remaining buckets hold enough P0 words for a session
+    # 3. Fetch from those buckets in one query, in curriculum order
+    # The cached curriculum is only a hint: it misses words seeded on other
+    # workers since it was loaded, so a short result is retried against the
+    # database from the current position, then over all P0 words
+    catalog = get_word_catalog(db)
+    buckets = catalog.buckets_from(current_level_id, current_category_id)
+
+    if buckets is None:
+        # Fallback if pointers invalid
+        session_words = progress_repo.get_p0_words(user_id, limit=LEARN_SESSION_SIZE)
+    else:
+        learned_counts = progress_repo.get_learned_counts(user_id)
+        needed_buckets = []
+        remaining = 0
+        for bucket in buckets:
+            left = catalog.bucket_size(*bucket) - learned_counts.get(bucket, 0)
+            if left <= 0:
+                continue
+            needed_buckets.append(bucket)
+            remaining += left
+            if remaining >= LEARN_SESSION_SIZE:
+                break
+
+        session_words = progress_repo.get_p0_words_in_buckets(
+            user_id, needed_buckets, limit=LEARN_SESSION_SIZE
+        )
+        if len(session_words) < LEARN_SESSION_SIZE:
+            session_words = progress_repo.get_p0_words_from(
+                user_id, current_level_id, current_category_id, limit=LEARN_SESSION_SIZE
+            )
+        if not session_words:
+            session_words = progress_repo.get_p0_words(user_id, limit=LEARN_SESSION_SIZE)
 
     if not session_words:
         return LearnSessionResponse(
@@ -132,9 +99,6 @@ def get_learn_session(
             exercises=[],
         )
 
-    # Get all words for generating options (distractors)
-    all_words = word_repo.get_all()
-
     # Build word details and exercises
     words = []
     exercises = []
@@ -143,7 +107,7 @@ def get_learn_session(
         words.append(WordDetailSchema(**build_word_detail(word)))
 
         # Build exercise
-        exercise_data = build_learn_exercise(word, all_words, session_words)
+        exercise_data = build_learn_exercise(word, catalog, session_words)
         exercises.append(ExerciseSchema(
             word_id=exercise_data["word_id"],
             type=exercise_data["type"],
@@ -174,48 +138,61 @@ def complete_learn(
 
     now = datetime.now(timezone.utc)
     next_time = get_next_available_time("P1")
-    words_moved = 0
-
-    # Build word_id to word mapping for answer history
-    word_id_to_word = {}
 
+    word_ids = []
     for word_id_str in request.word_ids:
         try:
-            word_id = UUID(word_id_str)
+            word_ids.append(UUID(word_id_str))
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid word_id: {word_id_str}")
 
-        # Check if word exists
-        word = word_repo.get_by_id(word_id)
-        if not word:
+    # Validate every word in one query, joined to its level and category
+    words_by_id = {row.id: row for row in word_repo.get_with_curriculum(word_ids)}
+    for word_id_str, word_id in zip(request.word_ids, word_ids):
+        if word_id not in words_by_id:
             raise HTTPException(status_code=404, detail=f"Word not found: {word_id_str}")
 
-        # Store word for answer history
-        word_id_to_word[word_id_str] = word.word
-
-        # Check if already has progress record (not in P0)
-        existing_progress = progress_repo.get_by_user_and_word(user_id, word_id)
-        if existing_progress:
+    # Create P1 progress records; words that already have one are not in P0
+    inserted = progress_repo.bulk_create_learned(user_id, word_ids, now, next_time)
+    seen = set()
+    for word_id_str, word_id in zip(request.word_ids, word_ids):
+        if word_id in seen or word_id not in inserted:
+            db.rollback()
             raise HTTPException(status_code=400, detail=f"Word {word_id_str} is not in P0 pool")
+        seen.add(word_id)
+    words_moved = len(inserted)
 
-        # Create new progress record for P1
-        progress_repo.create_progress(
-            user_id=user_id,
-            word_id=word_id,
-            pool="P1",
-            learned_at=now,
-            last_practice_time=now,
-            next_available_time=next_time,
+    # Update User Level/Category Logic
+    # Advance to the highest (level_order, category_order) among the learned
+    # words, taken from the same validated rows
+    best = None
+    for w in words_by_id.values():
+        if w.level_id is None or w.category_id is None:
+            continue
+        if best is None or (w.level_order, w.category_order) > best[:2]:
+            best = (w.level_order, w.category_order, w.level_id, w.category_id)
+
+    if best is not None:
+        # The user's position is read from the database, like the words'
+        # orders; a level or category the user does not have sorts first
+        position = tuple(
+            float("-inf") if order is None else order
+            for order in word_repo.get_curriculum_position(
+                current_user.current_level_id, current_user.current_category_id
+            )
         )
-        words_moved += 1
+        if best[:2] > position:
+            current_user.current_level_id = best[2]
+            current_user.current_category_id = best[3]
 
     # Record answer history
     answer_records = []
     for answer in request.answers:
+        word = words_by_id.get(UUID(answer.word_id))
         answer_records.append({
             "user_id": user_id,
             "word_id": UUID(answer.word_id),
-            "word": word_id_to_word.get(answer.word_id, ""),
+            "word": word.word if word else "",
             "is_correct": answer.correct,
             "exercise_type": answer.exercise_type,
             "source": "learn",
@@ -224,68 +201,18 @@ def complete_learn(
             "response_time_ms": answer.response_time_ms,
         })
     if answer_records:
-        answer_history_repo.create_answers_batch(answer_records)
-        
-    # Update User Level/Category Logic
-    # 1. Get all completed words objects to check their levels
-    completed_word_ids = [UUID(wid) for wid in request.word_ids]
-    completed_words = word_repo.get_by_ids(completed_word_ids)
-
-    # 2. Find max rank
-    # Use 0 as default if level/category is missing
-    max_level_order = -1
-    max_cat_order = -1
-    max_level_id = current_user.current_level_id
-    max_cat_id = current_user.current_category_id
-    
-    # Helper to get order
-    # (Optimized: we could join or pre-fetch, but for 5 words individual lazy loads or small queries are ok)
-    # Actually word.level and word.category are relationships, let's assume they are joined or eager loaded?
-    # word_repo.get_all() doesn't join by default but get_by_ids uses simple query.
-    # Safe to access attributes, SQLAlchemy will lazy load.
-    
-    for w in completed_words:
-        if not w.level or not w.category:
-            continue
-            
-        w_l_order = w.level.order
-        w_c_order = w.category.order
-        
-        # Compare tuple (level_order, cat_order)
-        if (w_l_order > max_level_order) or \
-           (w_l_order == max_level_order and w_c_order > max_cat_order):
-            max_level_order = w_l_order
-            max_cat_order = w_c_order
-            max_level_id = w.level.id
-            max_cat_id = w.category.id
-            
-    # 3. Compare with user current
-    current_level = db.query(WordLevel).filter(WordLevel.id == current_user.current_level_id).first()
-    current_cat = db.query(WordCategory).filter(WordCategory.id == current_user.current_category_id).first()
-
-    curr_l_order = current_level.order if current_level else 0
-    curr_c_order = current_cat.order if current_cat else 0
-
-    if (max_level_order > curr_l_order) or \
-       (max_level_order == curr_l_order and max_cat_order > curr_c_order):
-        # Update user
-        current_user.current_level_id = max_level_id
-        current_user.current_category_id = max_cat_id
-        db.commit()
+        answer_history_repo.add_answers(answer_records)
 
-    today_learned = progress_repo.count_today_learned(user_id)
+    # Progress, answer history and the curriculum advance share one transaction
+    db.commit()
 
     # Only return next_available_time when all actions are unavailable
-    next_available_time = None
-    can_learn, _ = progress_repo.can_learn(user_id)
-    can_practice, _ = progress_repo.can_practice(user_id)
-    can_review, _ = progress_repo.can_review(user_id)
-    if not can_learn and not can_practice and not can_review:
-        next_available_time = progress_repo.get_next_available_time(user_id)
+    snapshot = progress_repo.get_availability_snapshot(user_id)
+    next_available_time = snapshot.idle_next_available_time()
 
     return LearnCompleteResponse(
         success=True,
         words_moved=words_moved,
-        today_learned=today_learned,
+        today_learned=snapshot.today_learned,
         next_available_time=next_available_time,
     )
@@ -16,6 +16,7 @@ from app.repositories.word_repository import WordRepository
 from app.models.user import User
 from app.models.word_level import WordLevel
 from app.models.word_category import WordCategory
+from app.services.word_catalog import get_word_catalog
 from app.services.session_service import generate_options
 from app.utils.constants import ExerciseType
 
@@ -33,8 +34,8 @@ def get_analysis_session(
     # Get all levels ordered
     levels = db.query(WordLevel).order_by(WordLevel.order).all()
     
-    # Get all words for generating options (distractors)
-    all_words = word_repo.get_all()
+    # Cached word catalog for generating options (distractors)
+    catalog = get_word_catalog(db)
     
     exercises: List[LevelAnalysisExerciseSchema] = []
     
@@ -44,7 +45,7 @@ def get_analysis_session(
         
         for word in words:
             # Generate options
-            options, correct_index = generate_options(word, all_words)
+            options, correct_index = generate_options(word, catalog)
             
             exercises.append(LevelAnalysisExerciseSchema(
                 word_id=str(word.id),
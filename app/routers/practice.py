@@ -14,8 +14,8 @@ from app.schemas.practice import (
 )
 from app.schemas.common import ExerciseWithWordSchema, OptionSchema, AnswerResultSchema
 from app.repositories.progress_repository import ProgressRepository
-from app.repositories.word_repository import WordRepository
 from app.repositories.answer_history_repository import AnswerHistoryRepository
+from app.services.word_catalog import get_word_catalog
 from app.services.session_service import (
     build_exercise,
     build_next_review,
@@ -38,11 +38,10 @@ def get_practice_session(
 ):
     """Get a practice session with 5 words."""
     progress_repo = ProgressRepository(db)
-    word_repo = WordRepository(db)
     user_id = current_user.id
 
     # Check if can practice
-    can_practice, reason = progress_repo.can_practice(user_id)
+    can_practice, reason = progress_repo.get_availability_snapshot(user_id).can_practice()
     if not can_practice:
         return PracticeSessionResponse(
             available=False,
@@ -51,14 +50,10 @@ def get_practice_session(
             exercise_order=[],
         )
 
-    # Get available practice words from P pools
-    p_pool_progress = progress_repo.get_available_practice_words(user_id)
-
-    # Get available practice words from R pools (practice phase, not review phase)
-    r_pool_progress = progress_repo.get_r_pool_practice_words(user_id)
-
-    # Combine and limit
-    available_progress = (p_pool_progress + r_pool_progress)[:PRACTICE_SESSION_SIZE]
+    # Due P pool words first, then R pool words in practice phase (not review phase)
+    available_progress = progress_repo.get_practice_due_queue(
+        user_id, limit=PRACTICE_SESSION_SIZE
+    )
 
     if len(available_progress) < PRACTICE_SESSION_SIZE:
         return PracticeSessionResponse(
@@ -68,8 +63,8 @@ def get_practice_session(
             exercise_order=[],
         )
 
-    # Get all words for generating options
-    all_words = word_repo.get_all()
+    # Cached word catalog for generating options (distractors)
+    catalog = get_word_catalog(db)
     session_words = [p.word for p in available_progress]
 
     # Build exercises
@@ -78,7 +73,7 @@ def get_practice_session(
         exercise = build_exercise(
             progress.word,
             progress.pool,
-            all_words,
+            catalog,
             session_words,
         )
         exercises_data.append(exercise)
@@ -128,17 +123,27 @@ def submit_practice(
     incorrect_count = 0
     answer_records = []
 
+    word_ids = []
     for answer in request.answers:
         try:
-            word_id = UUID(answer.word_id)
+            word_ids.append(UUID(answer.word_id))
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid word_id: {answer.word_id}")
 
-        progress = progress_repo.get_by_user_and_word(user_id, word_id)
+    # One IN query for every targeted row, locked until the commit below
+    progress_by_word = progress_repo.get_by_user_and_words_for_update(user_id, word_ids)
+
+    # Transitions are computed in memory; the current pool is tracked per word
+    # so repeated answers for one word chain like sequential updates would
+    current_pools = {}
+    updates = {}
+
+    for answer, word_id in zip(request.answers, word_ids):
+        progress = progress_by_word.get(word_id)
         if not progress:
             raise HTTPException(status_code=404, detail=f"Progress not found for word: {answer.word_id}")
 
-        previous_pool = progress.pool
+        previous_pool = current_pools.get(word_id, progress.pool)
 
         # Determine source based on pool (P pool = practice, R pool = review_practice)
         source = "review_practice" if previous_pool.startswith("R") else "practice"
@@ -147,7 +152,7 @@ def submit_practice(
         answer_records.append({
             "user_id": user_id,
             "word_id": word_id,
-            "word": progress.word.word,
+            "word": progress.word,
             "is_correct": answer.correct,
             "exercise_type": answer.exercise_type,
             "source": source,
@@ -163,14 +168,14 @@ def submit_practice(
             new_pool, next_time, is_review = process_incorrect_answer(previous_pool)
             incorrect_count += 1
 
-        # Update progress
-        progress_repo.update_progress(
-            progress,
-            pool=new_pool,
-            last_practice_time=now,
-            next_available_time=next_time,
-            is_in_review_phase=is_review,
-        )
+        current_pools[word_id] = new_pool
+        updates[progress.id] = {
+            "id": progress.id,
+            "pool": new_pool,
+            "last_practice_time": now,
+            "next_available_time": next_time,
+            "is_in_review_phase": is_review,
+        }
 
         results.append(AnswerResultSchema(
             word_id=answer.word_id,
@@ -180,17 +185,15 @@ def submit_practice(
             next_available_time=next_time,
         ))
 
-    # Save answer history
+    # One bulk UPDATE and one bulk INSERT, committed together
+    progress_repo.bulk_update_progress(list(updates.values()))
     if answer_records:
-        answer_history_repo.create_answers_batch(answer_records)
+        answer_history_repo.add_answers(answer_records)
+    db.commit()
 
     # Only return next_available_time when all actions are unavailable
-    next_available_time = None
-    can_learn, _ = progress_repo.can_learn(user_id)
-    can_practice, _ = progress_repo.can_practice(user_id)
-    can_review, _ = progress_repo.can_review(user_id)
-    if not can_learn and not can_practice and not can_review:
-        next_available_time = progress_repo.get_next_available_time(user_id)
+    snapshot = progress_repo.get_availability_snapshot(user_id)
+    next_available_time = snapshot.idle_next_available_time()
 
     return PracticeSubmitResponse(
         success=True,
@@ -17,8 +17,8 @@ from app.schemas.common import (
     OptionSchema,
 )
 from app.repositories.progress_repository import ProgressRepository
-from app.repositories.word_repository import WordRepository
 from app.repositories.answer_history_repository import AnswerHistoryRepository
+from app.services.word_catalog import get_word_catalog
 from app.services.session_service import build_word_detail, build_exercise, build_next_review
 from app.services.spaced_repetition import complete_review_phase
 from app.utils.constants import REVIEW_MAX_WORDS
@@ -33,11 +33,10 @@ def get_review_session(
 ):
     """Get a review session with 3-5 words in review phase."""
     progress_repo = ProgressRepository(db)
-    word_repo = WordRepository(db)
     user_id = current_user.id
 
     # Check if can review
-    can_review, reason = progress_repo.can_review(user_id)
+    can_review, reason = progress_repo.get_availability_snapshot(user_id).can_review()
     if not can_review:
         return ReviewSessionResponse(
             available=False,
@@ -59,8 +58,8 @@ def get_review_session(
             exercises=[],
         )
 
-    # Get all words for generating options
-    all_words = word_repo.get_all()
+    # Cached word catalog for generating options (distractors)
+    catalog = get_word_catalog(db)
     session_words = [p.word for p in available_progress]
 
     # Build word details and exercises
@@ -75,7 +74,7 @@ def get_review_session(
         words.append(WordDetailWithPoolSchema(**word_detail))
 
         # Build exercise
-        exercise_data = build_exercise(word, progress.pool, all_words, session_words)
+        exercise_data = build_exercise(word, progress.pool, catalog, session_words)
         exercises.append(ExerciseSchema(
             word_id=exercise_data["word_id"],
             type=exercise_data["type"],
@@ -107,18 +106,23 @@ def complete_review(
     user_id = current_user.id
 
     now = datetime.now(timezone.utc)
-    words_completed = 0
-
-    # Build word_id to pool mapping for answer history
-    word_id_to_info = {}
 
+    word_ids = []
     for word_id_str in request.word_ids:
         try:
-            word_id = UUID(word_id_str)
+            word_ids.append(UUID(word_id_str))
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid word_id: {word_id_str}")
 
-        progress = progress_repo.get_by_user_and_word(user_id, word_id)
+    # One IN query for every targeted row, locked until the commit below
+    progress_by_word = progress_repo.get_by_user_and_words_for_update(user_id, word_ids)
+
+    # Build word_id to pool mapping for answer history
+    word_id_to_info = {}
+    updates = {}
+
+    for word_id_str, word_id in zip(request.word_ids, word_ids):
+        progress = progress_by_word.get(word_id)
         if not progress:
             raise HTTPException(status_code=404, detail=f"Progress not found for word: {word_id_str}")
 
@@ -127,22 +131,20 @@ def complete_review(
 
         # Store info for answer history
         word_id_to_info[word_id_str] = {
-            "word": progress.word.word,
+            "word": progress.word,
             "pool": progress.pool,
         }
 
         # Complete review phase
         next_time, is_review = complete_review_phase(progress.pool)
-
-        progress_repo.update_progress(
-            progress,
-            last_practice_time=now,
-            next_available_time=next_time,
-            is_in_review_phase=is_review,
-            review_completed_time=now,
-        )
-
-        words_completed += 1
+        updates[progress.id] = {
+            "id": progress.id,
+            "pool": progress.pool,
+            "last_practice_time": now,
+            "next_available_time": next_time,
+            "is_in_review_phase": is_review,
+            "review_completed_time": now,
+        }
 
     # Record answer history for review_learn
     answer_records = []
@@ -159,19 +161,19 @@ def complete_review(
             "user_answer": answer.user_answer,
             "response_time_ms": answer.response_time_ms,
         })
+
+    # One bulk UPDATE and one bulk INSERT, committed together
+    progress_repo.bulk_update_progress(list(updates.values()))
     if answer_records:
-        answer_history_repo.create_answers_batch(answer_records)
+        answer_history_repo.add_answers(answer_records)
+    db.commit()
 
     # Only return next_available_time when all actions are unavailable
-    next_available_time = None
-    can_learn, _ = progress_repo.can_learn(user_id)
-    can_practice, _ = progress_repo.can_practice(user_id)
-    can_review, _ = progress_repo.can_review(user_id)
-    if not can_learn and not can_practice and not can_review:
-        next_available_time = progress_repo.get_next_available_time(user_id)
+    snapshot = progress_repo.get_availability_snapshot(user_id)
+    next_available_time = snapshot.idle_next_available_time()
 
     return ReviewCompleteResponse(
         success=True,
-        words_completed=words_completed,
+        words_completed=len(word_ids),
         next_available_time=next_available_time,
     )
@@ -1,3 +1,6 @@
+import asyncio
+import hashlib
+import io
 from typing import Optional
 from uuid import UUID
 
@@ -10,7 +13,12 @@ from app.models.user import User
 from app.models.speech_log import SpeechLog
 from app.schemas.speech import SpeechTranscribeResponse
 from app.repositories.word_repository import WordRepository
-from app.services.speech_service import speech_service, MAX_FILE_SIZE_BYTES
+from app.services.speech_service import (
+    speech_service,
+    read_upload_capped,
+    MAX_FILE_SIZE_BYTES,
+    UPLOAD_CHUNK_SIZE,
+)
 
 router = APIRouter(prefix="/api/speech", tags=["speech"])
 
@@ -30,8 +38,11 @@ async def transcribe_speech(
     Transcribe speech audio for vocabulary practice.
 
     - Accepts multipart/form-data with audio file and metadata
-    - Saves audio to local filesystem (dev) or GCS (production)
-    - Uses Google Cloud Speech-to-Text for transcription
+    - Saves audio to local filesystem (dev) or GCS (production), once per
+      distinct recording (the path is the SHA-256 of the bytes)
+    - Transcribes with the configured speech-to-text backend (Google Cloud
+      Speech-to-Text in production), cached by content
+    - Saving and transcription run concurrently off the event loop
     - Logs the attempt for analytics
     """
     # Validate platform
@@ -59,42 +70,44 @@ async def transcribe_speech(
             error="Word not found"
         )
 
-    # Validate audio format
+    # Validate audio format (falling back to the header in the first chunk)
+    head = await audio.read(UPLOAD_CHUNK_SIZE)
+    await audio.seek(0)
     is_valid, extension, error = speech_service.validate_audio_format(
-        audio.filename or "", audio.content_type or ""
+        audio.filename or "", audio.content_type or "", head
     )
     if not is_valid:
         return SpeechTranscribeResponse(success=False, error=error)
 
-    # Read audio content
-    audio_data = await audio.read()
-
-    # Validate file size
-    if len(audio_data) > MAX_FILE_SIZE_BYTES:
+    # Read audio content in chunks, giving up as soon as it is too large
+    # (bodies far above the cap are already refused by BodySizeLimitMiddleware)
+    audio_data = await read_upload_capped(audio, MAX_FILE_SIZE_BYTES)
+    if audio_data is None:
         return SpeechTranscribeResponse(
             success=False,
             error=f"File too large. Maximum size is {MAX_FILE_SIZE_BYTES // (1024*1024)}MB"
         )
 
-    # Generate storage path and save
-    storage_path = speech_service.generate_storage_path(
-        current_user.id, word_uuid, extension
-    )
+    # Content-addressed storage path, then save and transcribe concurrently
+    audio_sha256 = hashlib.sha256(audio_data).hexdigest()
+    storage_path = speech_service.generate_storage_path(audio_sha256, extension)
 
+    # The save gets its own view of the bytes: on timeout its worker thread
+    # keeps reading after the request (and its UploadFile) is closed
+    transcribe_task = asyncio.ensure_future(speech_service.transcribe_audio(audio_data, extension))
     try:
         recording_path = await speech_service.save_audio(
-            audio_data, storage_path, audio.content_type or "application/octet-stream"
+            io.BytesIO(audio_data), storage_path, audio.content_type or "application/octet-stream"
         )
     except Exception as e:
+        # Nothing is logged without a recording, so drop the transcription
+        transcribe_task.cancel()
+        error = "timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
         return SpeechTranscribeResponse(
             success=False,
-            error=f"Failed to save audio: {str(e)}"
+            error=f"Failed to save audio: {error}"
         )
-
-    # Transcribe audio
-    cloud_transcript, transcribe_error = await speech_service.transcribe_audio(
-        audio_data, extension
-    )
+    cloud_transcript, transcribe_error = await transcribe_task
 
     # Log to database (even if transcription fails, we log the upload)
     speech_log = SpeechLog(
@@ -102,6 +115,7 @@ async def transcribe_speech(
         word_id=word_uuid,
         word=word.word,
         recording_path=recording_path,
+        recording_sha256=audio_sha256,
         platform=platform,
         native_transcript=native_transcript,
         cloud_transcript=cloud_transcript,
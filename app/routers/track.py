@@ -1,9 +1,28 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.repositories.event_repository import EventRepository
-from app.schemas.track import TrackRequest, TrackResponse
+from app.schemas.track import (
+    TrackBulkError,
+    TrackBulkResponse,
+    TrackEventSchema,
+    TrackRequest,
+    TrackResponse,
+)
+from app.services.event_dedup import drop_duplicate_events, event_dedup
+from app.services.ndjson import NDJSONDecodeError, NDJSONTooLargeError, iter_ndjson_lines
+from app.utils.constants import (
+    TRACK_BULK_CHUNK_SIZE,
+    TRACK_BULK_MAX_ERRORS,
+    TRACK_BULK_MAX_INFLATED_BYTES,
+    TRACK_BULK_MAX_LINE_BYTES,
+)
 
 router = APIRouter(
     prefix="/api/track",
@@ -11,6 +30,23 @@ router = APIRouter(
 )
 
 
+def _event_row(event: TrackEventSchema, received_at: datetime) -> dict[str, Any]:
+    return {
+        "device_id": event.device_id,
+        "event_id": event.event_id,
+        "user_id": event.user_id,
+        "session_id": event.session_id,
+        "exercise_session_id": event.exercise_session_id,
+        "event_type": event.event_type,
+        "event_name": event.event_name,
+        "properties": event.properties,
+        "timestamp": event.timestamp,
+        "app_version": event.app_version,
+        "platform": event.platform,
+        "server_received_at": received_at,
+    }
+
+
 @router.post("", response_model=TrackResponse)
 def track_events(
     request: TrackRequest,
@@ -21,7 +57,12 @@ def track_events(
 
     Accepts a batch of 1-20 events. Events without a device_id are rejected.
     This is a public endpoint that does not require authentication.
+    Accepted events are buffered and written in batches, so they may reach
+    the database shortly after the response. Events whose event_id was
+    already received from the same device are dropped and counted as
+    duplicates.
     """
+    received_at = datetime.now(timezone.utc)
     valid_events = []
     rejected_count = 0
 
@@ -30,26 +71,99 @@ def track_events(
             rejected_count += 1
             continue
 
-        valid_events.append({
-            "device_id": event.device_id,
-            "user_id": event.user_id,
-            "session_id": event.session_id,
-            "exercise_session_id": event.exercise_session_id,
-            "event_type": event.event_type,
-            "event_name": event.event_name,
-            "properties": event.properties,
-            "timestamp": event.timestamp,
-            "app_version": event.app_version,
-            "platform": event.platform,
-        })
-
-    accepted_count = 0
-    if valid_events:
-        event_repo = EventRepository(db)
-        accepted_count = event_repo.create_events_batch(valid_events)
+        valid_events.append(_event_row(event, received_at))
+
+    new_events, keys, duplicate_count = drop_duplicate_events(valid_events)
+    event_repo = EventRepository(db)
+    accepted_count = event_repo.add_events(new_events)
+    event_dedup.add(keys)
 
     return TrackResponse(
         success=True,
         accepted=accepted_count,
-        rejected=rejected_count
+        rejected=rejected_count,
+        duplicates=duplicate_count,
+    )
+
+
+@router.post("/bulk", response_model=TrackBulkResponse)
+async def track_events_bulk(
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Upload queued events as NDJSON, one TrackEventSchema object per line.
+
+    Send the body gzip-compressed with Content-Encoding: gzip (plain NDJSON
+    is accepted too). The body is decompressed and parsed as it streams in,
+    and valid events are stored in chunks of 1000, so there is no batch
+    size limit. Invalid lines and events without a device_id are rejected
+    individually; the response counts both and lists the first 100 errors.
+    Events already received (same device_id and event_id) are counted as
+    duplicates.
+
+    A body that is not valid gzip returns 400, and one that decompresses to
+    more than 256MB returns 413; chunks stored before the error are kept.
+    """
+    received_at = datetime.now(timezone.utc)
+    gzipped = "gzip" in request.headers.get("content-encoding", "").lower()
+    event_repo = EventRepository(db)
+
+    accepted = 0
+    rejected = 0
+    duplicates = 0
+    errors: list[TrackBulkError] = []
+    chunk: list[dict[str, Any]] = []
+
+    async def store(events: list[dict[str, Any]]):
+        nonlocal accepted, duplicates
+        new_events, keys, dropped = drop_duplicate_events(events)
+        inserted = await run_in_threadpool(event_repo.create_events_batch, new_events)
+        event_dedup.add(keys)
+        event_dedup.record_conflicts(len(new_events) - inserted)
+        accepted += inserted
+        duplicates += dropped + len(new_events) - inserted
+
+    def reject(line_no: int, error: str):
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < TRACK_BULK_MAX_ERRORS:
+            errors.append(TrackBulkError(line=line_no, error=error))
+
+    try:
+        async for line_no, line in iter_ndjson_lines(
+            request.stream(), gzipped, TRACK_BULK_MAX_LINE_BYTES, TRACK_BULK_MAX_INFLATED_BYTES
+        ):
+            if line is None:
+                reject(line_no, f"Line exceeds {TRACK_BULK_MAX_LINE_BYTES} bytes")
+                continue
+            try:
+                event = TrackEventSchema.model_validate_json(line)
+            except ValidationError as e:
+                first = e.errors()[0]
+                location = ".".join(str(part) for part in first["loc"])
+                reject(line_no, f"{location}: {first['msg']}" if location else first["msg"])
+                continue
+            if not event.device_id:
+                reject(line_no, "device_id is required")
+                continue
+
+            chunk.append(_event_row(event, received_at))
+            if len(chunk) >= TRACK_BULK_CHUNK_SIZE:
+                await store(chunk)
+                chunk = []
+    except NDJSONTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except NDJSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if chunk:
+        await store(chunk)
+
+    return TrackBulkResponse(
+        success=True,
+        accepted=accepted,
+        rejected=rejected,
+        duplicates=duplicates,
+        errors=errors,
     )
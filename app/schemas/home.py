@@ -27,3 +27,11 @@ class WordPoolItem(BaseModel):
 class WordPoolResponse(BaseModel):
     pools: Dict[str, List[WordPoolItem]]
     total_count: int
+
+
+class WordPoolPageResponse(BaseModel):
+    counts: Dict[str, int]
+    total_count: int
+    pool: Optional[str] = None
+    items: List[WordPoolItem] = []
+    next_cursor: Optional[str] = None
@@ -8,6 +8,9 @@ class TrackEventSchema(BaseModel):
     """Schema for a single tracking event."""
 
     device_id: Optional[str] = Field(None, max_length=100, description="Device identifier")
+    event_id: Optional[str] = Field(
+        None, max_length=100, description="Client-generated event id; retries with the same id are stored once"
+    )
     user_id: Optional[str] = Field(None, max_length=100, description="User identifier")
     session_id: str = Field(..., max_length=100, description="Session identifier")
     exercise_session_id: Optional[str] = Field(None, max_length=100, description="Exercise session identifier")
@@ -36,6 +39,27 @@ class TrackResponse(BaseModel):
     success: bool = Field(..., description="Whether the request was processed")
     accepted: int = Field(..., description="Number of events accepted")
     rejected: int = Field(..., description="Number of events rejected")
+    duplicates: int = Field(0, description="Number of events dropped as already received")
 
     class Config:
         from_attributes = True
+
+
+class TrackBulkError(BaseModel):
+    """A rejected line in a bulk upload."""
+
+    line: int = Field(..., description="1-based line number in the NDJSON body")
+    error: str = Field(..., description="Why the line was rejected")
+
+
+class TrackBulkResponse(BaseModel):
+    """Response schema for bulk NDJSON event upload."""
+
+    success: bool = Field(..., description="Whether the request was processed")
+    accepted: int = Field(..., description="Number of lines stored as events")
+    rejected: int = Field(..., description="Number of lines rejected")
+    duplicates: int = Field(0, description="Number of lines dropped as already received")
+    errors: list[TrackBulkError] = Field(
+        default_factory=list,
+        description="Rejected lines, capped at the first 100",
+    )
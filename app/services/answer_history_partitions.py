@@ -0,0 +1,156 @@
+"""
+Monthly partition maintenance for the answer_history table.
+
+answer_history is range-partitioned on created_at, one partition per month
+in APP_TIMEZONE, named answer_history_YYYY_MM, plus a default partition
+that should stay empty. Partitions must exist before rows for their month
+arrive: create_month_partitions() is run ahead of time (see
+scripts/manage_answer_history_partitions.py), and archive_partition()
+dumps an old month to a gzip CSV file before dropping it.
+
+Postgres refuses to create a partition while the default partition holds
+rows for its range, so when rows have landed there anyway
+create_month_partitions() detaches the default partition, moves them into
+the new monthly partitions and reattaches it, in the caller's transaction.
+"""
+
+import csv
+import gzip
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.utils.constants import APP_TIMEZONE
+
+PARENT_TABLE = "answer_history"
+DEFAULT_PARTITION = "answer_history_default"
+_PARTITION_NAME = re.compile(r"^answer_history_(\d{4})_(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def current_month() -> date:
+    return month_start(datetime.now(APP_TIMEZONE).date())
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_{month:%Y_%m}"
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=APP_TIMEZONE).isoformat()
+
+
+def default_partition_months(conn: Connection) -> List[date]:
+    """Get the months that have rows in the default partition."""
+    return conn.execute(text(
+        "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE :offset)::date "
+        f"FROM {DEFAULT_PARTITION} ORDER BY 1"
+    ), {"offset": APP_TIMEZONE.utcoffset(None)}).scalars().all()
+
+
+def create_month_partitions(conn: Connection, first_month: date, count: int) -> List[str]:
+    """
+    Create the partitions for count months starting at first_month, plus
+    any month that has rows in the default partition.
+
+    Rows in the default partition are moved into their new partition.
+    Existing partitions are left alone. Returns the names that were created.
+    """
+    existing = {name for name, _ in list_month_partitions(conn)}
+    stranded = set(default_partition_months(conn))
+    months = sorted(stranded | {add_months(first_month, i) for i in range(count)})
+    missing = [month for month in months if partition_name(month) not in existing]
+    if not missing:
+        return []
+
+    # The default partition may not overlap a new partition's range while
+    # attached; detaching and reattaching it revalidates what is left
+    move_rows = bool(stranded.intersection(missing))
+    if move_rows:
+        conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+
+    created = []
+    for month in missing:
+        name = partition_name(month)
+        lower, upper = _bound(month), _bound(add_months(month, 1))
+        conn.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        if month in stranded:
+            conn.execute(text(
+                f"WITH moved AS ("
+                f"DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= '{lower}' AND created_at < '{upper}' RETURNING *"
+                f") INSERT INTO {name} SELECT * FROM moved"
+            ))
+        created.append(name)
+
+    if move_rows:
+        conn.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    return created
+
+
+def list_month_partitions(conn: Connection) -> List[Tuple[str, date]]:
+    """Get the attached monthly partitions as (name, month), oldest first."""
+    rows = conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :parent"
+    ), {"parent": PARENT_TABLE}).scalars().all()
+
+    partitions = []
+    for name in rows:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def archive_partition(conn: Connection, name: str, output_dir: Path) -> Tuple[Path, int]:
+    """
+    Dump a partition to output_dir/<name>.csv.gz, then detach and drop it.
+
+    The dump is written and checked against the row count before the
+    partition is touched. Run inside a transaction: the detach and drop
+    commit together.
+
+    Returns:
+        (archive path, rows archived)
+    """
+    if not _PARTITION_NAME.match(name):
+        raise ValueError(f"Not a monthly answer_history partition: {name}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{name}.csv.gz"
+
+    expected = conn.execute(text(f"SELECT count(*) FROM {name}")).scalar()
+    cursor = conn.connection.cursor()
+    try:
+        with gzip.open(path, "wb") as archive:
+            cursor.copy_expert(f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)", archive)
+    finally:
+        cursor.close()
+
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as archive:
+        # Header plus one record per row
+        written = sum(1 for _ in csv.reader(archive)) - 1
+    if written != expected:
+        raise RuntimeError(f"{path}: wrote {written} rows, expected {expected}")
+
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+    conn.execute(text(f"DROP TABLE {name}"))
+    return path, expected
@@ -0,0 +1,318 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import DBAPIError, DisconnectionError, InterfaceError, OperationalError
+
+logger = logging.getLogger(__name__)
+dead_letter_logger = logging.getLogger(f"{__name__}.dead_letter")
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether a write failed because of the database connection rather than the rows."""
+    if isinstance(error, (OperationalError, InterfaceError, DisconnectionError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+class BatchWriter:
+    """
+    In-process write-behind buffer for rows nobody reads back in the request.
+
+    Records are queued by request threads and written in batches by a
+    background task, when batch_size records are waiting or every
+    flush_interval seconds. The queue is bounded: when it is full, or the
+    writer is not running, submit() writes the records synchronously instead.
+    stop() drains the queue, so it must run on application shutdown.
+
+    write_batch receives a list of records and must write them in its own
+    transaction.
+
+    A failed batch is retried on the next flush. Connection errors are
+    retried until the database is back; any other error counts towards
+    max_retries, after which the batch is written one record at a time and
+    the records that still fail are dead-lettered: logged, and appended to
+    <dead_letter_dir>/<name>.jsonl when a directory is configured. One bad
+    record therefore cannot hold up the rest of the queue. A failed
+    synchronous write is isolated the same way straight away.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_batch: Callable[[List[Any]], None],
+        enabled: bool,
+        max_queue: int,
+        batch_size: int,
+        flush_interval: float,
+        max_retries: int = 3,
+        dead_letter_dir: str = "",
+    ):
+        self.name = name
+        self.enabled = enabled
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.dead_letter_dir = dead_letter_dir
+        self._write_batch = write_batch
+        self._buffer: deque = deque()
+        # Batch that failed last flush, written before anything else
+        self._retry_batch: List[Any] = []
+        self._retry_attempts = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.sync_writes = 0
+        self.flush_errors = 0
+        self.dead_lettered = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+
+        _writers.append(self)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def submit(self, records: List[Any]) -> bool:
+        """
+        Queue records for the next flush.
+
+        Returns:
+            True if queued, False if they were written synchronously because
+            the writer is not running or the queue is full
+
+        Raises:
+            Exception: a synchronous write failed on a connection error
+            (records failing for other reasons are dead-lettered)
+        """
+        if not records:
+            return True
+
+        with self._lock:
+            queued = self._running and len(self._buffer) + len(records) <= self.max_queue
+            if queued:
+                self._buffer.extend(records)
+                self.enqueued += len(records)
+                wake = len(self._buffer) >= self.batch_size
+
+        if not queued:
+            with self._lock:
+                self.sync_writes += 1
+            try:
+                self._write_batch(records)
+            except Exception as e:
+                # Nothing to retry from here: isolate the bad records now
+                if is_transient_error(e):
+                    raise
+                logger.exception("%s: synchronous write of %d records failed", self.name, len(records))
+                _, connection_error = self._write_one_by_one(records)
+                if connection_error is not None:
+                    raise connection_error
+                return False
+            with self._lock:
+                self.written += len(records)
+            return False
+
+        if wake:
+            self._wake_flusher()
+        return True
+
+    def flush(self) -> None:
+        """Write everything queued so far, batch_size records at a time."""
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    if self._retry_batch:
+                        batch, attempts = self._retry_batch, self._retry_attempts
+                        self._retry_batch, self._retry_attempts = [], 0
+                    elif self._buffer:
+                        count = min(self.batch_size, len(self._buffer))
+                        batch = [self._buffer.popleft() for _ in range(count)]
+                        attempts = 0
+                    else:
+                        return
+
+                if attempts >= self.max_retries:
+                    handled, _ = self._write_one_by_one(batch)
+                    if handled < len(batch):
+                        with self._lock:
+                            self._retry_batch = batch[handled:]
+                            self._retry_attempts = attempts
+                            self.flush_errors += 1
+                        return
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    logger.exception("%s: failed to flush %d records", self.name, len(batch))
+                    with self._lock:
+                        # Retried first on the next flush
+                        self._retry_batch = batch
+                        self._retry_attempts = attempts if is_transient_error(e) else attempts + 1
+                        self.flush_errors += 1
+                    return
+
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.written += len(batch)
+                    self.last_flush_ms = elapsed_ms
+                    self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+
+    def _write_one_by_one(self, batch: List[Any]) -> Tuple[int, Optional[Exception]]:
+        """
+        Write a failed batch record by record, dead-lettering the records
+        that fail on their own.
+
+        Returns:
+            (records handled, connection error): fewer than len(batch)
+            records are handled if the database connection failed
+        """
+        for i, record in enumerate(batch):
+            try:
+                self._write_batch([record])
+            except Exception as e:
+                if is_transient_error(e):
+                    logger.exception("%s: connection lost while isolating a failed batch", self.name)
+                    return i, e
+                self._dead_letter(record, e)
+                continue
+            with self._lock:
+                self.written += 1
+        return len(batch), None
+
+    def dead_letter(self, records: List[Any], error: Exception) -> None:
+        """Record writes that were given up on (see the class docstring)."""
+        for record in records:
+            self._dead_letter(record, error)
+
+    def _dead_letter(self, record: Any, error: Exception) -> None:
+        line = json.dumps({
+            "writer": self.name,
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            "error": f"{type(error).__name__}: {error}",
+            "record": record,
+        }, default=str)
+        dead_letter_logger.error("%s: dead-lettered record: %s", self.name, line)
+        if self.dead_letter_dir:
+            try:
+                path = Path(self.dead_letter_dir)
+                path.mkdir(parents=True, exist_ok=True)
+                with open(path / f"{self.name}.jsonl", "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError:
+                logger.exception("%s: could not write the dead-letter file", self.name)
+        with self._lock:
+            self.dead_lettered += 1
+
+    async def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop accepting records and flush whatever is still queued.
+
+        A failing batch gets its remaining retries (and is then written row
+        by row) right away; records that still cannot be written, e.g.
+        because the database is down, are dead-lettered rather than dropped.
+        """
+        if not self._running:
+            return
+        with self._lock:
+            self._running = False
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.to_thread(self._drain)
+
+    def _drain(self) -> None:
+        for _ in range(self.max_retries + 1):
+            self.flush()
+            if not self.queue_depth:
+                return
+
+        with self._lock:
+            remaining = self._retry_batch + list(self._buffer)
+            self._retry_batch, self._retry_attempts = [], 0
+            self._buffer.clear()
+        logger.error("%s: %d records could not be written on shutdown", self.name, len(remaining))
+        self.dead_letter(remaining, RuntimeError("not written before shutdown"))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await asyncio.to_thread(self.flush)
+
+    def _wake_flusher(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # Event loop already closed; stop() flushes what is left
+            pass
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._buffer) + len(self._retry_batch)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "queue_depth": len(self._buffer) + len(self._retry_batch),
+                "max_queue": self.max_queue,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "sync_writes": self.sync_writes,
+                "flush_errors": self.flush_errors,
+                "dead_lettered": self.dead_lettered,
+                "last_flush_ms": round(self.last_flush_ms, 2),
+                "max_flush_ms": round(self.max_flush_ms, 2),
+            }
+
+
+_writers: List[BatchWriter] = []
+
+
+async def start_batch_writers() -> None:
+    """Start every enabled writer (called from the application lifespan)."""
+    for writer in _writers:
+        if writer.enabled:
+            await writer.start()
+
+
+async def stop_batch_writers() -> None:
+    """Flush and stop every running writer."""
+    for writer in _writers:
+        await writer.stop()
+
+
+def get_batch_writer_stats() -> Dict[str, Dict[str, Any]]:
+    return {writer.name: writer.stats() for writer in _writers if writer.enabled}
@@ -0,0 +1,159 @@
+"""
+In-memory duplicate filter for client event ids.
+
+Clients retry /api/track on timeouts, resending events that were already
+stored. A time-windowed Bloom filter remembers recently stored
+(device_id, event_id) keys and drops repeats before they reach the
+database. It is probabilistic in both directions: a false positive drops a
+new event (at roughly error_rate), and keys older than two windows, or
+seen by another worker, are forgotten. The unique partial index on
+events (device_id, event_id) is the authoritative check for everything
+the filter lets through.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.config import settings
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for capacity keys at error_rate."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # Double hashing: two 64-bit halves of one digest give every probe
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self._bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class RotatingBloomFilter:
+    """
+    Two Bloom filter generations, swapped every window_seconds.
+
+    Keys are added to the current generation and looked up in both, so a
+    key is remembered for at least one full window and at most two.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, window_seconds: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window_seconds = window_seconds
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.checked = 0
+        self.hits = 0
+        self.db_conflicts = 0
+        self.rotations = 0
+
+    def _maybe_rotate(self) -> None:
+        # Also rotate early when the generation is full, to hold the error rate
+        if (
+            time.monotonic() - self._rotated_at >= self.window_seconds
+            or self._current.count >= self.capacity
+        ):
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+            self.rotations += 1
+
+    def seen(self, key: str) -> bool:
+        """Whether key was (probably) added within the last one or two windows."""
+        with self._lock:
+            self._maybe_rotate()
+            self.checked += 1
+            hit = key in self._current or key in self._previous
+            if hit:
+                self.hits += 1
+            return hit
+
+    def add(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._maybe_rotate()
+            for key in keys:
+                self._current.add(key)
+
+    def record_conflicts(self, count: int) -> None:
+        """Count duplicates the filter missed and the unique index caught."""
+        if count:
+            with self._lock:
+                self.db_conflicts += count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.checked, 4) if self.checked else 0.0,
+                "db_conflicts": self.db_conflicts,
+                "rotations": self.rotations,
+                "window_seconds": self.window_seconds,
+                "current_keys": self._current.count,
+                "capacity": self.capacity,
+            }
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    return f"{event['device_id']}\x00{event['event_id']}"
+
+
+def drop_duplicate_events(
+    events: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[str], int]:
+    """
+    Split events into the ones to store and the probable duplicates.
+
+    Events without an event_id always pass. Duplicates within the batch are
+    dropped too.
+
+    Returns:
+        (events to store, their filter keys, number of duplicates dropped);
+        pass the keys to event_dedup.add() once the events are written or queued
+    """
+    if not settings.event_dedup_enabled:
+        return events, [], 0
+
+    kept = []
+    keys = []
+    batch_keys = set()
+    for event in events:
+        if event.get("event_id") is None:
+            kept.append(event)
+            continue
+        key = event_key(event)
+        if key in batch_keys or event_dedup.seen(key):
+            continue
+        batch_keys.add(key)
+        keys.append(key)
+        kept.append(event)
+    return kept, keys, len(events) - len(kept)
+
+
+event_dedup = RotatingBloomFilter(
+    capacity=settings.event_dedup_capacity,
+    error_rate=settings.event_dedup_error_rate,
+    window_seconds=settings.event_dedup_window_seconds,
+)
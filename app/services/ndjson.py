@@ -0,0 +1,112 @@
+"""
+Streaming NDJSON decoding for request bodies.
+
+The body is consumed chunk by chunk (optionally gunzipping on the fly), so
+memory is bounded by the chunk size plus the longest allowed line, not by
+the size of the upload. The total decompressed size can be capped, so a
+gzip bomb is refused instead of being inflated to the end.
+"""
+
+import zlib
+from typing import AsyncIterator, Optional, Tuple
+
+# Upper bound on bytes produced per decompress() call, so a small, highly
+# compressed chunk cannot expand into a huge buffer at once
+_INFLATE_STEP = 256 * 1024
+
+
+class NDJSONDecodeError(ValueError):
+    """The body is not valid gzip data."""
+
+
+class NDJSONTooLargeError(NDJSONDecodeError):
+    """The gzip body decompresses to more than the allowed size."""
+
+
+async def _inflate(
+    chunks: AsyncIterator[bytes], max_inflated_bytes: Optional[int]
+) -> AsyncIterator[bytes]:
+    inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    received = False
+    inflated = 0
+    try:
+        async for chunk in chunks:
+            received = received or bool(chunk)
+            data = chunk
+            while data:
+                out = inflater.decompress(data, _INFLATE_STEP)
+                inflated += len(out)
+                if max_inflated_bytes is not None and inflated > max_inflated_bytes:
+                    raise NDJSONTooLargeError(
+                        f"Decompressed body exceeds {max_inflated_bytes} bytes"
+                    )
+                if out:
+                    yield out
+                data = inflater.unconsumed_tail
+            if inflater.eof:
+                break
+        tail = inflater.flush()
+    except zlib.error as e:
+        raise NDJSONDecodeError(f"Invalid gzip body: {e}") from e
+    if tail:
+        yield tail
+    if received and not inflater.eof:
+        raise NDJSONDecodeError("Truncated gzip body")
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    gzipped: bool,
+    max_line_bytes: int,
+    max_inflated_bytes: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Split a streamed NDJSON body into lines.
+
+    Yields (line number, line) for every non-blank line, 1-based. Lines
+    longer than max_line_bytes are yielded as (line number, None) without
+    being buffered.
+
+    Raises:
+        NDJSONDecodeError: gzipped is set and the body is not valid gzip
+        NDJSONTooLargeError: gzipped is set and the body decompresses to
+            more than max_inflated_bytes
+    """
+    source = _inflate(chunks, max_inflated_bytes) if gzipped else chunks
+    buffer = bytearray()
+    line_no = 0
+    overlong = False
+
+    async for data in source:
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if end == -1:
+                if not overlong:
+                    buffer += data[start:]
+                    if len(buffer) > max_line_bytes:
+                        overlong = True
+                        buffer.clear()
+                break
+
+            line_no += 1
+            if overlong:
+                overlong = False
+                yield line_no, None
+            else:
+                buffer += data[start:end]
+                line = bytes(buffer).strip()
+                buffer.clear()
+                if len(line) > max_line_bytes:
+                    yield line_no, None
+                elif line:
+                    yield line_no, line
+            start = end + 1
+
+    # Last line without a trailing newline
+    if overlong:
+        yield line_no + 1, None
+    else:
+        line = bytes(buffer).strip()
+        if line:
+            yield line_no + 1, line
@@ -2,6 +2,7 @@ import random
 from typing import List, Dict, Any, Optional
 
 from app.models.word import Word
+from app.services.word_catalog import WordCatalog
 from app.utils.constants import (
     OPTIONS_COUNT,
     POOL_EXERCISE_TYPES,
@@ -52,9 +53,73 @@ def build_next_review(pool: str, session_mode: str) -> NextReviewSchema:
     )
 
 
+def sample_distractors(
+    correct_word: Word,
+    catalog: WordCatalog,
+    session_words: Optional[List[Word]] = None,
+    k: int = OPTIONS_COUNT - 1,
+) -> List[Any]:
+    """
+    Pick up to k distinct distractors for a word.
+
+    Session words are used first, then the word's precomputed neighbours from
+    the same level/category. Any remaining slots are filled by rejection
+    sampling random catalog indices, so the cost is O(k) regardless of
+    catalog size.
+    """
+    excluded_ids = {correct_word.id}
+    distractors: List[Any] = []
+
+    # Priority: session words > neighbours > whole catalog
+    if session_words:
+        session_candidates = [w for w in session_words if w.id != correct_word.id]
+        if len(session_candidates) > k:
+            session_candidates = random.sample(session_candidates, k)
+        for w in session_candidates:
+            excluded_ids.add(w.id)
+            distractors.append(w)
+
+    needed = k - len(distractors)
+    if needed <= 0:
+        return distractors
+
+    # Then: same level/category neighbours
+    word_index = catalog.index_of(correct_word.id)
+    if word_index is not None:
+        neighbours = [
+            catalog[i] for i in catalog.neighbours_of(word_index)
+            if catalog[i].id not in excluded_ids
+        ]
+        for w in random.sample(neighbours, min(needed, len(neighbours))):
+            excluded_ids.add(w.id)
+            distractors.append(w)
+        needed = k - len(distractors)
+        if needed <= 0:
+            return distractors
+
+    catalog_size = len(catalog)
+    excluded_in_catalog = sum(
+        1 for word_id in excluded_ids if catalog.index_of(word_id) is not None
+    )
+    if catalog_size - excluded_in_catalog <= needed:
+        # Tiny catalog: take everything that is left
+        distractors.extend(w for w in catalog if w.id not in excluded_ids)
+        return distractors
+
+    while needed:
+        candidate = catalog[random.randrange(catalog_size)]
+        if candidate.id in excluded_ids:
+            continue
+        excluded_ids.add(candidate.id)
+        distractors.append(candidate)
+        needed -= 1
+
+    return distractors
+
+
 def generate_options(
     correct_word: Word,
-    all_words: List[Word],
+    catalog: WordCatalog,
     session_words: Optional[List[Word]] = None,
 ) -> tuple[List[Dict[str, Any]], int]:
     """
@@ -62,30 +127,13 @@ def generate_options(
 
     Args:
         correct_word: The correct answer word
-        all_words: All available words to pick distractors from
+        catalog: Word catalog to pick distractors from
         session_words: Words in current session (prioritized for distractors)
 
     Returns:
         tuple: (options list, correct_index)
     """
-    # Get distractor candidates
-    # Priority: session words > all learned words
-    distractor_candidates = []
-
-    if session_words:
-        distractor_candidates = [w for w in session_words if w.id != correct_word.id]
-
-    # If not enough distractors from session, add from all words
-    if len(distractor_candidates) < OPTIONS_COUNT - 1:
-        additional = [
-            w for w in all_words
-            if w.id != correct_word.id and w not in distractor_candidates
-        ]
-        distractor_candidates.extend(additional)
-
-    # Randomly select distractors
-    num_distractors = min(OPTIONS_COUNT - 1, len(distractor_candidates))
-    distractors = random.sample(distractor_candidates, num_distractors)
+    distractors = sample_distractors(correct_word, catalog, session_words)
 
     # Create options list with correct answer
     options_words = distractors + [correct_word]
@@ -114,7 +162,7 @@ def generate_options(
 def build_exercise(
     word: Word,
     pool: str,
-    all_words: List[Word],
+    catalog: WordCatalog,
     session_words: Optional[List[Word]] = None,
 ) -> Dict[str, Any]:
     """
@@ -123,7 +171,7 @@ def build_exercise(
     Args:
         word: The word to create exercise for
         pool: The current pool of the word
-        all_words: All available words for generating options
+        catalog: Word catalog for generating options
         session_words: Words in current session
 
     Returns:
@@ -149,7 +197,7 @@ def build_exercise(
         }
 
     # Generate options for reading/listening exercises
-    options, correct_index = generate_options(word, all_words, session_words)
+    options, correct_index = generate_options(word, catalog, session_words)
 
     return {
         "word_id": str(word.id),
@@ -192,13 +240,13 @@ def get_exercise_order(exercises: List[Dict[str, Any]]) -> List[str]:
 
 def build_learn_exercise(
     word: Word,
-    all_words: List[Word],
+    catalog: WordCatalog,
     session_words: Optional[List[Word]] = None,
 ) -> Dict[str, Any]:
     """
     Build a learning exercise (always Reading Lv1).
     """
-    options, correct_index = generate_options(word, all_words, session_words)
+    options, correct_index = generate_options(word, catalog, session_words)
 
     return {
         "word_id": str(word.id),
@@ -1,47 +1,78 @@
+import asyncio
 import io
 import logging
+import os
+import shutil
 import struct
+import threading
 import wave
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
-from uuid import UUID
+from typing import Any, BinaryIO, Callable, Optional, Tuple
+from uuid import uuid4
 
+import numpy as np
+from fastapi import UploadFile
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import storage
-from google.cloud import speech
 
 from app.config import settings
+from app.services.stt_backends import RecognitionRequest, SpeechRecognizer, create_speech_recognizer
+from app.services.transcription_cache import transcription_cache, transcription_cache_key
 
 logger = logging.getLogger(__name__)
 
 
+def find_riff_chunk(audio_data: bytes, chunk_id: bytes) -> Optional[memoryview]:
+    """
+    Find a top-level chunk in a RIFF/WAVE file by walking the chunk headers.
+
+    Returns a zero-copy view of the chunk body, or None if the file is not
+    RIFF/WAVE or has no such chunk. A size that runs past the end of the
+    file (e.g. the 0 / 0xFFFFFFFF placeholder streaming recorders write for
+    the data chunk) is cut to the bytes actually present.
+    """
+    if len(audio_data) < 12 or audio_data[:4] != b'RIFF' or audio_data[8:12] != b'WAVE':
+        return None
+
+    view = memoryview(audio_data)
+    offset = 12
+    while offset + 8 <= len(view):
+        current_id = bytes(view[offset:offset + 4])
+        size = struct.unpack_from('<I', view, offset + 4)[0]
+        body_start = offset + 8
+        body_end = body_start + size
+        if current_id == chunk_id:
+            if size == 0 or body_end > len(view):
+                body_end = len(view)
+            return view[body_start:body_end]
+        # Chunk bodies are padded to an even length
+        offset = body_end + (size & 1)
+    return None
+
+
 def convert_float32_to_int16(audio_data: bytes, wav_info: dict) -> bytes:
-    """Convert 32-bit float WAV to 16-bit PCM WAV."""
+    """
+    Convert 32-bit float WAV to 16-bit PCM WAV.
+
+    Samples are clamped to [-1, 1] and scaled by 32767, truncating toward
+    zero; NaN becomes 32767. The conversion runs on a NumPy view of the
+    data chunk, without copying it.
+    """
     try:
         sample_rate = wav_info["sample_rate"]
         num_channels = wav_info["channels"]
 
-        # Find the data chunk
-        data_start = audio_data.find(b'data')
-        if data_start == -1:
+        data = find_riff_chunk(audio_data, b'data')
+        if data is None:
             return audio_data
 
-        # Skip 'data' + 4 bytes for chunk size
-        data_start += 8
-        float_data = audio_data[data_start:]
-
-        # Convert float32 samples to int16
-        num_samples = len(float_data) // 4
-        int16_samples = []
-
-        for i in range(num_samples):
-            float_val = struct.unpack('<f', float_data[i*4:(i+1)*4])[0]
-            # Clamp to [-1, 1] and convert to int16
-            float_val = max(-1.0, min(1.0, float_val))
-            int16_val = int(float_val * 32767)
-            int16_samples.append(struct.pack('<h', int16_val))
-
-        int16_data = b''.join(int16_samples)
+        # Computed in float64 so the scaling and truncation match Python floats
+        samples = np.frombuffer(data, dtype='<f4', count=len(data) // 4).astype(np.float64)
+        # fmin/fmax ignore NaN, so NaN clamps to 1.0
+        np.fmax(np.fmin(samples, 1.0, out=samples), -1.0, out=samples)
+        samples *= 32767
+        int16_data = samples.astype('<i2').tobytes()
 
         # Create new WAV file with PCM format
         output = io.BytesIO()
@@ -60,23 +91,18 @@ def convert_float32_to_int16(audio_data: bytes, wav_info: dict) -> bytes:
 
 
 def get_wav_info(audio_data: bytes) -> dict:
-    """Extract audio info from WAV header."""
+    """Extract audio info from the WAV fmt chunk."""
     try:
-        # WAV header structure:
-        # bytes 0-3: "RIFF"
-        # bytes 8-11: "WAVE"
-        # bytes 20-21: audio format (1=PCM, 3=IEEE float)
-        # bytes 22-23: number of channels
-        # bytes 24-27: sample rate
-        # bytes 34-35: bits per sample
-        if len(audio_data) < 36:
-            return {}
-        if audio_data[:4] != b'RIFF' or audio_data[8:12] != b'WAVE':
+        # fmt chunk structure:
+        # bytes 0-1: audio format (1=PCM, 3=IEEE float)
+        # bytes 2-3: number of channels
+        # bytes 4-7: sample rate
+        # bytes 14-15: bits per sample
+        fmt = find_riff_chunk(audio_data, b'fmt ')
+        if fmt is None or len(fmt) < 16:
             return {}
-        audio_format = struct.unpack('<H', audio_data[20:22])[0]
-        num_channels = struct.unpack('<H', audio_data[22:24])[0]
-        sample_rate = struct.unpack('<I', audio_data[24:28])[0]
-        bits_per_sample = struct.unpack('<H', audio_data[34:36])[0]
+        audio_format, num_channels, sample_rate = struct.unpack_from('<HHI', fmt, 0)
+        bits_per_sample = struct.unpack_from('<H', fmt, 14)[0]
         return {
             "format": audio_format,  # 1=PCM, 3=IEEE float
             "channels": num_channels,
@@ -87,45 +113,120 @@ def get_wav_info(audio_data: bytes) -> dict:
         return {}
 
 
-# Supported audio formats with their Speech-to-Text encoding
+# Supported audio formats and their content types
 SUPPORTED_AUDIO_FORMATS = {
-    ".wav": {
-        "content_types": ["audio/wav", "audio/x-wav", "audio/wave"],
-        "encoding": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-    },
-    ".webm": {
-        "content_types": ["audio/webm"],
-        "encoding": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-    },
-    ".mp3": {
-        "content_types": ["audio/mpeg", "audio/mp3"],
-        "encoding": speech.RecognitionConfig.AudioEncoding.MP3,
-    },
-    ".m4a": {
-        "content_types": ["audio/m4a", "audio/mp4", "audio/x-m4a"],
-        "encoding": speech.RecognitionConfig.AudioEncoding.MP3,
-    },
+    ".wav": {"content_types": ["audio/wav", "audio/x-wav", "audio/wave"]},
+    ".webm": {"content_types": ["audio/webm"]},
+    ".mp3": {"content_types": ["audio/mpeg", "audio/mp3"]},
+    ".m4a": {"content_types": ["audio/m4a", "audio/mp4", "audio/x-m4a"]},
 }
 
 MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024  # 5MB
+# Whole multipart request: the file plus room for the form fields and boundaries
+MAX_UPLOAD_BODY_BYTES = MAX_FILE_SIZE_BYTES + 64 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def sniff_audio_extension(head: bytes) -> Optional[str]:
+    """Guess the audio container from the first bytes of a file."""
+    if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+        return ".wav"
+    if head[:4] == b'\x1a\x45\xdf\xa3':  # EBML (WebM / Matroska)
+        return ".webm"
+    if head[4:8] == b'ftyp':  # ISO base media (MP4 / M4A)
+        return ".m4a"
+    if head[:3] == b'ID3' or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return ".mp3"
+    return None
+
+
+async def read_upload_capped(upload: UploadFile, max_bytes: int) -> Optional[bytes]:
+    """
+    Read an uploaded file in UPLOAD_CHUNK_SIZE chunks, stopping as soon as
+    it exceeds max_bytes.
+
+    Chunking only stops an oversized file early: an accepted file is held
+    in memory in full, so memory per request is bounded by max_bytes, not
+    by the chunk size. The recognizers need the whole recording as bytes
+    (Google's synchronous recognize sends it inline), so it cannot be fed
+    from the spooled file instead.
+
+    Returns:
+        The file content, or None if it is larger than max_bytes
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        return None
+
+    content = bytearray()
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        content += chunk
+        if len(content) > max_bytes:
+            return None
+    return bytes(content)
 
 
 class SpeechService:
+    """
+    Audio storage and transcription.
+
+    Recognition goes to the speech-to-text backend named by
+    settings.stt_backend (see app/services/stt_backends.py).
+
+    The storage client and the backends are blocking, so save_audio and
+    transcribe_audio run them on a dedicated, bounded thread pool with a
+    per-stage timeout, keeping the event loop free. The two stages are
+    independent and can be awaited concurrently.
+    """
+
     def __init__(self):
         self._storage_client: Optional[storage.Client] = None
-        self._speech_client: Optional[speech.SpeechClient] = None
+        self._recognizer: Optional[SpeechRecognizer] = None
+        self._client_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def storage_client(self) -> storage.Client:
-        if self._storage_client is None:
-            self._storage_client = storage.Client()
-        return self._storage_client
+        with self._client_lock:
+            if self._storage_client is None:
+                self._storage_client = storage.Client()
+            return self._storage_client
+
+    @property
+    def recognizer(self) -> SpeechRecognizer:
+        with self._client_lock:
+            if self._recognizer is None:
+                self._recognizer = create_speech_recognizer(settings.stt_backend)
+            return self._recognizer
 
     @property
-    def speech_client(self) -> speech.SpeechClient:
-        if self._speech_client is None:
-            self._speech_client = speech.SpeechClient()
-        return self._speech_client
+    def executor(self) -> ThreadPoolExecutor:
+        with self._client_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.speech_executor_workers,
+                    thread_name_prefix="speech",
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (called from the application lifespan)."""
+        with self._client_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_blocking(self, timeout: float, fn: Callable[..., Any], *args) -> Any:
+        """
+        Run fn(*args) on the speech thread pool, waiting at most timeout seconds.
+
+        On timeout the call keeps its worker thread until it returns, so the
+        blocking calls are also given their own timeouts.
+
+        Raises:
+            asyncio.TimeoutError: fn did not finish in time
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(loop.run_in_executor(self.executor, fn, *args), timeout)
 
     def is_local_storage(self) -> bool:
         """Check if we should use local storage (empty static_base_url means local)."""
@@ -139,10 +240,11 @@ class SpeechService:
         return "coach-vocab-static"
 
     def validate_audio_format(
-        self, filename: str, content_type: str
+        self, filename: str, content_type: str, head: bytes = b""
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
-        Validate audio file format.
+        Validate audio file format from the filename extension, or from the
+        file header (first chunk) when the filename has none we support.
         Returns: (is_valid, extension, error_message)
         """
         ext = None
@@ -150,57 +252,78 @@ class SpeechService:
             if filename.lower().endswith(supported_ext):
                 ext = supported_ext
                 break
+        if not ext:
+            ext = sniff_audio_extension(head)
 
         if not ext:
             return False, None, "Unsupported file format. Supported: WAV, WebM, MP3, M4A"
 
         return True, ext, None
 
-    def generate_storage_path(
-        self, user_id: UUID, word_id: UUID, extension: str
-    ) -> str:
+    def generate_storage_path(self, audio_sha256: str, extension: str) -> str:
         """
-        Generate storage path.
-        Format: speech-logs/{user_id}/{timestamp}-{word_id}.{ext}
+        Generate a content-addressed storage path, so identical uploads are
+        stored once.
+        Format: speech-logs/sha256/{hash[:2]}/{hash}.{ext}
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{timestamp}-{word_id}{extension}"
-        return f"speech-logs/{user_id}/{filename}"
+        return f"speech-logs/sha256/{audio_sha256[:2]}/{audio_sha256}{extension}"
 
     async def save_audio(
-        self, audio_data: bytes, storage_path: str, content_type: str
+        self, audio_file: BinaryIO, storage_path: str, content_type: str
     ) -> str:
         """
-        Save audio file to local filesystem or GCS.
+        Save audio file to local filesystem or GCS, streaming it from
+        audio_file's current position.
         Returns: Full path (local path or gs:// URL)
+
+        Raises:
+            asyncio.TimeoutError: the upload took longer than speech_upload_timeout_seconds
         """
+        timeout = settings.speech_upload_timeout_seconds
         if self.is_local_storage():
-            return self._save_to_local(audio_data, storage_path)
+            return await self._run_blocking(timeout, self._save_to_local, audio_file, storage_path)
         else:
-            return self._upload_to_gcs(audio_data, storage_path, content_type)
+            return await self._run_blocking(
+                timeout, self._upload_to_gcs, audio_file, storage_path, content_type
+            )
 
-    def _save_to_local(self, audio_data: bytes, storage_path: str) -> str:
-        """Save audio to local static directory."""
+    def _save_to_local(self, audio_file: BinaryIO, storage_path: str) -> str:
+        """Save audio to local static directory, unless it is already stored."""
         local_path = Path("static") / storage_path
+        if local_path.exists():
+            return str(local_path)
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(local_path, "wb") as f:
-            f.write(audio_data)
+        # Write aside and rename, so concurrent identical uploads never
+        # expose a partial file
+        tmp_path = local_path.with_name(f"{local_path.name}.{uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(audio_file, f, UPLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, local_path)
 
         return str(local_path)
 
     def _upload_to_gcs(
-        self, audio_data: bytes, storage_path: str, content_type: str
+        self, audio_file: BinaryIO, storage_path: str, content_type: str
     ) -> str:
-        """Upload audio to GCS."""
+        """Upload audio to GCS, unless it is already stored."""
         bucket_name = self.get_bucket_name()
         bucket = self.storage_client.bucket(bucket_name)
         blob = bucket.blob(storage_path)
 
-        blob.upload_from_string(
-            audio_data,
-            content_type=content_type,
-        )
+        # Reads from the file; the client switches to a chunked resumable
+        # upload above its multipart threshold (8 MB)
+        try:
+            # Create-only: the path is the content hash, so an existing
+            # object already holds these bytes
+            blob.upload_from_file(
+                audio_file,
+                content_type=content_type,
+                timeout=settings.speech_upload_timeout_seconds,
+                if_generation_match=0,
+            )
+        except PreconditionFailed:
+            logger.info(f"Recording already stored: {storage_path}")
 
         return f"gs://{bucket_name}/{storage_path}"
 
@@ -208,17 +331,25 @@ class SpeechService:
         self, audio_data: bytes, extension: str
     ) -> Tuple[Optional[str], Optional[str]]:
         """
-        Transcribe audio using Google Cloud Speech-to-Text.
+        Transcribe audio with the configured speech-to-text backend.
         Returns: (transcript, error_message)
         """
+        timeout = settings.speech_recognize_timeout_seconds
         try:
-            format_config = SUPPORTED_AUDIO_FORMATS.get(extension)
-            if not format_config:
-                return None, f"Unsupported audio format: {extension}"
+            return await self._run_blocking(timeout, self._recognize, audio_data, extension)
+        except asyncio.TimeoutError:
+            logger.error(f"Speech-to-text ({settings.stt_backend}) timed out after {timeout}s")
+            return None, "Transcription failed: timed out"
 
-            encoding = format_config["encoding"]
+    def _recognize(
+        self, audio_data: bytes, extension: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Blocking part of transcribe_audio: WAV conversion and the recognize call."""
+        try:
+            if extension not in SUPPORTED_AUDIO_FORMATS:
+                return None, f"Unsupported audio format: {extension}"
 
-            audio = speech.RecognitionAudio(content=audio_data)
+            request = RecognitionRequest(extension=extension)
 
             # For WAV files, extract info from header
             if extension == ".wav":
@@ -230,54 +361,32 @@ class SpeechService:
                 # Convert float32 to int16 if needed
                 if wav_info.get("format") == 3:  # IEEE float
                     audio_data = convert_float32_to_int16(audio_data, wav_info)
-                    audio = speech.RecognitionAudio(content=audio_data)
-
-                sample_rate = wav_info.get("sample_rate")
-                num_channels = wav_info.get("channels", 1)
-
-                if sample_rate:
-                    config = speech.RecognitionConfig(
-                        encoding=encoding,
-                        sample_rate_hertz=sample_rate,
-                        audio_channel_count=num_channels,
-                        language_code="en-US",
-                        enable_automatic_punctuation=False,
-                    )
-                else:
-                    # Fallback: let Google auto-detect
-                    config = speech.RecognitionConfig(
-                        encoding=speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED,
-                        language_code="en-US",
-                        enable_automatic_punctuation=False,
-                    )
-            else:
-                config = speech.RecognitionConfig(
-                    encoding=encoding,
-                    sample_rate_hertz=48000,
-                    language_code="en-US",
-                    enable_automatic_punctuation=False,
+
+                request = RecognitionRequest(
+                    extension=extension,
+                    sample_rate=wav_info.get("sample_rate"),
+                    channels=wav_info.get("channels", 1),
                 )
 
-            logger.info(f"Sending transcription request to Google Speech-to-Text: encoding={config.encoding}, sample_rate={config.sample_rate_hertz}, language={config.language_code}")
+            recognizer = self.recognizer
+            cache_key = transcription_cache_key(recognizer.cache_config(request), audio_data)
+            cached = transcription_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Transcription cache hit: '{cached}'")
+                return cached, None
 
-            response = self.speech_client.recognize(config=config, audio=audio)
+            logger.info(f"Sending transcription request to {recognizer.name}: {request}")
 
-            if not response.results:
+            transcript = recognizer.recognize(audio_data, request)
+            if not transcript:
                 logger.info("Transcription complete: no speech detected")
-                return "", None  # No speech detected
-
-            # Concatenate all transcript results
-            transcript = " ".join(
-                result.alternatives[0].transcript
-                for result in response.results
-                if result.alternatives
-            )
-
-            logger.info(f"Transcription complete: '{transcript}'")
-            return transcript.strip(), None
+            else:
+                logger.info(f"Transcription complete: '{transcript}'")
+            transcription_cache.put(cache_key, transcript)
+            return transcript, None
 
         except Exception as e:
-            logger.error(f"Google Speech-to-Text API error: {str(e)}")
+            logger.error(f"Speech-to-text ({settings.stt_backend}) error: {str(e)}")
             return None, f"Transcription failed: {str(e)}"
 
 
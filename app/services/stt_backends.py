@@ -0,0 +1,233 @@
+"""
+Speech-to-text backends for SpeechService.
+
+A backend turns one normalized recording (WAV already converted to 16-bit
+PCM) into a transcript. The one in use is picked by settings.stt_backend:
+
+    google  Google Cloud Speech-to-Text (production)
+    fake    deterministic stand-in with configurable latency and errors,
+            for load tests and local development without credentials
+    vosk    offline recognizer running a local Vosk model (optional
+            dependency: pip install vosk, and set stt_vosk_model_path)
+
+Backends are blocking; SpeechService runs them on its thread pool with the
+recognize timeout.
+"""
+
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+import numpy as np
+from google.cloud import speech
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class RecognitionRequest:
+    """Audio parameters for one recognition, read from the upload."""
+
+    extension: str
+    sample_rate: Optional[int] = None  # From the WAV header, None otherwise
+    channels: int = 1
+    language_code: str = "en-US"
+
+
+class SpeechRecognizer(Protocol):
+    name: str
+
+    def cache_config(self, request: RecognitionRequest) -> bytes:
+        """
+        Bytes identifying the backend and every setting that affects the
+        transcript; part of the transcription cache key.
+        """
+        ...
+
+    def recognize(self, audio_data: bytes, request: RecognitionRequest) -> str:
+        """
+        Transcribe audio_data.
+
+        Returns:
+            The transcript, "" if no speech was detected
+
+        Raises:
+            Exception: the recognition failed
+        """
+        ...
+
+
+class GoogleSpeechRecognizer:
+    """Google Cloud Speech-to-Text, through a lazily created client."""
+
+    name = "google"
+
+    def __init__(self):
+        self._client: Optional[speech.SpeechClient] = None
+        self._client_lock = threading.Lock()
+
+        encoding = speech.RecognitionConfig.AudioEncoding
+        self._encodings = {
+            ".wav": encoding.LINEAR16,
+            ".webm": encoding.WEBM_OPUS,
+            ".mp3": encoding.MP3,
+            ".m4a": encoding.MP3,
+        }
+
+    @property
+    def client(self) -> speech.SpeechClient:
+        with self._client_lock:
+            if self._client is None:
+                self._client = speech.SpeechClient()
+            return self._client
+
+    def build_config(self, request: RecognitionRequest) -> speech.RecognitionConfig:
+        encoding = self._encodings.get(request.extension)
+        if encoding is None:
+            raise ValueError(f"Unsupported audio format: {request.extension}")
+
+        if request.extension != ".wav":
+            return speech.RecognitionConfig(
+                encoding=encoding,
+                sample_rate_hertz=48000,
+                language_code=request.language_code,
+                enable_automatic_punctuation=False,
+            )
+        if request.sample_rate:
+            return speech.RecognitionConfig(
+                encoding=encoding,
+                sample_rate_hertz=request.sample_rate,
+                audio_channel_count=request.channels,
+                language_code=request.language_code,
+                enable_automatic_punctuation=False,
+            )
+        # Fallback: let Google auto-detect
+        return speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED,
+            language_code=request.language_code,
+            enable_automatic_punctuation=False,
+        )
+
+    def cache_config(self, request: RecognitionRequest) -> bytes:
+        config = self.build_config(request)
+        return type(config).serialize(config)
+
+    def recognize(self, audio_data: bytes, request: RecognitionRequest) -> str:
+        config = self.build_config(request)
+        response = self.client.recognize(
+            config=config,
+            audio=speech.RecognitionAudio(content=audio_data),
+            timeout=settings.speech_recognize_timeout_seconds,
+        )
+        # Concatenate all transcript results ("" when no speech was detected)
+        return " ".join(
+            result.alternatives[0].transcript
+            for result in response.results
+            if result.alternatives
+        ).strip()
+
+
+class FakeSpeechRecognizer:
+    """
+    Stand-in recognizer for load tests.
+
+    Each call sleeps for a latency drawn from a normal distribution
+    (latency_ms +- jitter_ms), then fails with probability error_rate or
+    returns transcript. Draws are seeded from the audio bytes, so the same
+    recording always gets the same latency and outcome.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency_ms: float,
+        jitter_ms: float,
+        error_rate: float,
+        transcript: str,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.transcript = transcript
+
+    def cache_config(self, request: RecognitionRequest) -> bytes:
+        return f"{self.name}:{self.transcript}:{request}".encode()
+
+    def recognize(self, audio_data: bytes, request: RecognitionRequest) -> str:
+        rng = random.Random(hashlib.sha256(audio_data).digest())
+        latency_ms = max(0.0, rng.gauss(self.latency_ms, self.jitter_ms))
+        failed = rng.random() < self.error_rate
+
+        time.sleep(latency_ms / 1000)
+        if failed:
+            raise RuntimeError("Fake recognizer error")
+        return self.transcript
+
+
+class VoskSpeechRecognizer:
+    """
+    Offline recognition with a local Vosk (Kaldi) model.
+
+    Only 16-bit PCM WAV is supported; multi-channel audio is down-mixed.
+    The model is loaded once and shared, each call gets its own recognizer.
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path: str):
+        try:
+            import vosk
+        except ImportError as e:
+            raise RuntimeError("The vosk STT backend needs the vosk package: pip install vosk") from e
+        if not model_path:
+            raise RuntimeError("The vosk STT backend needs stt_vosk_model_path")
+
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self.model_path = model_path
+        self._model = vosk.Model(model_path)
+
+    def cache_config(self, request: RecognitionRequest) -> bytes:
+        return f"{self.name}:{self.model_path}:{request}".encode()
+
+    def recognize(self, audio_data: bytes, request: RecognitionRequest) -> str:
+        if request.extension != ".wav":
+            raise ValueError(f"The vosk backend only supports WAV, got {request.extension}")
+
+        with wave.open(io.BytesIO(audio_data), "rb") as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("The vosk backend needs 16-bit PCM audio")
+            channels = wav.getnchannels()
+            sample_rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+
+        if channels > 1:
+            samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+            frames = samples.mean(axis=1).astype("<i2").tobytes()
+
+        recognizer = self._vosk.KaldiRecognizer(self._model, sample_rate)
+        recognizer.AcceptWaveform(frames)
+        return json.loads(recognizer.FinalResult()).get("text", "").strip()
+
+
+def create_speech_recognizer(name: str) -> SpeechRecognizer:
+    """Create the backend named by settings.stt_backend."""
+    if name == "google":
+        return GoogleSpeechRecognizer()
+    if name == "fake":
+        return FakeSpeechRecognizer(
+            latency_ms=settings.stt_fake_latency_ms,
+            jitter_ms=settings.stt_fake_latency_jitter_ms,
+            error_rate=settings.stt_fake_error_rate,
+            transcript=settings.stt_fake_transcript,
+        )
+    if name == "vosk":
+        return VoskSpeechRecognizer(settings.stt_vosk_model_path)
+    raise ValueError(f"Unknown STT backend: {name} (expected google, fake or vosk)")
@@ -0,0 +1,132 @@
+"""
+Transcription cache for SpeechService.
+
+Keys are the SHA-256 of the backend's recognition settings (its
+cache_config(), e.g. the serialized Google RecognitionConfig) plus the
+normalized audio bytes sent for recognition (after float32 -> int16
+conversion), so a retried or re-uploaded recording with the same backend
+and settings maps to the same key. Lookups go to a bounded in-process LRU first, then,
+when transcription_cache_persistent is set, to the speech_transcriptions
+table shared by all workers.
+
+Only successful recognitions are cached ("" for no speech included);
+errors and timeouts are retried on the next request.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.speech_transcription import SpeechTranscription
+
+logger = logging.getLogger(__name__)
+
+
+def transcription_cache_key(config_bytes: bytes, audio_data: bytes) -> str:
+    hasher = hashlib.sha256()
+    # Length prefix keeps config and audio from running into each other
+    hasher.update(len(config_bytes).to_bytes(4, "big"))
+    hasher.update(config_bytes)
+    hasher.update(audio_data)
+    return hasher.hexdigest()
+
+
+class TranscriptionCache:
+    """
+    In-memory LRU of transcripts with an optional Postgres tier.
+
+    Called from the speech worker threads, so the LRU is locked and the
+    database tier uses its own short sessions.
+    """
+
+    def __init__(self, max_entries: int, persistent: bool):
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            transcript = self._entries.get(key)
+            if transcript is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return transcript
+
+        if self.persistent:
+            transcript = self._db_get(key)
+            if transcript is not None:
+                self._remember(key, transcript)
+                with self._lock:
+                    self.db_hits += 1
+                return transcript
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, transcript: str) -> None:
+        self._remember(key, transcript)
+        if self.persistent:
+            self._db_put(key, transcript)
+
+    def _remember(self, key: str, transcript: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = transcript
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[str]:
+        try:
+            with SessionLocal() as db:
+                row = db.get(SpeechTranscription, key)
+                return row.transcript if row else None
+        except Exception:
+            # The cache is an optimization; a database error means a miss
+            logger.exception("Transcription cache lookup failed")
+            return None
+
+    def _db_put(self, key: str, transcript: str) -> None:
+        try:
+            with SessionLocal() as db:
+                db.execute(
+                    pg_insert(SpeechTranscription)
+                    .values(cache_key=key, transcript=transcript)
+                    .on_conflict_do_nothing(index_elements=["cache_key"])
+                )
+                db.commit()
+        except Exception:
+            logger.exception("Transcription cache store failed")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "persistent": self.persistent,
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            }
+
+
+transcription_cache = TranscriptionCache(
+    max_entries=settings.transcription_cache_size,
+    persistent=settings.transcription_cache_persistent,
+)
@@ -0,0 +1,206 @@
+import hashlib
+import random
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.repositories.word_repository import WordRepository
+from app.utils.constants import DISTRACTOR_NEIGHBOURS
+
+
+class CatalogWord(NamedTuple):
+    """Read-only snapshot of a word, used for building exercise options."""
+
+    id: UUID
+    word: str
+    translation: str
+    image_url: Optional[str]
+    audio_url: Optional[str]
+    level_id: Optional[int]
+    category_id: Optional[int]
+
+
+class WordCatalog:
+    """
+    Immutable, integer-addressed view of the whole word table.
+
+    Loaded once per worker and shared by every request. The version is a
+    fingerprint of the catalog contents, so it is identical across workers
+    that loaded the same data.
+
+    Each word also gets a fixed-size row of distractor neighbours drawn from
+    the same (level, category), topped up from the same level. Rows live in
+    one flat int32 array padded with -1.
+
+    Bucket sizes (words per (level_id, category_id)) let callers work out P0
+    from the per-user learned counters without touching the words table.
+    Level and category orders are cached alongside, giving the curriculum
+    order of the buckets.
+    """
+
+    __slots__ = (
+        "version", "words", "_index_by_id", "_neighbours", "_bucket_sizes",
+        "_level_orders", "_category_orders", "_curriculum",
+    )
+
+    def __init__(
+        self,
+        words: Tuple[CatalogWord, ...],
+        level_orders: Optional[Dict[int, int]] = None,
+        category_orders: Optional[Dict[int, int]] = None,
+    ):
+        self.words = words
+        self._index_by_id: Dict[UUID, int] = {
+            w.id: i for i, w in enumerate(words)
+        }
+        self._neighbours = self._build_neighbours(words)
+        self._bucket_sizes = Counter((w.level_id, w.category_id) for w in words)
+        self._level_orders = level_orders or {}
+        self._category_orders = category_orders or {}
+        # Non-empty (level_id, category_id) buckets in curriculum order
+        self._curriculum = sorted(
+            (
+                bucket for bucket in self._bucket_sizes
+                if bucket[0] in self._level_orders and bucket[1] in self._category_orders
+            ),
+            key=lambda b: (self._level_orders[b[0]], self._category_orders[b[1]]),
+        )
+        self.version = self._fingerprint(words)
+
+    @staticmethod
+    def _pick(pool: List[int], exclude: int, count: int) -> List[int]:
+        if len(pool) <= count + 1:
+            return [i for i in pool if i != exclude]
+        return [i for i in random.sample(pool, count + 1) if i != exclude][:count]
+
+    @classmethod
+    def _build_neighbours(cls, words: Tuple[CatalogWord, ...]) -> array:
+        width = DISTRACTOR_NEIGHBOURS
+        by_bucket: Dict[tuple, List[int]] = defaultdict(list)
+        by_level: Dict[Optional[int], List[int]] = defaultdict(list)
+        for i, w in enumerate(words):
+            by_bucket[(w.level_id, w.category_id)].append(i)
+            by_level[w.level_id].append(i)
+
+        table = array("i", [-1]) * (len(words) * width)
+        for i, w in enumerate(words):
+            picks = cls._pick(by_bucket[(w.level_id, w.category_id)], i, width)
+            if len(picks) < width:
+                # Small bucket: top up from the rest of the level
+                chosen = set(picks)
+                for j in cls._pick(by_level[w.level_id], i, width * 2):
+                    if len(picks) == width:
+                        break
+                    if j not in chosen:
+                        chosen.add(j)
+                        picks.append(j)
+            table[i * width:i * width + len(picks)] = array("i", picks)
+        return table
+
+    @staticmethod
+    def _fingerprint(words: Tuple[CatalogWord, ...]) -> str:
+        digest = hashlib.sha1()
+        for w in words:
+            digest.update(repr(tuple(w)).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, index: int) -> CatalogWord:
+        return self.words[index]
+
+    def __iter__(self) -> Iterator[CatalogWord]:
+        return iter(self.words)
+
+    def index_of(self, word_id: UUID) -> Optional[int]:
+        """Get the catalog index of a word, or None if unknown."""
+        return self._index_by_id.get(word_id)
+
+    def get(self, word_id: UUID) -> Optional[CatalogWord]:
+        index = self._index_by_id.get(word_id)
+        return self.words[index] if index is not None else None
+
+    def bucket_size(self, level_id: Optional[int], category_id: Optional[int]) -> int:
+        """Number of catalog words in a (level, category) bucket."""
+        return self._bucket_sizes[(level_id, category_id)]
+
+    def level_order(self, level_id: Optional[int]) -> Optional[int]:
+        return self._level_orders.get(level_id)
+
+    def category_order(self, category_id: Optional[int]) -> Optional[int]:
+        return self._category_orders.get(category_id)
+
+    def buckets_from(
+        self, level_id: int, category_id: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get the non-empty buckets at or after (level, category) in curriculum order.
+
+        Returns None when the level or category is unknown.
+        """
+        level_order = self._level_orders.get(level_id)
+        category_order = self._category_orders.get(category_id)
+        if level_order is None or category_order is None:
+            return None
+        return [
+            b for b in self._curriculum
+            if (self._level_orders[b[0]], self._category_orders[b[1]])
+            >= (level_order, category_order)
+        ]
+
+    def neighbours_of(self, index: int) -> List[int]:
+        """Get the precomputed distractor neighbour indices of a word."""
+        start = index * DISTRACTOR_NEIGHBOURS
+        row = self._neighbours[start:start + DISTRACTOR_NEIGHBOURS]
+        return [i for i in row if i >= 0]
+
+
+_catalog: Optional[WordCatalog] = None
+_loaded_at: float = 0.0
+_lock = threading.Lock()
+
+
+def _is_fresh() -> bool:
+    return (
+        _catalog is not None
+        and time.monotonic() - _loaded_at < settings.word_catalog_ttl_seconds
+    )
+
+
+def get_word_catalog(db: Session) -> WordCatalog:
+    """
+    Get the process-wide word catalog, loading it on first use or after expiry.
+    """
+    global _catalog, _loaded_at
+
+    if _is_fresh():
+        return _catalog
+
+    with _lock:
+        # Another thread may have reloaded while we waited for the lock
+        if _is_fresh():
+            return _catalog
+
+        word_repo = WordRepository(db)
+        rows = word_repo.get_catalog_rows()
+        level_orders, category_orders = word_repo.get_curriculum_orders()
+        _catalog = WordCatalog(
+            tuple(CatalogWord(*row) for row in rows), level_orders, category_orders
+        )
+        _loaded_at = time.monotonic()
+        return _catalog
+
+
+def invalidate_word_catalog() -> None:
+    """Drop the cached catalog so the next request reloads it."""
+    global _catalog
+
+    with _lock:
+        _catalog = None
@@ -6,6 +6,9 @@ from typing import Dict, Optional
 # All "today" references in the codebase should use this timezone.
 APP_TIMEZONE = timezone(timedelta(hours=8))  # UTC+8
 
+# Answer history sources that count as a completed exercise ("today_completed")
+COMPLETED_SOURCES = ("practice", "review_learn", "review_practice")
+
 class PoolType(str, Enum):
     P0 = "P0"
     P1 = "P1"
@@ -109,3 +112,11 @@ REVIEW_MIN_WORDS = 3
 REVIEW_MAX_WORDS = 5
 LEARN_SESSION_SIZE = 5
 OPTIONS_COUNT = 4
+DISTRACTOR_NEIGHBOURS = 12  # Precomputed same level/category candidates per word
+WORD_POOL_PAGE_SIZE = 50
+WORD_POOL_MAX_PAGE_SIZE = 200
+WORD_EXPORT_BATCH_SIZE = 1000  # Rows fetched per round trip when streaming /api/admin/words
+TRACK_BULK_CHUNK_SIZE = 1000  # Events per INSERT in /api/track/bulk
+TRACK_BULK_MAX_LINE_BYTES = 64 * 1024  # Longer NDJSON lines are rejected unparsed
+TRACK_BULK_MAX_ERRORS = 100  # Per-line errors returned in the bulk response
+TRACK_BULK_MAX_INFLATED_BYTES = 256 * 1024 * 1024  # Decompressed size cap for gzip bodies
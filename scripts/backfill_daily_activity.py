@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Rebuild the user_daily_activity rollup from word_progress and answer_history.
+
+The rollup is kept up to date by the learn, practice and review submit
+transactions; run this after restoring data, importing archived answer
+history, or if the counters are suspected to have drifted.
+
+Usage:
+    python scripts/backfill_daily_activity.py [--user-id UUID]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from uuid import UUID
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.database import SessionLocal
+from app.repositories.daily_activity_repository import DailyActivityRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=UUID, help="Only rebuild this user (default: everyone)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = DailyActivityRepository(db).rebuild(args.user_id)
+        db.commit()
+        print(f"Rebuilt {rows} daily activity row(s).")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for distractor sampling in session_service.generate_options.
+
+Builds synthetic in-memory catalogs and measures the per-exercise cost of the
+index-based sampler against the previous list-scan implementation.
+No database is needed.
+
+Usage:
+    python scripts/bench_distractors.py [--iterations 20000]
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.session_service import generate_options
+from app.services.word_catalog import CatalogWord, WordCatalog
+from app.utils.constants import OPTIONS_COUNT
+
+CATALOG_SIZES = [2_000, 50_000, 500_000]
+SESSION_SIZE = 5
+
+
+def build_catalog(size: int) -> WordCatalog:
+    words = tuple(
+        CatalogWord(
+            id=uuid.uuid4(),
+            word=f"word{i}",
+            translation=f"translation{i}",
+            image_url=None,
+            audio_url=None,
+            level_id=i % 8 + 1,
+            category_id=i % 20 + 1,
+        )
+        for i in range(size)
+    )
+    return WordCatalog(words)
+
+
+def legacy_generate_options(correct_word, all_words, session_words=None):
+    """The list-scan implementation this sampler replaced, kept for comparison."""
+    distractor_candidates = []
+    if session_words:
+        distractor_candidates = [w for w in session_words if w.id != correct_word.id]
+    if len(distractor_candidates) < OPTIONS_COUNT - 1:
+        additional = [
+            w for w in all_words
+            if w.id != correct_word.id and w not in distractor_candidates
+        ]
+        distractor_candidates.extend(additional)
+    num_distractors = min(OPTIONS_COUNT - 1, len(distractor_candidates))
+    distractors = random.sample(distractor_candidates, num_distractors)
+    options_words = distractors + [correct_word]
+    random.shuffle(options_words)
+    return options_words
+
+
+def time_per_call(fn, iterations: int) -> float:
+    """Return the mean cost of fn() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--legacy-iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'catalog':>10} {'session':>8} {'sampler (us)':>14} {'legacy (us)':>14}")
+    for size in CATALOG_SIZES:
+        catalog = build_catalog(size)
+        word = catalog[0]
+
+        for session in (None, list(catalog.words[:2]), list(catalog.words[:SESSION_SIZE])):
+            session_len = len(session) if session else 0
+            sampler_us = time_per_call(
+                lambda: generate_options(word, catalog, session), args.iterations
+            )
+            legacy_us = time_per_call(
+                lambda: legacy_generate_options(word, catalog.words, session),
+                args.legacy_iterations,
+            )
+            print(f"{size:>10} {session_len:>8} {sampler_us:>14.2f} {legacy_us:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for float32 -> int16 WAV conversion in speech_service.
+
+Builds a float32 WAV close to the upload limit and times
+convert_float32_to_int16 (NumPy view of the RIFF data chunk) against the
+previous per-sample struct loop, checking that both outputs are identical.
+
+Usage:
+    python scripts/bench_wav_conversion.py [--megabytes 5] [--iterations 20]
+"""
+
+import argparse
+import io
+import struct
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.speech_service import convert_float32_to_int16, get_wav_info
+
+SAMPLE_RATE = 48000
+
+
+def legacy_convert_float32_to_int16(audio_data: bytes, wav_info: dict) -> bytes:
+    """The per-sample implementation the vectorized converter replaced."""
+    data_start = audio_data.find(b'data')
+    if data_start == -1:
+        return audio_data
+    float_data = audio_data[data_start + 8:]
+    int16_samples = []
+    for i in range(len(float_data) // 4):
+        float_val = struct.unpack('<f', float_data[i*4:(i+1)*4])[0]
+        float_val = max(-1.0, min(1.0, float_val))
+        int16_samples.append(struct.pack('<h', int(float_val * 32767)))
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav_out:
+        wav_out.setnchannels(wav_info["channels"])
+        wav_out.setsampwidth(2)
+        wav_out.setframerate(wav_info["sample_rate"])
+        wav_out.writeframes(b''.join(int16_samples))
+    return output.getvalue()
+
+
+def build_float_wav(megabytes: float) -> bytes:
+    count = int(megabytes * 1024 * 1024) // 4
+    t = np.arange(count) / SAMPLE_RATE
+    samples = (0.8 * np.sin(2 * np.pi * 440 * t)).astype('<f4').tobytes()
+    fmt = struct.pack('<HHIIHHH', 3, 1, SAMPLE_RATE, SAMPLE_RATE * 4, 4, 32, 0)
+    body = (
+        b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'data' + struct.pack('<I', len(samples)) + samples
+    )
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def time_per_call(fn, audio: bytes, wav_info: dict, iterations: int) -> float:
+    """Return the mean cost of one conversion in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(audio, wav_info)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=5)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--legacy-iterations", type=int, default=2)
+    args = parser.parse_args()
+
+    audio = build_float_wav(args.megabytes)
+    wav_info = get_wav_info(audio)
+    assert convert_float32_to_int16(audio, wav_info) == legacy_convert_float32_to_int16(audio, wav_info)
+
+    vectorized_ms = time_per_call(convert_float32_to_int16, audio, wav_info, args.iterations)
+    legacy_ms = time_per_call(legacy_convert_float32_to_int16, audio, wav_info, args.legacy_iterations)
+    print(f"{len(audio) / 1024 / 1024:.1f} MB float32 WAV, {len(audio) // 4} samples")
+    print(f"{'vectorized (ms)':>16} {'legacy (ms)':>12}")
+    print(f"{vectorized_ms:>16.2f} {legacy_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
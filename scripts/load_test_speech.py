@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load test for /api/speech/transcribe: upload, transcribe and log under concurrency.
+
+Sends synthetic WAV recordings to a running server and reports throughput
+and latency percentiles. Start the server with the fake speech-to-text
+backend so the test measures this service rather than Google:
+
+    STT_BACKEND=fake STT_FAKE_LATENCY_MS=300 STT_FAKE_ERROR_RATE=0.01 \\
+        uvicorn app.main:app --workers 4
+
+Usage:
+    pip install httpx
+    python scripts/load_test_speech.py --base-url http://localhost:8000
+
+Options:
+    --requests N       Total uploads (default 500)
+    --concurrency N    Uploads in flight at once (default 32)
+    --duration-ms N    Length of each recording (default 1500)
+    --unique-audio     Make every recording distinct, so no upload is served
+                       from the transcription cache or already stored
+    --email/--password Test account, registered if it does not exist
+    --word-id UUID     Word to log against (default: first word in the catalog)
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import time
+import wave
+from collections import Counter
+
+import httpx
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def make_wav(duration_ms: int, seed: int) -> bytes:
+    """A 16-bit mono WAV tone; the seed changes the pitch and noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(SAMPLE_RATE * duration_ms // 1000) / SAMPLE_RATE
+    signal = 0.3 * np.sin(2 * np.pi * (200 + seed % 800) * t) + 0.01 * rng.standard_normal(t.size)
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((signal * 32767).astype("<i2").tobytes())
+    return output.getvalue()
+
+
+async def get_token(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/api/auth/login", json={"email": email, "password": password})
+    if response.status_code != 200:
+        response = await client.post("/api/auth/register", json={
+            "email": email,
+            "username": email.split("@")[0],
+            "password": password,
+        })
+        response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def get_first_word_id(client: httpx.AsyncClient) -> str:
+    async with client.stream("GET", "/api/admin/words", params={"format": "ndjson"}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line:
+                return json.loads(line)["id"]
+    raise SystemExit("The word catalog is empty; seed it or pass --word-id")
+
+
+async def run(args) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        token = await get_token(client, args.email, args.password)
+        word_id = args.word_id or await get_first_word_id(client)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        shared_audio = make_wav(args.duration_ms, 0)
+        latencies = []
+        outcomes = Counter()
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def upload(i: int) -> None:
+            audio = make_wav(args.duration_ms, i + 1) if args.unique_audio else shared_audio
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/speech/transcribe",
+                        headers=headers,
+                        data={"word_id": word_id, "platform": "web"},
+                        files={"audio": ("recording.wav", audio, "audio/wav")},
+                    )
+                except httpx.HTTPError as e:
+                    outcomes[f"error: {type(e).__name__}"] += 1
+                    return
+                latencies.append((time.perf_counter() - start) * 1000)
+
+            if response.status_code != 200:
+                outcomes[f"HTTP {response.status_code}"] += 1
+            elif response.json()["success"]:
+                outcomes["success"] += 1
+            else:
+                outcomes[f"failed: {response.json()['error']}"] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(upload(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.requests} uploads, concurrency {args.concurrency}, "
+          f"{'unique' if args.unique_audio else 'identical'} audio")
+    print(f"throughput: {args.requests / elapsed:.1f} req/s over {elapsed:.1f}s")
+    if latencies:
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"latency (ms): mean {statistics.fmean(latencies):.1f}  p50 {quantiles[49]:.1f}  "
+              f"p95 {quantiles[94]:.1f}  p99 {quantiles[98]:.1f}  max {max(latencies):.1f}")
+    for outcome, count in outcomes.most_common():
+        print(f"{count:>8}  {outcome}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration-ms", type=int, default=1500)
+    parser.add_argument("--unique-audio", action="store_true")
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--word-id")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
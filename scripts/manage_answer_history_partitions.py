@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Create and archive the monthly answer_history partitions.
+
+answer_history is range-partitioned by month (APP_TIMEZONE). Run both
+commands from cron, e.g. daily:
+
+    # Make sure the next months already have a partition
+    python scripts/manage_answer_history_partitions.py create --months-ahead 3
+
+    # Dump months older than the retention window to gzip CSV and drop them
+    python scripts/manage_answer_history_partitions.py archive \\
+        --keep-months 12 --output-dir data/answer_history_archive
+
+create also creates the partition for any month that has rows in the
+default partition, and moves those rows into it. Each partition is archived
+in its own transaction; a failed dump leaves the partition attached.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.services.answer_history_partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    archive_partition,
+    create_month_partitions,
+    current_month,
+    list_month_partitions,
+)
+
+
+def count_default_rows(conn) -> int:
+    return conn.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}")).scalar()
+
+
+def create(args):
+    with engine.begin() as conn:
+        stranded = count_default_rows(conn)
+        created = create_month_partitions(conn, current_month(), args.months_ahead + 1)
+        left = count_default_rows(conn)
+    for name in created:
+        print(f"Created {name}")
+    print(f"Created {len(created)} partition(s).")
+    if stranded:
+        print(f"Moved {stranded - left} row(s) out of {DEFAULT_PARTITION}.")
+    if left:
+        print(f"Error: {DEFAULT_PARTITION} still holds {left} row(s).", file=sys.stderr)
+        sys.exit(1)
+
+
+def archive(args):
+    cutoff = add_months(current_month(), -args.keep_months)
+    with engine.connect() as conn:
+        expired = [name for name, month in list_month_partitions(conn) if month < cutoff]
+        default_rows = count_default_rows(conn)
+
+    if default_rows:
+        print(f"Warning: {DEFAULT_PARTITION} holds {default_rows} row(s); "
+              "run the create command to move them into monthly partitions.")
+
+    for name in expired:
+        if args.dry_run:
+            print(f"Would archive {name}")
+            continue
+        with engine.begin() as conn:
+            path, rows = archive_partition(conn, name, Path(args.output_dir))
+        print(f"Archived {name}: {rows} row(s) -> {path}")
+    print(f"{len(expired)} partition(s) older than {cutoff:%Y-%m}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="Create upcoming monthly partitions")
+    create_parser.add_argument("--months-ahead", type=int, default=3)
+    create_parser.set_defaults(func=create)
+
+    archive_parser = subparsers.add_parser("archive", help="Archive and drop expired partitions")
+    archive_parser.add_argument("--keep-months", type=int, default=12)
+    archive_parser.add_argument("--output-dir", default="data/answer_history_archive")
+    archive_parser.add_argument("--dry-run", action="store_true")
+    archive_parser.set_defaults(func=archive)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Reassign words.random_key so sampled word groups change over time.
+
+Sampling reads words in random_key order from a random offset, so words
+that sit next to each other tend to show up together. Rotating the keys
+periodically (e.g. daily from cron) reshuffles those neighbourhoods.
+
+Keys are updated in id-ordered batches, each in its own transaction, to
+keep row locks short.
+
+Usage:
+    python scripts/rotate_word_random_keys.py [--batch-size 5000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.database import SessionLocal
+from app.repositories.word_repository import WordRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        word_repo = WordRepository(db)
+        last_id = None
+        batches = 0
+        while True:
+            last_id = word_repo.rotate_random_keys(last_id, args.batch_size)
+            if last_id is None:
+                break
+            batches += 1
+        print(f"Rotated random keys in {batches} batch(es).")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Tests for creating answer_history partitions over rows stranded in the
+default partition.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_answer_history_partitions.py
+"""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from app.models import AnswerHistory, Word
+from app.services.answer_history_partitions import (
+    DEFAULT_PARTITION,
+    create_month_partitions,
+    list_month_partitions,
+)
+
+
+def add_answers(db, user, times):
+    word = Word(word="apple", translation="蘋果")
+    db.add(word)
+    db.flush()
+    for created_at in times:
+        db.add(AnswerHistory(
+            user_id=user.id, word_id=word.id, word="apple", is_correct=True,
+            exercise_type="reading_lv1", source="practice", pool="P1", created_at=created_at,
+        ))
+    db.commit()
+
+
+def rows_in(db, table):
+    return db.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+
+def test_create_moves_rows_out_of_the_default_partition(db, user):
+    add_answers(db, user, [
+        datetime(2031, 4, 10, tzinfo=timezone.utc),
+        # 04:00 on April 1st in APP_TIMEZONE (UTC+8)
+        datetime(2031, 3, 31, 20, 0, tzinfo=timezone.utc),
+        datetime(2031, 3, 15, tzinfo=timezone.utc),
+        # Outside the requested window: its month is created too
+        datetime(2030, 11, 2, tzinfo=timezone.utc),
+    ])
+    assert rows_in(db, DEFAULT_PARTITION) == 4
+
+    created = create_month_partitions(db.connection(), date(2031, 3, 1), 2)
+    db.commit()
+
+    assert created == ["answer_history_2030_11", "answer_history_2031_03", "answer_history_2031_04"]
+    assert rows_in(db, DEFAULT_PARTITION) == 0
+    assert rows_in(db, "answer_history_2031_04") == 2
+    assert rows_in(db, "answer_history_2031_03") == 1
+    assert rows_in(db, "answer_history_2030_11") == 1
+    assert rows_in(db, "answer_history") == 4
+
+    # The default partition is attached again and still catches new rows
+    db.execute(text(
+        "INSERT INTO answer_history (id, user_id, word_id, word, is_correct, exercise_type, source, pool, created_at) "
+        "SELECT gen_random_uuid(), user_id, word_id, word, is_correct, exercise_type, source, pool, :t "
+        "FROM answer_history LIMIT 1"
+    ), {"t": datetime(2040, 1, 1, tzinfo=timezone.utc)})
+    db.commit()
+    assert rows_in(db, DEFAULT_PARTITION) == 1
+
+
+def test_create_is_idempotent(db):
+    conn = db.connection()
+    first = create_month_partitions(conn, date(2032, 1, 1), 2)
+    assert create_month_partitions(conn, date(2032, 1, 1), 2) == []
+    db.commit()
+
+    months = [month for _, month in list_month_partitions(db.connection())]
+    assert first == ["answer_history_2032_01", "answer_history_2032_02"]
+    assert date(2032, 1, 1) in months and date(2032, 2, 1) in months
@@ -0,0 +1,158 @@
+"""
+Tests for the BatchWriter retry and dead-letter handling.
+
+A record that can never be written must not hold up the rest of the queue:
+after max_retries failed flushes its batch is written row by row and the
+bad rows are dead-lettered. Connection errors are retried without limit.
+
+Run:
+    python -m pytest tests/test_batch_writer.py
+"""
+
+import asyncio
+import json
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.repositories import answer_history_repository
+from app.services.batch_writer import BatchWriter
+
+
+class FakeTable:
+    """write_batch stand-in: all-or-nothing, fails on records in poison."""
+
+    def __init__(self, poison=(), down=False):
+        self.rows = []
+        self.poison = set(poison)
+        self.down = down
+        self.calls = 0
+
+    def write_batch(self, records):
+        self.calls += 1
+        if self.down:
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+        bad = [r for r in records if r["id"] in self.poison]
+        if bad:
+            raise IntegrityError("INSERT", {}, Exception(f"bad row {bad[0]['id']}"))
+        self.rows.extend(records)
+
+
+def make_writer(table, tmp_path, max_retries=3, batch_size=10):
+    return BatchWriter(
+        "test",
+        table.write_batch,
+        enabled=False,
+        max_queue=1000,
+        batch_size=batch_size,
+        flush_interval=3600,
+        max_retries=max_retries,
+        dead_letter_dir=str(tmp_path),
+    )
+
+
+def queue(writer, records):
+    """Start the writer and queue records without a background flush running."""
+    async def run():
+        await writer.start()
+        writer._task.cancel()
+        assert writer.submit(records)
+    asyncio.run(run())
+    writer._running = False
+
+
+def dead_letters(tmp_path):
+    path = tmp_path / "test.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_poison_record_is_dead_lettered_after_max_retries(tmp_path):
+    table = FakeTable(poison={3})
+    writer = make_writer(table, tmp_path)
+    queue(writer, [{"id": i} for i in range(25)])
+
+    # The first batch (0-9) fails on every flush until the retries run out
+    for _ in range(3):
+        writer.flush()
+        assert table.rows == []
+        assert writer.queue_depth == 25
+
+    writer.flush()
+
+    assert sorted(r["id"] for r in table.rows) == [i for i in range(25) if i != 3]
+    assert writer.queue_depth == 0
+    assert writer.dead_lettered == 1
+    assert writer.flush_errors == 3
+    letters = dead_letters(tmp_path)
+    assert [letter["record"] for letter in letters] == [{"id": 3}]
+    assert "IntegrityError" in letters[0]["error"]
+
+
+def test_connection_errors_do_not_use_up_retries(tmp_path):
+    table = FakeTable(down=True)
+    writer = make_writer(table, tmp_path, max_retries=1)
+    queue(writer, [{"id": i} for i in range(5)])
+
+    for _ in range(5):
+        writer.flush()
+    assert writer.queue_depth == 5
+    assert writer.dead_lettered == 0
+
+    table.down = False
+    writer.flush()
+
+    assert len(table.rows) == 5
+    assert writer.queue_depth == 0
+    assert dead_letters(tmp_path) == []
+
+
+def test_retry_keeps_record_order(tmp_path):
+    table = FakeTable(down=True)
+    writer = make_writer(table, tmp_path, batch_size=3)
+    queue(writer, [{"id": i} for i in range(7)])
+
+    writer.flush()
+    table.down = False
+    writer.flush()
+
+    assert [r["id"] for r in table.rows] == list(range(7))
+
+
+def test_stop_dead_letters_what_cannot_be_written(tmp_path):
+    table = FakeTable(down=True)
+    writer = make_writer(table, tmp_path)
+    queue(writer, [{"id": i} for i in range(4)])
+
+    writer._drain()
+
+    assert writer.queue_depth == 0
+    assert sorted(letter["record"]["id"] for letter in dead_letters(tmp_path)) == [0, 1, 2, 3]
+
+
+def test_stop_isolates_poison_records(tmp_path):
+    table = FakeTable(poison={1})
+    writer = make_writer(table, tmp_path)
+    queue(writer, [{"id": i} for i in range(4)])
+
+    writer._drain()
+
+    assert sorted(r["id"] for r in table.rows) == [0, 2, 3]
+    assert [letter["record"]["id"] for letter in dead_letters(tmp_path)] == [1]
+
+
+def test_failed_write_after_commit_does_not_fail_the_commit(db, monkeypatch):
+    repo = answer_history_repository
+
+    def failing_submit(records):
+        raise IntegrityError("INSERT", {}, Exception("fallback write failed"))
+
+    dead = []
+    monkeypatch.setattr(repo.answer_history_writer, "submit", failing_submit)
+    monkeypatch.setattr(repo.answer_history_writer, "dead_letter", lambda records, e: dead.extend(records))
+
+    db.info[repo._PENDING_ANSWERS] = [{"id": 1}]
+    db.commit()
+
+    assert dead == [{"id": 1}]
+    assert repo._PENDING_ANSWERS not in db.info
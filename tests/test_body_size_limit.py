@@ -0,0 +1,112 @@
+"""
+Tests for BodySizeLimitMiddleware.
+
+The middleware is driven directly over ASGI: an oversized Content-Length is
+refused before the body is read, a chunked body is cut off with 413 as soon
+as it crosses the limit, and anything under the limit reaches the app.
+
+Run:
+    python -m pytest tests/test_body_size_limit.py
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.middleware import BodySizeLimitMiddleware  # noqa: E402
+
+LIMIT = 1000
+
+
+async def echo_length(scope, receive, send):
+    """Read the whole body and answer with its length."""
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        size += len(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    body = json.dumps({"size": size}).encode()
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def request(chunks, content_length=None, path="/upload"):
+    """
+    Send chunks through the middleware.
+
+    Returns:
+        (status, parsed JSON body, number of chunks the middleware read)
+    """
+    headers = [] if content_length is None else [(b"content-length", str(content_length).encode())]
+    scope = {"type": "http", "method": "POST", "path": path, "headers": headers}
+    pending = list(chunks)
+    read = 0
+    sent = []
+
+    async def receive():
+        nonlocal read
+        if not pending:
+            return {"type": "http.disconnect"}
+        read += 1
+        body = pending.pop(0)
+        return {"type": "http.request", "body": body, "more_body": bool(pending)}
+
+    async def send(message):
+        sent.append(message)
+
+    app = BodySizeLimitMiddleware(echo_length, limits={"/upload": LIMIT})
+    asyncio.run(app(scope, receive, send))
+
+    start = next(m for m in sent if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return start["status"], json.loads(body), read
+
+
+def test_content_length_over_the_limit_is_refused_unread():
+    status, body, read = request([b"x" * 2000], content_length=2000)
+
+    assert status == 413
+    assert body["detail"] == f"Request body too large. Maximum size is {LIMIT} bytes"
+    assert read == 0
+
+
+def test_chunked_body_over_the_limit_is_cut_off():
+    chunks = [b"x" * 300] * 10
+
+    status, body, read = request(chunks)
+
+    assert status == 413
+    assert "Maximum size is 1000 bytes" in body["detail"]
+    # Stopped at the fourth chunk (1200 bytes), not after all ten
+    assert read == 4
+
+
+def test_understated_content_length_is_still_cut_off():
+    status, _, read = request([b"x" * 300] * 10, content_length=10)
+
+    assert status == 413
+    assert read == 4
+
+
+def test_body_under_the_limit_passes():
+    status, body, _ = request([b"x" * 400, b"x" * 400, b"x" * 200], content_length=LIMIT)
+
+    assert status == 200
+    assert body == {"size": LIMIT}
+
+
+def test_other_paths_are_not_limited():
+    status, body, _ = request([b"x" * 5000], content_length=5000, path="/other")
+
+    assert status == 200
+    assert body == {"size": 5000}
+
+
+def test_trailing_slash_uses_the_same_limit():
+    status, _, _ = request([b"x" * 2000], content_length=2000, path="/upload/")
+
+    assert status == 413
@@ -0,0 +1,126 @@
+"""
+Tests for the user_daily_activity rollup behind today_learned and
+today_completed.
+
+Learn and practice completions bump today's row in their own transaction,
+the snapshot reads only today's row, and days are APP_TIMEZONE (UTC+8)
+calendar days, both for the counters and for rebuild().
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_daily_activity.py
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from app.models import AnswerHistory, UserDailyActivity, Word, WordProgress
+from app.repositories.answer_history_repository import AnswerHistoryRepository
+from app.repositories.daily_activity_repository import DailyActivityRepository, local_date
+from app.repositories.progress_repository import ProgressRepository
+from app.routers.learn import complete_learn
+from app.routers.practice import submit_practice
+from app.schemas.common import AnswerSchema
+from app.schemas.learn import LearnCompleteRequest
+from app.schemas.practice import PracticeSubmitRequest
+
+
+def add_words(db, count, prefix="word"):
+    words = [Word(word=f"{prefix}{i}", translation="x") for i in range(count)]
+    db.add_all(words)
+    db.commit()
+    return words
+
+
+def answer(word, correct=True, exercise_type="reading_lv1"):
+    return AnswerSchema(word_id=str(word.id), correct=correct, exercise_type=exercise_type)
+
+
+def test_learn_completion_counts_learned_today(db, user):
+    words = add_words(db, 3)
+
+    response = complete_learn(
+        LearnCompleteRequest(word_ids=[str(w.id) for w in words], answers=[answer(words[0])]),
+        current_user=user,
+        db=db,
+    )
+
+    assert response.today_learned == 3
+    # Learn answers are not completed exercises
+    assert DailyActivityRepository(db).get_day(user.id) == (3, 0)
+    assert ProgressRepository(db).get_availability_snapshot(user.id).today_learned == 3
+
+
+def test_practice_completion_counts_completed_today(db, user):
+    words = add_words(db, 2)
+    for word in words:
+        db.add(WordProgress(
+            user_id=user.id, word_id=word.id, pool="P1",
+            next_available_time=datetime.now(timezone.utc) - timedelta(minutes=1),
+        ))
+    db.commit()
+
+    submit_practice(
+        PracticeSubmitRequest(answers=[answer(words[0]), answer(words[1], correct=False)]),
+        current_user=user,
+        db=db,
+    )
+
+    assert DailyActivityRepository(db).get_day(user.id) == (0, 2)
+    assert AnswerHistoryRepository(db).count_today_completed(user.id) == 2
+
+
+def test_snapshot_reads_only_todays_row(db, user):
+    today = local_date()
+    repo = DailyActivityRepository(db)
+    repo.increment(user.id, learned=7, activity_date=today - timedelta(days=1))
+    repo.increment(user.id, learned=2, activity_date=today)
+    repo.increment(user.id, learned=1, activity_date=today)
+    db.commit()
+
+    assert ProgressRepository(db).get_availability_snapshot(user.id).today_learned == 3
+
+
+def test_local_date_boundary_is_utc_plus_8():
+    assert local_date(datetime(2026, 3, 1, 15, 59, 59, tzinfo=timezone.utc)) == date(2026, 3, 1)
+    assert local_date(datetime(2026, 3, 1, 16, 0, 0, tzinfo=timezone.utc)) == date(2026, 3, 2)
+
+
+def test_learned_days_split_at_local_midnight(db, user):
+    words = add_words(db, 3)
+    before = datetime(2026, 3, 1, 15, 59, 59, tzinfo=timezone.utc)  # 23:59:59 local
+    after = datetime(2026, 3, 1, 16, 0, 0, tzinfo=timezone.utc)     # 00:00 local, next day
+    repo = ProgressRepository(db)
+    repo.bulk_create_learned(user.id, [words[0].id], before, after + timedelta(hours=1))
+    repo.bulk_create_learned(user.id, [w.id for w in words[1:]], after, after + timedelta(hours=1))
+    db.commit()
+
+    daily = DailyActivityRepository(db)
+    assert daily.get_day(user.id, date(2026, 3, 1)) == (1, 0)
+    assert daily.get_day(user.id, date(2026, 3, 2)) == (2, 0)
+
+
+def test_rebuild_uses_the_same_local_days(db, user):
+    words = add_words(db, 2)
+    before = datetime(2026, 3, 1, 15, 59, 59, tzinfo=timezone.utc)
+    after = datetime(2026, 3, 1, 16, 0, 0, tzinfo=timezone.utc)
+    ProgressRepository(db).bulk_create_learned(user.id, [words[0].id], before, after)
+    ProgressRepository(db).bulk_create_learned(user.id, [words[1].id], after, after)
+    for created_at, source in [(before, "practice"), (after, "review_practice"), (after, "learn")]:
+        db.add(AnswerHistory(
+            user_id=user.id, word_id=words[0].id, word=words[0].word, is_correct=True,
+            exercise_type="reading_lv1", source=source, pool="P1", created_at=created_at,
+        ))
+    db.commit()
+    incremental = {
+        (row.activity_date, row.learned)
+        for row in db.query(UserDailyActivity).filter(UserDailyActivity.user_id == user.id)
+    }
+
+    daily = DailyActivityRepository(db)
+    daily.rebuild(user.id)
+    db.commit()
+
+    assert daily.get_day(user.id, date(2026, 3, 1)) == (1, 1)
+    assert daily.get_day(user.id, date(2026, 3, 2)) == (1, 1)
+    assert incremental == {(date(2026, 3, 1), 1), (date(2026, 3, 2), 1)}
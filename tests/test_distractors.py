@@ -0,0 +1,104 @@
+"""
+Tests for sample_distractors in session_service.
+
+Whatever mix of session words, neighbours and random catalog picks it uses,
+the sampler must return distinct words, never the correct word, and cope
+with catalogs too small to fill every option.
+
+Run:
+    python -m pytest tests/test_distractors.py
+"""
+
+import random
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.session_service import sample_distractors  # noqa: E402
+from app.services.word_catalog import CatalogWord, WordCatalog  # noqa: E402
+from app.utils.constants import OPTIONS_COUNT  # noqa: E402
+
+
+def make_catalog(count: int, buckets=((1, 1),)) -> WordCatalog:
+    words = tuple(
+        CatalogWord(uuid.uuid4(), f"word{i}", f"translation{i}", None, None, *buckets[i % len(buckets)])
+        for i in range(count)
+    )
+    return WordCatalog(words)
+
+
+def check(distractors, correct, k=OPTIONS_COUNT - 1):
+    ids = [w.id for w in distractors]
+    assert len(ids) == len(set(ids)), "duplicate distractor"
+    assert correct.id not in ids, "correct word used as a distractor"
+    assert len(ids) <= k
+
+
+def test_distinct_and_never_the_correct_word():
+    random.seed(1)
+    catalog = make_catalog(500, buckets=((1, 1), (1, 2), (2, 1)))
+    for correct in catalog:
+        distractors = sample_distractors(correct, catalog)
+        check(distractors, correct)
+        assert len(distractors) == OPTIONS_COUNT - 1
+
+
+def test_session_words_first_without_duplicates():
+    random.seed(2)
+    catalog = make_catalog(200)
+    correct = catalog[0]
+    # The session includes the correct word and overlaps its neighbours
+    session = [catalog[i] for i in (0, *catalog.neighbours_of(0)[:2])]
+
+    for _ in range(200):
+        distractors = sample_distractors(correct, catalog, session)
+        check(distractors, correct)
+        assert len(distractors) == OPTIONS_COUNT - 1
+        assert set(session[1:]) <= set(distractors)
+
+
+def test_more_session_words_than_slots():
+    random.seed(3)
+    catalog = make_catalog(50)
+    correct = catalog[0]
+    session = list(catalog[:20])
+
+    distractors = sample_distractors(correct, catalog, session)
+
+    check(distractors, correct)
+    assert len(distractors) == OPTIONS_COUNT - 1
+    assert set(distractors) <= set(session)
+
+
+def test_catalog_too_small_to_fill_every_option():
+    random.seed(4)
+    for size in range(1, OPTIONS_COUNT + 1):
+        catalog = make_catalog(size)
+        correct = catalog[0]
+
+        distractors = sample_distractors(correct, catalog)
+
+        check(distractors, correct)
+        assert set(distractors) == set(catalog[1:])
+
+
+def test_catalog_just_large_enough():
+    random.seed(5)
+    catalog = make_catalog(OPTIONS_COUNT, buckets=((1, 1), (2, 2)))
+    for correct in catalog:
+        distractors = sample_distractors(correct, catalog)
+        check(distractors, correct)
+        assert len(distractors) == OPTIONS_COUNT - 1
+
+
+def test_correct_word_missing_from_the_catalog():
+    random.seed(6)
+    catalog = make_catalog(3)
+    correct = make_catalog(1)[0]
+
+    distractors = sample_distractors(correct, catalog)
+
+    check(distractors, correct)
+    assert set(distractors) == set(catalog)
@@ -0,0 +1,104 @@
+"""
+Tests for the Bloom filter duplicate check on tracked events.
+
+The filter may let a duplicate through (the unique index catches it) but
+must never report a stored key as unseen within its window, and its
+false-positive rate must stay close to the configured error_rate.
+
+Run:
+    python -m pytest tests/test_event_dedup.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import event_dedup as dedup  # noqa: E402
+from app.services.event_dedup import (  # noqa: E402
+    BloomFilter,
+    RotatingBloomFilter,
+    drop_duplicate_events,
+)
+
+
+def test_no_false_negatives():
+    bloom = BloomFilter(capacity=10000, error_rate=0.01)
+    keys = [f"device\x00{i}" for i in range(10000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    assert bloom.count == 10000
+
+
+def test_false_positive_rate_near_configured():
+    for error_rate in (0.01, 0.001):
+        bloom = BloomFilter(capacity=20000, error_rate=error_rate)
+        for i in range(20000):
+            bloom.add(f"stored-{i}")
+
+        probes = 200000
+        false_positives = sum(f"new-{i}" in bloom for i in range(probes))
+        assert error_rate * 0.5 < false_positives / probes < error_rate * 1.5
+
+
+def test_rotation_keeps_previous_generation():
+    bloom = RotatingBloomFilter(capacity=1000, error_rate=0.001, window_seconds=60)
+    bloom.add(["first"])
+
+    # One window later the first generation becomes the previous one
+    bloom._rotated_at -= 60
+    bloom.add(["second"])
+    assert bloom.rotations == 1
+    assert bloom.seen("first")
+    assert bloom.seen("second")
+
+    # After a second rotation "first" is forgotten, "second" is not
+    bloom._rotated_at -= 60
+    assert not bloom.seen("first")
+    assert bloom.seen("second")
+    assert bloom.rotations == 2
+
+
+def test_rotates_early_when_the_generation_is_full():
+    bloom = RotatingBloomFilter(capacity=100, error_rate=0.01, window_seconds=3600)
+    bloom.add([f"a{i}" for i in range(100)])
+    bloom.add(["b"])
+
+    assert bloom.rotations == 1
+    assert bloom.stats()["current_keys"] == 1
+    assert all(bloom.seen(f"a{i}") for i in range(100))
+
+
+def test_drop_duplicate_events(monkeypatch):
+    monkeypatch.setattr(dedup.settings, "event_dedup_enabled", True)
+    monkeypatch.setattr(dedup, "event_dedup", RotatingBloomFilter(1000, 0.001, 3600))
+
+    events = [
+        {"device_id": "d1", "event_id": "e1"},
+        {"device_id": "d1", "event_id": "e2"},
+        {"device_id": "d1", "event_id": "e1"},   # Repeat within the batch
+        {"device_id": "d2", "event_id": "e1"},   # Same event_id, other device
+        {"device_id": "d1", "event_id": None},
+        {"device_id": "d1", "event_id": None},   # No event_id: never dropped
+    ]
+    kept, keys, dropped = drop_duplicate_events(events)
+
+    assert kept == [events[0], events[1], events[3], events[4], events[5]]
+    assert keys == ["d1\x00e1", "d1\x00e2", "d2\x00e1"]
+    assert dropped == 1
+
+    # Once stored, a retry of the same batch is dropped entirely
+    dedup.event_dedup.add(keys)
+    kept, keys, dropped = drop_duplicate_events(events[:4])
+    assert kept == []
+    assert keys == []
+    assert dropped == 4
+
+
+def test_drop_duplicate_events_disabled(monkeypatch):
+    monkeypatch.setattr(dedup.settings, "event_dedup_enabled", False)
+    events = [{"device_id": "d1", "event_id": "e1"}] * 2
+
+    assert drop_duplicate_events(events) == (events, [], 0)
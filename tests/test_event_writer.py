@@ -0,0 +1,95 @@
+"""
+Tests for buffered /api/track ingestion with events the database rejects.
+
+An event that can never be stored (here: a NUL character, which Postgres
+refuses in text and JSONB) must be dead-lettered without holding up the
+events around it, both from the background flush and from the
+synchronous fallback.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_event_writer.py
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models.event import Event
+from app.repositories import event_repository
+from app.services.batch_writer import BatchWriter
+
+
+def make_event(i, poison=False):
+    return {
+        "device_id": "device-1",
+        "event_id": f"event-{i}",
+        "user_id": None,
+        "session_id": "session-1",
+        "exercise_session_id": None,
+        "event_type": "action",
+        "event_name": "tapped",
+        "properties": {"note": "bad\x00value" if poison else "ok"},
+        "timestamp": datetime.now(timezone.utc),
+        "app_version": "1.0.0",
+        "platform": "ios",
+        "server_received_at": datetime.now(timezone.utc),
+    }
+
+
+@pytest.fixture
+def writer(db, engine, monkeypatch, tmp_path):
+    monkeypatch.setattr(event_repository, "SessionLocal", sessionmaker(bind=engine))
+    return BatchWriter(
+        "events",
+        event_repository._write_events,
+        enabled=False,
+        max_queue=1000,
+        batch_size=100,
+        flush_interval=3600,
+        max_retries=2,
+        dead_letter_dir=str(tmp_path),
+    )
+
+
+def stored_event_ids(db):
+    db.expire_all()
+    return set(db.execute(select(Event.event_id)).scalars())
+
+
+def dead_lettered_event_ids(tmp_path):
+    lines = (tmp_path / "events.jsonl").read_text().splitlines()
+    return [json.loads(line)["record"]["event_id"] for line in lines]
+
+
+def test_poison_event_does_not_block_buffered_ingestion(db, writer, tmp_path):
+    writer._running = True
+    writer.submit([make_event(i, poison=(i == 2)) for i in range(5)])
+    writer._running = False
+
+    for _ in range(writer.max_retries):
+        writer.flush()
+        assert stored_event_ids(db) == set()
+
+    writer.flush()
+    # Later events are not held up either
+    writer._running = True
+    writer.submit([make_event(i) for i in range(5, 8)])
+    writer._running = False
+    writer.flush()
+
+    assert stored_event_ids(db) == {f"event-{i}" for i in range(8) if i != 2}
+    assert dead_lettered_event_ids(tmp_path) == ["event-2"]
+    assert writer.queue_depth == 0
+
+
+def test_poison_event_in_synchronous_write(db, writer, tmp_path):
+    assert writer.submit([make_event(i, poison=(i == 0)) for i in range(3)]) is False
+
+    assert stored_event_ids(db) == {"event-1", "event-2"}
+    assert dead_lettered_event_ids(tmp_path) == ["event-0"]
+    assert db.execute(select(func.count()).select_from(Event)).scalar() == 2
@@ -0,0 +1,115 @@
+"""
+Tests for the learn session's use of the cached curriculum.
+
+The catalog is cached per worker, so words seeded elsewhere after it was
+loaded must still be found rather than reported as no_words_in_p0, and
+completing a session must place the user by the database's curriculum,
+not the cached one.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_learn_session.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import UserLearnedCount, Word, WordCategory, WordLevel, WordProgress
+from app.routers.learn import complete_learn, get_learn_session
+from app.schemas.learn import LearnCompleteRequest
+from app.services.word_catalog import get_word_catalog, invalidate_word_catalog
+
+
+@pytest.fixture
+def curriculum(db, user):
+    db.add(WordLevel(id=1, label="L1", order=1))
+    db.add_all([WordCategory(id=1, label="C1", order=1), WordCategory(id=2, label="C2", order=2)])
+    db.flush()
+    user.current_level_id = 1
+    user.current_category_id = 1
+    db.commit()
+    invalidate_word_catalog()
+    yield
+    invalidate_word_catalog()
+
+
+def add_words(db, category_id, names):
+    words = [Word(word=name, translation=name, level_id=1, category_id=category_id) for name in names]
+    db.add_all(words)
+    db.commit()
+    return words
+
+
+def learn(db, user, words):
+    """Move words out of P0, keeping the learned counters in step."""
+    later = datetime.now(timezone.utc) + timedelta(days=1)
+    for word in words:
+        db.add(WordProgress(user_id=user.id, word_id=word.id, pool="P2", next_available_time=later))
+    db.add(UserLearnedCount(user_id=user.id, level_id=1, category_id=1, learned=len(words)))
+    db.commit()
+
+
+def test_finds_words_seeded_after_the_catalog_was_loaded(db, user, curriculum):
+    learn(db, user, add_words(db, 1, [f"old{i}" for i in range(5)]))
+    get_word_catalog(db)
+
+    # Seeded by another worker: this worker's catalog does not know category 2
+    add_words(db, 2, ["new0", "new1", "new2"])
+
+    response = get_learn_session(current_user=user, db=db)
+
+    assert response.available is True
+    assert sorted(w.word for w in response.words) == ["new0", "new1", "new2"]
+
+
+def test_tops_up_a_short_bucket_from_the_database(db, user, curriculum):
+    add_words(db, 1, ["cached0", "cached1"])
+    get_word_catalog(db)
+    add_words(db, 1, ["late0", "late1", "late2"])
+
+    response = get_learn_session(current_user=user, db=db)
+
+    assert sorted(w.word for w in response.words) == ["cached0", "cached1", "late0", "late1", "late2"]
+
+
+def complete(db, user, words):
+    request = LearnCompleteRequest(word_ids=[str(w.id) for w in words], answers=[])
+    return complete_learn(request, current_user=user, db=db)
+
+
+def test_complete_advances_to_the_furthest_learned_bucket(db, user, curriculum):
+    words = add_words(db, 1, ["a0"]) + add_words(db, 2, ["b0"])
+
+    complete(db, user, words)
+
+    db.refresh(user)
+    assert (user.current_level_id, user.current_category_id) == (1, 2)
+
+
+def test_complete_uses_current_orders_from_the_database(db, user, curriculum):
+    words = add_words(db, 1, ["a0"])
+    get_word_catalog(db)
+
+    # Level 2 added after this worker cached the catalog; the user is on it
+    db.add(WordLevel(id=2, label="L2", order=2))
+    db.flush()
+    user.current_level_id = 2
+    db.commit()
+
+    complete(db, user, words)
+
+    # Learning a level 1 word must not move the user back to level 1
+    db.refresh(user)
+    assert (user.current_level_id, user.current_category_id) == (2, 1)
+
+
+def test_complete_places_a_user_without_a_category(db, user, curriculum):
+    user.current_category_id = None
+    db.commit()
+
+    complete(db, user, add_words(db, 1, ["a0"]))
+
+    db.refresh(user)
+    assert (user.current_level_id, user.current_category_id) == (1, 1)
@@ -0,0 +1,125 @@
+"""
+Tests for the streaming NDJSON splitter and gunzip in app/services/ndjson.py.
+
+Lines must come out the same however the body is split into chunks, and a
+bad or oversized gzip body must fail with NDJSONDecodeError rather than a
+zlib error or an unbounded buffer.
+
+Run:
+    python -m pytest tests/test_ndjson.py
+"""
+
+import asyncio
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.ndjson import (  # noqa: E402
+    NDJSONDecodeError,
+    NDJSONTooLargeError,
+    iter_ndjson_lines,
+)
+
+
+def split(body: bytes, size: int) -> list:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def read_lines(chunks, gzipped=False, max_line_bytes=100, max_inflated_bytes=None) -> list:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def run():
+        return [
+            item async for item in iter_ndjson_lines(
+                stream(), gzipped, max_line_bytes, max_inflated_bytes
+            )
+        ]
+    return asyncio.run(run())
+
+
+BODY = b'{"a": 1}\n{"b": 22}\n\n{"c": 333}\n'
+EXPECTED = [(1, b'{"a": 1}'), (2, b'{"b": 22}'), (4, b'{"c": 333}')]
+
+
+def test_chunk_boundaries_in_the_middle_of_a_line():
+    for size in range(1, len(BODY) + 1):
+        assert read_lines(split(BODY, size)) == EXPECTED
+
+
+def test_gzip_chunk_boundaries_in_the_middle_of_a_line():
+    compressed = gzip.compress(BODY)
+    for size in range(1, len(compressed) + 1):
+        assert read_lines(split(compressed, size), gzipped=True) == EXPECTED
+
+
+def test_crlf_line_endings():
+    body = BODY.replace(b"\n", b"\r\n")
+    for size in (1, 2, 5, len(body)):
+        assert read_lines(split(body, size)) == EXPECTED
+
+
+def test_trailing_line_without_newline():
+    body = BODY + b'{"d": 4}'
+    assert read_lines(split(body, 3)) == EXPECTED + [(5, b'{"d": 4}')]
+    assert read_lines([b'{"a": 1}\r']) == [(1, b'{"a": 1}')]
+    assert read_lines([]) == []
+
+
+def test_overlong_lines_are_reported_not_buffered():
+    long_line = b"x" * 250
+    body = b"short\n" + long_line + b"\nafter\n" + long_line
+    for size in (1, 7, 64, len(body)):
+        assert read_lines(split(body, size), max_line_bytes=100) == [
+            (1, b"short"),
+            (2, None),
+            (3, b"after"),
+            (4, None),
+        ]
+
+
+def test_line_at_the_limit_is_kept():
+    line = b"y" * 100
+    assert read_lines([line + b"\n" + line]) == [(1, line), (2, line)]
+    assert read_lines([line + b"y\n"]) == [(1, None)]
+
+
+def test_corrupt_gzip():
+    with pytest.raises(NDJSONDecodeError, match="Invalid gzip body"):
+        read_lines([b"this is not gzip at all\n"], gzipped=True)
+
+    compressed = bytearray(gzip.compress(BODY * 50))
+    compressed[len(compressed) // 2] ^= 0xFF
+    with pytest.raises(NDJSONDecodeError):
+        read_lines(split(bytes(compressed), 16), gzipped=True)
+
+
+def test_truncated_gzip():
+    compressed = gzip.compress(BODY * 50)
+    with pytest.raises(NDJSONDecodeError, match="Truncated gzip body"):
+        read_lines(split(compressed[:-10], 16), gzipped=True)
+
+
+def test_empty_gzip_body_is_not_truncated():
+    assert read_lines([], gzipped=True) == []
+
+
+def test_gzip_bomb_hits_the_decompression_cap():
+    # 64MB of newlines compresses to about 64KB
+    bomb = gzip.compress(b"\n" * (64 * 1024 * 1024), compresslevel=9)
+    assert len(bomb) < 100 * 1024
+
+    with pytest.raises(NDJSONTooLargeError, match="exceeds 1048576 bytes"):
+        read_lines(split(bomb, 8192), gzipped=True, max_inflated_bytes=1024 * 1024)
+
+
+def test_body_under_the_decompression_cap():
+    compressed = gzip.compress(BODY)
+    assert read_lines([compressed], gzipped=True, max_inflated_bytes=len(BODY)) == EXPECTED
+    with pytest.raises(NDJSONTooLargeError):
+        read_lines([compressed], gzipped=True, max_inflated_bytes=len(BODY) - 1)
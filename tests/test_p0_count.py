@@ -0,0 +1,87 @@
+"""
+Tests for the P0 count in the availability snapshot.
+
+P0 is the trigger-maintained catalog size minus the user's learned
+counters, so it must follow every kind of write to words without counting
+the table.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_p0_count.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, text
+
+from app.models import Word, WordCatalogVersion
+from app.repositories.progress_repository import ProgressRepository
+from app.repositories.word_repository import WordRepository
+
+
+def catalog_size(db) -> int:
+    return db.query(WordCatalogVersion.word_count).scalar()
+
+
+def test_catalog_size_follows_every_write(db):
+    repo = WordRepository(db)
+    repo.bulk_create([{"word": f"word{i}", "translation": "x"} for i in range(5)])
+    assert catalog_size(db) == 5
+
+    db.execute(text("INSERT INTO words (id, word, translation) VALUES (gen_random_uuid(), 'raw', 'x')"))
+    db.commit()
+    assert catalog_size(db) == 6
+
+    db.query(Word).filter(Word.word.in_(["word0", "word1"])).delete(synchronize_session=False)
+    db.commit()
+    assert catalog_size(db) == 4 == db.query(func.count(Word.id)).scalar()
+
+    # A rolled-back insert leaves it unchanged
+    db.add(Word(word="discarded", translation="x"))
+    db.flush()
+    db.rollback()
+    assert catalog_size(db) == 4
+
+    repo.delete_all()
+    assert catalog_size(db) == 0
+
+    db.execute(text("TRUNCATE words CASCADE"))
+    db.commit()
+    assert catalog_size(db) == 0
+
+
+def test_snapshot_p0_is_catalog_minus_learned(db, user):
+    words = [Word(word=f"word{i}", translation="x") for i in range(6)]
+    db.add_all(words)
+    db.commit()
+    repo = ProgressRepository(db)
+    assert repo.get_availability_snapshot(user.id).p0_count == 6
+
+    now = datetime.now(timezone.utc)
+    repo.bulk_create_learned(user.id, [w.id for w in words[:4]], now, now + timedelta(minutes=10))
+    db.commit()
+
+    assert repo.get_availability_snapshot(user.id).p0_count == 2
+    assert repo.count_p0_words(user.id) == 2
+
+    db.add(Word(word="new", translation="x"))
+    db.commit()
+    assert repo.get_availability_snapshot(user.id).p0_count == 3
+
+
+def test_snapshot_p0_never_negative(db, user):
+    word = Word(word="only", translation="x")
+    db.add(word)
+    db.commit()
+    repo = ProgressRepository(db)
+    now = datetime.now(timezone.utc)
+    repo.bulk_create_learned(user.id, [word.id], now, now)
+    db.commit()
+
+    # A learned counter left over from a deleted word
+    db.execute(text("DELETE FROM word_progress"))
+    db.execute(text("DELETE FROM words"))
+    db.commit()
+
+    assert repo.get_availability_snapshot(user.id).p0_count == 0
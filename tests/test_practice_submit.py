@@ -0,0 +1,111 @@
+"""
+Tests for /api/practice/submit writing a whole batch in one transaction.
+
+The batch is validated with one locked IN query, the transitions go out as
+one bulk UPDATE and the answers as one INSERT, all in a single commit: a
+bad word id must leave every row as it was and record no answers.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_practice_submit.py
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models import AnswerHistory, Word, WordProgress
+from app.repositories.daily_activity_repository import DailyActivityRepository
+from app.routers.practice import submit_practice
+from app.schemas.common import AnswerSchema
+from app.schemas.practice import PracticeSubmitRequest
+
+
+@pytest.fixture
+def progress(db, user):
+    """One due progress row per pool, keyed by pool."""
+    due = datetime.now(timezone.utc) - timedelta(minutes=1)
+    rows = {}
+    for pool in ("P1", "P3", "R2", "R4"):
+        word = Word(word=f"word_{pool}", translation="x")
+        db.add(word)
+        db.flush()
+        rows[pool] = WordProgress(
+            user_id=user.id, word_id=word.id, pool=pool, next_available_time=due,
+            is_in_review_phase=False,
+        )
+        db.add(rows[pool])
+    db.commit()
+    return rows
+
+
+def answer(word_id, correct):
+    return AnswerSchema(word_id=str(word_id), correct=correct, exercise_type="reading_lv1")
+
+
+def snapshot_rows(db):
+    db.expire_all()
+    return {
+        row.word_id: (row.pool, row.next_available_time, row.is_in_review_phase)
+        for row in db.query(WordProgress).all()
+    }
+
+
+def test_mixed_batch_applies_every_transition_in_one_commit(db, user, progress):
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+    answers = [
+        answer(progress["P1"].word_id, True),    # P1 -> P2
+        answer(progress["P3"].word_id, False),   # P3 -> R3, review phase
+        answer(progress["R2"].word_id, True),    # R2 -> P2
+        answer(progress["R4"].word_id, False),   # R4 stays, review phase
+        answer(progress["P1"].word_id, True),    # Repeated: chains P2 -> P3
+    ]
+
+    response = submit_practice(PracticeSubmitRequest(answers=answers), current_user=user, db=db)
+
+    assert len(commits) == 1
+    assert [(r.previous_pool, r.new_pool) for r in response.results] == [
+        ("P1", "P2"), ("P3", "R3"), ("R2", "P2"), ("R4", "R4"), ("P2", "P3"),
+    ]
+    assert (response.summary.correct_count, response.summary.incorrect_count) == (3, 2)
+
+    rows = snapshot_rows(db)
+    assert rows[progress["P1"].word_id][0] == "P3"
+    assert rows[progress["P3"].word_id][0::2] == ("R3", True)
+    assert rows[progress["R2"].word_id][0::2] == ("P2", False)
+    assert rows[progress["R4"].word_id][0::2] == ("R4", True)
+    now = datetime.now(timezone.utc)
+    assert all(next_time > now for _, next_time, _ in rows.values())
+
+    # Each answer recorded exactly once, with the pool it was answered from
+    history = db.query(AnswerHistory).order_by(AnswerHistory.created_at).all()
+    assert len(history) == 5
+    assert sorted((h.source, h.pool) for h in history) == sorted([
+        ("practice", "P1"), ("practice", "P3"), ("review_practice", "R2"),
+        ("review_practice", "R4"), ("practice", "P2"),
+    ])
+    assert DailyActivityRepository(db).get_day(user.id) == (0, 5)
+
+
+@pytest.mark.parametrize("bad_id", ["not-a-uuid", str(uuid.uuid4())])
+def test_bad_word_id_writes_nothing(db, user, progress, bad_id):
+    before = snapshot_rows(db)
+    answers = [
+        answer(progress["P1"].word_id, True),
+        answer(progress["R2"].word_id, False),
+        AnswerSchema(word_id=bad_id, correct=True, exercise_type="reading_lv1"),
+    ]
+
+    with pytest.raises(HTTPException) as error:
+        submit_practice(PracticeSubmitRequest(answers=answers), current_user=user, db=db)
+    db.rollback()
+
+    assert error.value.status_code == (400 if bad_id == "not-a-uuid" else 404)
+    assert snapshot_rows(db) == before
+    assert db.query(AnswerHistory).count() == 0
+    assert DailyActivityRepository(db).get_day(user.id) == (0, 0)
@@ -0,0 +1,97 @@
+"""
+Tests for /api/review/complete writing everything in one transaction.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_review_complete.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models import Word, WordProgress
+from app.repositories.progress_repository import ProgressRepository
+from app.routers.review import complete_review
+from app.schemas.review import ReviewCompleteRequest
+
+
+def add_progress(db, user, pools):
+    rows = []
+    for i, pool in enumerate(pools):
+        word = Word(word=f"word{i}", translation=f"translation{i}")
+        db.add(word)
+        db.flush()
+        progress = WordProgress(user_id=user.id, word_id=word.id, pool=pool, is_in_review_phase=True)
+        db.add(progress)
+        rows.append(progress)
+    db.commit()
+    return rows
+
+
+def count_commits(db):
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+    return commits
+
+
+def test_completes_every_word_in_one_commit(db, user):
+    rows = add_progress(db, user, ["R1", "R2", "R3"])
+    commits = count_commits(db)
+    before = datetime.now(timezone.utc)
+
+    response = complete_review(
+        ReviewCompleteRequest(word_ids=[str(p.word_id) for p in rows], answers=[]),
+        current_user=user,
+        db=db,
+    )
+
+    assert response.words_completed == 3
+    assert len(commits) == 1
+    db.expire_all()
+    for progress in rows:
+        assert progress.pool.startswith("R")
+        assert not progress.is_in_review_phase
+        assert progress.review_completed_time >= before
+        assert progress.last_practice_time == progress.review_completed_time
+        assert progress.next_available_time > before + timedelta(hours=1)
+
+
+def test_nothing_is_written_when_a_word_is_not_in_review(db, user):
+    rows = add_progress(db, user, ["R1", "P2"])
+
+    with pytest.raises(HTTPException) as error:
+        complete_review(
+            ReviewCompleteRequest(word_ids=[str(p.word_id) for p in rows], answers=[]),
+            current_user=user,
+            db=db,
+        )
+    db.rollback()
+
+    assert error.value.status_code == 400
+    db.expire_all()
+    assert rows[0].is_in_review_phase
+    assert rows[0].review_completed_time is None
+
+
+def test_practice_updates_keep_review_completed_time(db, user):
+    (progress,) = add_progress(db, user, ["R1"])
+    completed = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    progress.review_completed_time = completed
+    db.commit()
+
+    ProgressRepository(db).bulk_update_progress([{
+        "id": progress.id,
+        "pool": "R2",
+        "last_practice_time": datetime.now(timezone.utc),
+        "next_available_time": datetime.now(timezone.utc) + timedelta(hours=1),
+        "is_in_review_phase": False,
+    }])
+    db.commit()
+
+    db.expire_all()
+    assert progress.pool == "R2"
+    assert progress.review_completed_time == completed
@@ -0,0 +1,126 @@
+"""
+Tests for the save/transcribe coordination in /api/speech/transcribe.
+
+Storage and recognition are stubbed on the speech_service instance. A
+failed save must cancel the transcription, and the save must not read
+from the request's UploadFile, which is closed when the request ends.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_speech_transcribe.py
+"""
+
+import asyncio
+import io
+import wave
+
+import pytest
+from starlette.datastructures import Headers, UploadFile
+
+from app.models import SpeechLog, Word
+from app.routers.speech import transcribe_speech
+from app.services.speech_service import speech_service
+
+
+def make_wav() -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\0\1" * 1600)
+    return output.getvalue()
+
+
+@pytest.fixture
+def word(db):
+    word = Word(word="hello", translation="hola")
+    db.add(word)
+    db.commit()
+    return word
+
+
+def upload(audio: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(audio),
+        size=len(audio),
+        filename="recording.wav",
+        headers=Headers({"content-type": "audio/wav"}),
+    )
+
+
+def transcribe(db, user, word, audio_file):
+    return transcribe_speech(
+        audio=audio_file,
+        word_id=str(word.id),
+        platform="web",
+        native_transcript=None,
+        current_user=user,
+        db=db,
+    )
+
+
+def test_failed_save_cancels_transcription(db, user, word, monkeypatch):
+    events = []
+
+    async def failing_save(audio_file, storage_path, content_type):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("bucket unavailable")
+
+    async def slow_transcribe(audio_data, extension):
+        events.append("started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        return "hello", None
+
+    monkeypatch.setattr(speech_service, "save_audio", failing_save)
+    monkeypatch.setattr(speech_service, "transcribe_audio", slow_transcribe)
+
+    async def run():
+        response = await transcribe(db, user, word, upload(make_wav()))
+        await asyncio.sleep(0)
+        return response
+
+    response = asyncio.run(run())
+
+    assert not response.success
+    assert response.error == "Failed to save audio: bucket unavailable"
+    assert events == ["started", "cancelled"]
+    assert db.query(SpeechLog).count() == 0
+
+
+def test_save_reads_its_own_copy_of_the_upload(db, user, word, monkeypatch):
+    audio = make_wav()
+    saved = {}
+
+    async def save(audio_file, storage_path, content_type):
+        saved["file"] = audio_file
+        return f"static/{storage_path}"
+
+    async def transcribe_ok(audio_data, extension):
+        return "hello", None
+
+    monkeypatch.setattr(speech_service, "save_audio", save)
+    monkeypatch.setattr(speech_service, "transcribe_audio", transcribe_ok)
+
+    async def run():
+        audio_file = upload(audio)
+        response = await transcribe(db, user, word, audio_file)
+        # The request is over: its UploadFile is closed
+        await audio_file.close()
+        assert saved["file"] is not audio_file.file
+        # A save thread still running after a timeout can read everything
+        assert saved["file"].read() == audio
+        return response
+
+    response = asyncio.run(run())
+
+    assert response.success
+    assert response.transcript == "hello"
+    log = db.query(SpeechLog).one()
+    assert log.cloud_transcript == "hello"
+    assert log.recording_path.startswith("static/")
@@ -0,0 +1,138 @@
+"""
+Tests for the float32 -> int16 WAV conversion in speech_service.
+
+The vectorized converter must produce byte-identical output to the
+per-sample loop it replaced (kept below as legacy_convert), and must locate
+chunks by walking the RIFF headers rather than searching for b'data'.
+
+Run:
+    python -m pytest tests/test_wav_conversion.py
+"""
+
+import io
+import math
+import struct
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.speech_service import (  # noqa: E402
+    convert_float32_to_int16,
+    find_riff_chunk,
+    get_wav_info,
+)
+
+
+def legacy_convert(audio_data: bytes, wav_info: dict) -> bytes:
+    """The struct-per-sample implementation, used as the reference output."""
+    data_start = audio_data.find(b'data')
+    if data_start == -1:
+        return audio_data
+    float_data = audio_data[data_start + 8:]
+    int16_samples = []
+    for i in range(len(float_data) // 4):
+        float_val = struct.unpack('<f', float_data[i*4:(i+1)*4])[0]
+        float_val = max(-1.0, min(1.0, float_val))
+        int16_samples.append(struct.pack('<h', int(float_val * 32767)))
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav_out:
+        wav_out.setnchannels(wav_info["channels"])
+        wav_out.setsampwidth(2)
+        wav_out.setframerate(wav_info["sample_rate"])
+        wav_out.writeframes(b''.join(int16_samples))
+    return output.getvalue()
+
+
+def chunk(chunk_id: bytes, body: bytes, size=None) -> bytes:
+    header = chunk_id + struct.pack('<I', len(body) if size is None else size)
+    return header + body + (b'\0' if len(body) % 2 else b'')
+
+
+def float_wav(samples: bytes, channels=1, sample_rate=16000, before=(), after=(), data_size=None) -> bytes:
+    fmt = struct.pack('<HHIIHHH', 3, channels, sample_rate, sample_rate * channels * 4, channels * 4, 32, 0)
+    chunks = [chunk(b'fmt ', fmt), *before, chunk(b'data', samples, data_size), *after]
+    body = b'WAVE' + b''.join(chunks)
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def edge_samples() -> bytes:
+    """Random samples plus every awkward value: NaN, infinities, -0.0, subnormals, ties."""
+    rng = np.random.default_rng(42)
+    values = np.concatenate([
+        rng.uniform(-1.5, 1.5, 20000),
+        rng.normal(0, 0.3, 20000),
+        [math.nan, math.inf, -math.inf, -0.0, 0.0, 1.0, -1.0, 1e-45, -1e-45, 3.4e38, -3.4e38],
+        # Values landing on and next to exact multiples of 1/32767
+        np.arange(-32767, 32768, 97) / 32767,
+        np.nextafter(np.arange(-32767, 32768, 97) / 32767, 2),
+        np.nextafter(np.arange(-32767, 32768, 97) / 32767, -2),
+    ]).astype('<f4')
+    # A NaN with a non-default payload
+    return values.tobytes() + struct.pack('<I', 0x7FC00123)
+
+
+def test_matches_legacy_output_mono_and_stereo():
+    samples = edge_samples()
+    for channels in (1, 2):
+        audio = float_wav(samples, channels=channels, sample_rate=48000)
+        info = get_wav_info(audio)
+        assert info == {"format": 3, "channels": channels, "sample_rate": 48000, "bits_per_sample": 32}
+        assert convert_float32_to_int16(audio, info) == legacy_convert(audio, info)
+
+
+def test_matches_legacy_output_with_partial_trailing_sample():
+    # Even length, so there is no RIFF pad byte for the legacy loop to read as data
+    audio = float_wav(edge_samples() + b'\x01\x02')
+    info = get_wav_info(audio)
+    assert convert_float32_to_int16(audio, info) == legacy_convert(audio, info)
+
+
+def test_nan_and_clamping():
+    values = np.array([math.nan, 2.0, -2.0, 0.99999, -0.99999, 0.5], dtype='<f4')
+    audio = float_wav(values.tobytes())
+    converted = convert_float32_to_int16(audio, get_wav_info(audio))
+    with wave.open(io.BytesIO(converted)) as wav_in:
+        pcm = np.frombuffer(wav_in.readframes(wav_in.getnframes()), dtype='<i2')
+    assert pcm.tolist() == [32767, 32767, -32767, 32766, -32766, 16383]
+
+
+def test_data_found_by_chunk_walking_not_byte_search():
+    samples = edge_samples()[:4000]
+    # A LIST chunk whose text contains b'data', before the real data chunk
+    decoy = chunk(b'LIST', b'INFOICMT' + struct.pack('<I', 12) + b'data: notes\0')
+    trailer = chunk(b'id3 ', b'\xff' * 33)
+    audio = float_wav(samples, before=[decoy], after=[trailer])
+    info = get_wav_info(audio)
+
+    expected = legacy_convert(float_wav(samples), info)
+    assert convert_float32_to_int16(audio, info) == expected
+    assert legacy_convert(audio, info) != expected
+
+
+def test_placeholder_data_size_reads_to_end_of_file():
+    samples = edge_samples()[:4000]
+    info = get_wav_info(float_wav(samples))
+    expected = legacy_convert(float_wav(samples), info)
+    for placeholder in (0, 0xFFFFFFFF):
+        audio = float_wav(samples, data_size=placeholder)
+        assert convert_float32_to_int16(audio, info) == expected
+
+
+def test_fmt_chunk_after_other_chunks():
+    junk = chunk(b'JUNK', b'\0' * 27)
+    fmt = struct.pack('<HHIIHHH', 3, 2, 22050, 22050 * 8, 8, 32, 0)
+    body = b'WAVE' + junk + chunk(b'fmt ', fmt) + chunk(b'data', b'\0' * 16)
+    audio = b'RIFF' + struct.pack('<I', len(body)) + body
+    assert get_wav_info(audio) == {"format": 3, "channels": 2, "sample_rate": 22050, "bits_per_sample": 32}
+    assert bytes(find_riff_chunk(audio, b'data')) == b'\0' * 16
+
+
+def test_non_wav_input_is_returned_unchanged():
+    assert get_wav_info(b'OggS' + b'\0' * 60) == {}
+    assert find_riff_chunk(b'RIFF\0\0\0\0WAVE', b'data') is None
+    audio = b'ID3' + b'\0' * 100
+    assert convert_float32_to_int16(audio, {"channels": 1, "sample_rate": 16000}) is audio
@@ -0,0 +1,111 @@
+"""
+Tests for the WordCatalog neighbour table and version fingerprint.
+
+Neighbours come from the word's own (level, category) first, topped up
+from its level, and never include the word itself. The version must change
+whenever a word's content does, so workers and clients notice edits.
+
+The last test needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_word_catalog.py
+"""
+
+import random
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models import Word  # noqa: E402
+from app.services.word_catalog import (  # noqa: E402
+    CatalogWord,
+    WordCatalog,
+    get_word_catalog,
+    invalidate_word_catalog,
+)
+from app.utils.constants import DISTRACTOR_NEIGHBOURS  # noqa: E402
+
+
+def catalog_words(buckets) -> tuple:
+    """buckets: [((level_id, category_id), count), ...]"""
+    words = []
+    for (level_id, category_id), count in buckets:
+        for _ in range(count):
+            i = len(words)
+            words.append(CatalogWord(uuid.uuid4(), f"word{i}", f"translation{i}", None, None, level_id, category_id))
+    return tuple(words)
+
+
+def test_neighbours_come_from_the_same_bucket():
+    random.seed(1)
+    catalog = WordCatalog(catalog_words([((1, 1), 40), ((1, 2), 40), ((2, 1), 40)]))
+
+    for i, word in enumerate(catalog):
+        neighbours = catalog.neighbours_of(i)
+        assert len(neighbours) == DISTRACTOR_NEIGHBOURS
+        assert len(set(neighbours)) == len(neighbours)
+        assert i not in neighbours
+        assert all(
+            (catalog[j].level_id, catalog[j].category_id) == (word.level_id, word.category_id)
+            for j in neighbours
+        )
+
+
+def test_small_bucket_is_topped_up_from_the_level():
+    random.seed(2)
+    catalog = WordCatalog(catalog_words([((1, 1), 3), ((1, 2), 30), ((2, 1), 30)]))
+
+    for i in range(3):
+        neighbours = catalog.neighbours_of(i)
+        assert len(set(neighbours)) == len(neighbours) == DISTRACTOR_NEIGHBOURS
+        assert i not in neighbours
+        # Both other words of the bucket, the rest from level 1 only
+        assert {j for j in range(3) if j != i} <= set(neighbours)
+        assert all(catalog[j].level_id == 1 for j in neighbours)
+
+
+def test_tiny_catalog_rows_are_padded():
+    catalog = WordCatalog(catalog_words([((1, 1), 2)]))
+
+    assert catalog.neighbours_of(0) == [1]
+    assert catalog.neighbours_of(1) == [0]
+    assert WordCatalog(catalog_words([((1, 1), 1)])).neighbours_of(0) == []
+
+
+def test_version_changes_when_a_word_is_edited():
+    words = catalog_words([((1, 1), 10)])
+    version = WordCatalog(words).version
+
+    assert WordCatalog(words).version == version
+    for field, value in [
+        ("word", "edited"),
+        ("translation", "edited"),
+        ("image_url", "/images/new.png"),
+        ("audio_url", "/audio/new.mp3"),
+        ("level_id", 2),
+        ("category_id", 2),
+    ]:
+        edited = words[:4] + (words[4]._replace(**{field: value}),) + words[5:]
+        assert WordCatalog(edited).version != version, field
+    assert WordCatalog(words[:-1]).version != version
+
+
+def test_version_changes_after_a_database_edit(db):
+    word = Word(word="cat", translation="gato")
+    db.add_all([word, Word(word="dog", translation="perro")])
+    db.commit()
+    invalidate_word_catalog()
+    try:
+        version = get_word_catalog(db).version
+
+        word.translation = "gata"
+        db.commit()
+        invalidate_word_catalog()
+
+        catalog = get_word_catalog(db)
+        assert catalog.version != version
+        assert catalog.get(word.id).translation == "gata"
+    finally:
+        invalidate_word_catalog()
@@ -0,0 +1,71 @@
+"""
+Tests for the /api/admin/words ETag catalog version.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_word_export.py
+"""
+
+from sqlalchemy import text
+
+from app.models import Word
+from app.repositories.word_repository import WordRepository
+from app.routers.admin import get_all_words
+
+
+def test_version_tracks_every_write_to_words(db):
+    repo = WordRepository(db)
+    versions = [repo.get_catalog_version()]
+
+    word = Word(word="apple", translation="蘋果", sentence="An apple.")
+    db.add_all([word, Word(word="banana", translation="香蕉")])
+    db.commit()
+    versions.append(repo.get_catalog_version())
+    assert repo.get_catalog_version() == versions[-1]
+
+    word.sentence_zh = "一個蘋果。"
+    db.commit()
+    versions.append(repo.get_catalog_version())
+
+    # Writes that bypass the repository move it too
+    db.execute(text("UPDATE words SET translation = 'manzana' WHERE word = 'apple'"))
+    db.commit()
+    versions.append(repo.get_catalog_version())
+
+    db.delete(word)
+    db.commit()
+    versions.append(repo.get_catalog_version())
+
+    repo.delete_all()
+    versions.append(repo.get_catalog_version())
+
+    assert versions == sorted(set(versions))
+
+
+def test_rotating_random_keys_keeps_the_version(db):
+    db.add(Word(word="apple", translation="蘋果"))
+    db.commit()
+    repo = WordRepository(db)
+    version = repo.get_catalog_version()
+
+    repo.rotate_random_keys(None, 100)
+
+    assert repo.get_catalog_version() == version
+
+
+def test_matching_if_none_match_returns_304(db):
+    db.add(Word(word="apple", translation="蘋果"))
+    db.commit()
+
+    response = get_all_words(export_format="json", if_none_match=None, db=db)
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    cached = get_all_words(export_format="json", if_none_match=etag, db=db)
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    db.add(Word(word="banana", translation="香蕉"))
+    db.commit()
+    assert get_all_words(export_format="json", if_none_match=etag, db=db).status_code == 200
@@ -0,0 +1,107 @@
+"""
+Tests for /api/home/word-pool keyset pagination.
+
+Needs TEST_DATABASE_URL (see conftest.py).
+
+Run:
+    python -m pytest tests/test_word_pool.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.models import Word, WordProgress
+from app.routers.home import get_word_pool
+from app.utils.constants import PoolType
+
+
+def add_pool_words(db, user, times):
+    """One P1 word per entry of times (None for a NULL next_available_time)."""
+    now = datetime.now(timezone.utc)
+    words = []
+    for i, hours in enumerate(times):
+        word = Word(word=f"word{i:02d}", translation=f"translation{i}")
+        db.add(word)
+        db.flush()
+        db.add(WordProgress(
+            user_id=user.id,
+            word_id=word.id,
+            pool="P1",
+            next_available_time=None if hours is None else now + timedelta(hours=hours),
+        ))
+        words.append(word)
+    db.commit()
+    return words
+
+
+def page_through(db, user, pool, limit):
+    pages = []
+    cursor = None
+    while True:
+        page = get_word_pool(pool=pool, limit=limit, cursor=cursor, current_user=user, db=db)
+        pages.append(page)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_pages_through_null_next_available_time(db, user):
+    # NULL times in the middle of the insert order and across page boundaries
+    add_pool_words(db, user, [3, None, 1, None, 2, None, 0])
+
+    pages = page_through(db, user, PoolType.P1, limit=2)
+    items = [item for page in pages for item in page.items]
+
+    assert len(pages) == 4
+    assert len(items) == 7
+    assert len({item.word_id for item in items}) == 7
+    # Timed rows first in time order, NULL rows last
+    assert [item.word for item in items[:4]] == ["word06", "word02", "word04", "word00"]
+    assert all(item.next_available_time is None for item in items[4:])
+
+
+def test_pages_through_only_null_times(db, user):
+    add_pool_words(db, user, [None] * 5)
+
+    items = [item for page in page_through(db, user, PoolType.P1, limit=2) for item in page.items]
+
+    assert sorted(item.word for item in items) == [f"word{i:02d}" for i in range(5)]
+
+
+def test_default_response_keeps_pools_shape(db, user):
+    add_pool_words(db, user, [1, None])
+    db.add(Word(word="unlearned", translation="x"))
+    db.commit()
+
+    response = get_word_pool(pool=None, limit=None, cursor=None, current_user=user, db=db)
+
+    assert response.total_count == 3
+    assert set(response.pools) == {p.value for p in PoolType}
+    assert [item.word for item in response.pools["P0"]] == ["unlearned"]
+    assert len(response.pools["P1"]) == 2
+
+
+def test_pages_through_equal_times_by_word_id(db, user):
+    words = add_pool_words(db, user, [None] * 6)
+    same_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    for progress in db.query(WordProgress).all():
+        progress.next_available_time = same_time
+    db.commit()
+
+    pages = page_through(db, user, PoolType.P1, limit=4)
+    items = [item for page in pages for item in page.items]
+
+    assert [item.word_id for item in items] == [str(w.id) for w in sorted(words, key=lambda w: w.id)]
+
+
+def test_p0_pages_skip_learned_words(db, user):
+    learned = add_pool_words(db, user, [1] * 3)
+    unlearned = [Word(word=f"new{i:02d}", translation="x") for i in range(7)]
+    db.add_all(unlearned)
+    db.commit()
+
+    pages = page_through(db, user, PoolType.P0, limit=3)
+    ids = [item.word_id for page in pages for item in page.items]
+
+    assert len(pages) == 3
+    assert ids == [str(w.id) for w in sorted(unlearned, key=lambda w: w.id)]
+    assert not {str(w.id) for w in learned} & set(ids)